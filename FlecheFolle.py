@@ -3,19 +3,53 @@
 Simulation du paradoxe de la flèche en vol de Zénon d'Élée
 """
 
-import time
 import math
 
-def simulation_fleche():
+from sorties import choisir_sortie
+
+def etapes_fleche(dt, position_cible=50.0, vitesse_fleche=25.0, instants_max=None,
+                  position_initiale=0.0):
+    """
+    Générateur des instants successifs du vol pour un intervalle dt,
+    sans affichage ni pause. instants_max limite le nombre d'instants produits.
+    """
+    position = position_initiale
+    temps = 0.0
+    instant = 0
+    
+    while position < position_cible and (instants_max is None or instant < instants_max):
+        # Calcul du déplacement pendant cet intervalle
+        deplacement = vitesse_fleche * dt
+        vitesse_moyenne = deplacement / dt if dt > 0 else 0
+        
+        yield {
+            'dt': dt,
+            'instant': instant,
+            'temps': temps,
+            'position': position,
+            'deplacement': deplacement,
+            'vitesse_moyenne': vitesse_moyenne,
+        }
+        
+        # Mise à jour pour l'instant suivant
+        position += deplacement
+        temps += dt
+        instant += 1
+
+def formater_ligne_fleche(etape):
+    """Ligne du tableau console pour un instant du vol"""
+    return (f"{etape['temps']:8.4f} | {etape['position']:10.4f} | "
+            f"{etape['deplacement']:12.6f} | {etape['vitesse_moyenne']:12.2f}")
+
+def simulation_fleche(position_cible=50.0, vitesse_fleche=25.0, pause=0.1):
     """
     Simule le vol de la flèche en analysant chaque instant.
     Paradoxe: à chaque instant, la flèche est immobile, donc le mouvement est impossible.
+    pause: délai entre deux lignes pour les gros intervalles (0 pour aucun)
+    Seuls les 20 premiers instants sont affichés; le temps simulé est celui
+    du vol complet (balayagefleche.vol_discretise).
     """
-    
-    # Paramètres initiaux
-    position_initiale = 0.0  # Position de départ de la flèche
-    position_cible = 50.0    # Position de la cible (50 mètres)
-    vitesse_fleche = 25.0    # Vitesse de la flèche (25 m/s)
+    from balayagefleche import vol_discretise
     
     # Intervalles de temps de plus en plus petits
     intervalles = [1.0, 0.5, 0.1, 0.01, 0.001, 0.0001]
@@ -30,28 +64,16 @@ def simulation_fleche():
         print(f"{'Instant':>8} | {'Position':>10} | {'Déplacement':>12} | {'Vitesse Moy':>12}")
         print("-" * 55)
         
-        position = position_initiale
-        temps = 0.0
-        instant = 0
+        etapes = list(etapes_fleche(dt, position_cible, vitesse_fleche, instants_max=20))
         
-        while position < position_cible and instant < 20:
-            # Calcul du déplacement pendant cet intervalle
-            deplacement = vitesse_fleche * dt
-            vitesse_moyenne = deplacement / dt if dt > 0 else 0
-            
-            print(f"{temps:8.4f} | {position:10.4f} | {deplacement:12.6f} | {vitesse_moyenne:12.2f}")
-            
-            # Mise à jour pour l'instant suivant
-            position += deplacement
-            temps += dt
-            instant += 1
-            
-            if dt >= 0.1:
-                time.sleep(0.1)  # Pause seulement pour les gros intervalles
+        # Pause seulement pour les gros intervalles
+        sortie = choisir_sortie(formater_ligne_fleche, pause if dt >= 0.1 else 0.0)
+        sortie.ecrire(etapes)
         
+        vol = vol_discretise(dt, position_cible, vitesse_fleche)
         temps_theorique = position_cible / vitesse_fleche
         print(f"\nTemps théorique pour atteindre la cible: {temps_theorique:.4f}s")
-        print(f"Temps simulé: {temps:.4f}s")
+        print(f"Temps simulé: {vol['temps']:.4f}s ({vol['instants']} instants)")
 
 def analyse_paradoxe():
     """
@@ -78,36 +100,80 @@ def analyse_paradoxe():
     print("   Vitesse:  v(t) = dx/dt = v₀")
     print("   La vitesse instantanée existe et est constante!")
 
-def simulation_calcul_differentiel():
+def simulation_calcul_differentiel(vitesse_fleche=25.0, non_lineaire=False):
     """
-    Démontre le concept de vitesse instantanée avec le calcul différentiel
+    Démontre le concept de vitesse instantanée avec le calcul différentiel.
+    non_lineaire: la vitesse oscille, x(t) = v₀·t + sin(2t), et la
+    différence avant s'effondre par annulation aux petits Δt.
     """
+    import time
+    
+    import numpy as np
+    
+    from derivation import METHODES, difference_avant, difference_centree, pas_complexe, pas_optimal
+    
     print("\n=== VITESSE INSTANTANÉE PAR CALCUL DIFFÉRENTIEL ===")
     
-    # Fonction position: x(t) = 25t (pour une vitesse de 25 m/s)
-    def position(t):
-        return 25 * t
+    # Fonction position et sa dérivée exacte
+    if non_lineaire:
+        def position(t):
+            return vitesse_fleche * t + np.sin(2 * t)
+        
+        def vitesse(t):
+            return vitesse_fleche + 2 * np.cos(2 * t)
+        
+        print(f"Position: x(t) = {vitesse_fleche}t + sin(2t)")
+    else:
+        def position(t):
+            return vitesse_fleche * t
+        
+        def vitesse(t):
+            return np.full_like(t, vitesse_fleche)
+        
+        print(f"Position: x(t) = {vitesse_fleche}t")
     
     # Calcul de la vitesse instantanée en approximant la dérivée
     t_fixe = 1.0  # Instant où nous calculons la vitesse
-    deltas = [1.0, 0.1, 0.01, 0.001, 0.0001, 0.00001]
+    deltas = np.array([1.0, 0.1, 0.01, 0.001, 0.0001, 0.00001, 1e-8, 1e-10, 1e-12])
+    limite = float(vitesse(np.array(t_fixe)))
     
-    print(f"\nCalcul de la vitesse instantanée à t = {t_fixe}s:")
-    print(f"{'Δt':>10} | {'Δx':>10} | {'Δx/Δt':>10} | {'Limite':>10}")
-    print("-" * 45)
+    print(f"\nCalcul de la vitesse instantanée à t = {t_fixe}s (limite {limite:.6f}):")
+    print(f"{'Δt':>10} | {'Δx/Δt':>12} | " + " | ".join(f"{nom + ' (err)':>16}" for nom in METHODES))
+    print("-" * (28 + 19 * len(METHODES)))
     
-    for delta_t in deltas:
-        x1 = position(t_fixe)
-        x2 = position(t_fixe + delta_t)
-        delta_x = x2 - x1
-        vitesse_approx = delta_x / delta_t
-        
-        print(f"{delta_t:10.5f} | {delta_x:10.5f} | {vitesse_approx:10.3f} | {'→ 25.000':>10}")
+    estimations = {}
+    for nom, methode in METHODES.items():
+        # Le pas complexe n'a pas d'annulation: un pas minuscule est toujours sûr
+        pas = np.full_like(deltas, 1e-20) if methode is pas_complexe else deltas
+        estimations[nom] = methode(position, t_fixe, pas)
+    
+    for i, delta_t in enumerate(deltas):
+        vitesse_approx = estimations['avant'][0][i]
+        erreurs = " | ".join(f"{abs(derivees[i] - limite):16.2e}" for derivees, _ in estimations.values())
+        print(f"{delta_t:10.0e} | {vitesse_approx:12.6f} | {erreurs}")
+    
+    # Vitesse sur des milliers d'instants d'un coup, avec estimation d'erreur
+    instants = np.linspace(0.0, 2.0, 10000)
+    debut = time.perf_counter()
+    derivees, erreurs = pas_complexe(position, instants)
+    duree = time.perf_counter() - debut
+    ecart = np.max(np.abs(derivees - vitesse(instants)))
+    
+    print(f"\n{instants.size} instants par pas complexe en {duree * 1000:.2f} ms: "
+          f"écart max {ecart:.1e}, erreur estimée max {np.max(erreurs):.1e}")
+    # Différences finies au meilleur pas possible: troncature et annulation équilibrées
+    for nom, methode, ordre in (("avant", difference_avant, 1), ("centrée", difference_centree, 2)):
+        pas = pas_optimal(instants, ordre)
+        derivees_finies, _ = methode(position, instants, pas)
+        print(f"Différence {nom} au pas optimal (Δt ≈ {np.max(pas):.0e}): "
+              f"écart max {np.max(np.abs(derivees_finies - vitesse(instants))):.1e}")
     
-    print("\nConclusion: Quand Δt → 0, Δx/Δt → 25 m/s")
-    print("La vitesse instantanée existe et vaut 25 m/s!")
+    print(f"\nConclusion: Quand Δt → 0, Δx/Δt → {limite:.3f} m/s")
+    print("...tant que Δt reste au-dessus de l'annulation numérique: le pas complexe l'évite.")
+    print("La vitesse instantanée existe!")
 
 if __name__ == "__main__":
     simulation_fleche()
     analyse_paradoxe()
-    simulation_calcul_differentiel()
\ No newline at end of file
+    simulation_calcul_differentiel()
+    simulation_calcul_differentiel(non_lineaire=True)
\ No newline at end of file
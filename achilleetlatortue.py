@@ -3,24 +3,52 @@
 Simulation du paradoxe d'Achille et la Tortue de Zénon d'Élée
 """
 
-import time
+from rattrapage import pas_rattrapage
+from sorties import choisir_sortie
 
-def simulation_achille_tortue():
+def etapes_achille_tortue(position_tortue=100.0, vitesse_achille=10.0, vitesse_tortue=1.0,
+                          dt=1.0, iterations_max=200, position_achille=0.0):
     """
-    Simule la course entre Achille et la tortue.
-    Achille court 10 fois plus vite que la tortue, mais la tortue a 100m d'avance.
+    Générateur des états successifs de la course, sans affichage ni pause.
+    Le dernier pas est raccourci pour s'arrêter à l'instant exact de la
+    rencontre, qui est le dernier état produit (ou celui atteint après
+    iterations_max pas).
     """
-    
-    # Paramètres initiaux
-    position_achille = 0.0  # Position de départ d'Achille (en mètres)
-    position_tortue = 100.0  # La tortue a 100m d'avance
-    vitesse_achille = 10.0   # Achille court à 10 m/s
-    vitesse_tortue = 1.0     # La tortue avance à 1 m/s
-    
     temps = 0.0
-    dt = 1.0  # Intervalle de temps (1 seconde)
     iteration = 0
     
+    while True:
+        yield {
+            'iteration': iteration,
+            'temps': temps,
+            'position_achille': position_achille,
+            'position_tortue': position_tortue,
+            'distance': position_tortue - position_achille,
+        }
+        
+        if position_achille >= position_tortue or iteration >= iterations_max:
+            return
+        
+        # Mise à jour des positions (arrêt exact à la rencontre)
+        position_achille, position_tortue, duree, _ = pas_rattrapage(
+            position_achille, position_tortue, vitesse_achille, vitesse_tortue, dt
+        )
+        temps += duree
+        iteration += 1
+
+def formater_ligne_achille(etape):
+    """Ligne du tableau console pour un état de la course"""
+    return (f"{etape['temps']:6.1f} | {etape['position_achille']:8.2f} | "
+            f"{etape['position_tortue']:8.2f} | {etape['distance']:9.2f}")
+
+def simulation_achille_tortue(position_tortue=100.0, vitesse_achille=10.0, vitesse_tortue=1.0,
+                              dt=1.0, pause=0.1):
+    """
+    Simule la course entre Achille et la tortue.
+    Achille court 10 fois plus vite que la tortue, mais la tortue a 100m d'avance.
+    pause: délai entre deux lignes (0 pour un affichage immédiat)
+    """
+    
     print("=== PARADOXE D'ACHILLE ET LA TORTUE ===")
     print(f"Achille (vitesse: {vitesse_achille} m/s) vs Tortue (vitesse: {vitesse_tortue} m/s)")
     print(f"La tortue a {position_tortue}m d'avance\n")
@@ -29,25 +57,14 @@ def simulation_achille_tortue():
     print("-" * 45)
     
     # Simulation jusqu'à ce qu'Achille dépasse la tortue
-    while position_achille < position_tortue and iteration < 200:
-        # Affichage des positions actuelles
-        distance_entre_eux = position_tortue - position_achille
-        print(f"{temps:6.1f} | {position_achille:8.2f} | {position_tortue:8.2f} | {distance_entre_eux:9.2f}")
-        
-        # Mise à jour des positions
-        position_achille += vitesse_achille * dt
-        position_tortue += vitesse_tortue * dt
-        temps += dt
-        iteration += 1
-        
-        # Petite pause pour la lisibilité
-        time.sleep(0.1)
+    etapes = list(etapes_achille_tortue(position_tortue, vitesse_achille, vitesse_tortue, dt))
+    final = etapes[-1]
+    choisir_sortie(formater_ligne_achille, pause).ecrire(etapes)
     
     print("-" * 45)
-    if position_achille >= position_tortue:
-        print(f"🏃‍♂️ Achille dépasse la tortue après {temps:.1f} secondes!")
-        print(f"Position finale d'Achille: {position_achille:.2f}m")
-        print(f"Position finale de la tortue: {position_tortue:.2f}m")
+    if final['position_achille'] >= final['position_tortue']:
+        print(f"🏃‍♂️ Achille rattrape la tortue après {final['temps']:.4f} secondes!")
+        print(f"Position de la rencontre: {final['position_achille']:.2f}m")
     else:
         print("Simulation interrompue après 200 itérations")
 
@@ -81,7 +98,44 @@ def analyse_mathematique():
         distance_parcourue += temps_etape * 10
         
         print(f"Étape {i+1}: +{temps_etape:.3f}s, total: {temps_total:.3f}s, position: {distance_parcourue:.3f}m")
+    
+    # Accélération de convergence de la série des durées de Zénon
+    from series import afficher_rapport, rapport_cout, termes_zenon_achille
+    afficher_rapport(rapport_cout(termes_zenon_achille(100.0, 10.0, 1.0), tolerance=1e-10, limite=100 / 9),
+                     "Termes nécessaires pour une précision de 1e-10 s")
+
+def simulation_profils(position_tortue=100.0, vitesse_achille=10.0, vitesse_tortue=1.0, dt_euler=1 / 60):
+    """
+    Courses à vitesses variables (départ en sprint, fatigue) intégrées par
+    Runge-Kutta adaptatif, comparées au nombre de pas d'Euler de durée dt_euler
+    """
+    import math
+    
+    from integrateur import course, profil_constant, profil_fatigue, profil_sprint
+    
+    profils = [
+        ("Vitesses constantes", profil_constant(vitesse_achille)),
+        ("Départ en sprint", profil_sprint(vitesse_achille, duree=2.0)),
+        ("Fatigue", profil_fatigue(3 * vitesse_achille, taux=0.05, vitesse_min=vitesse_tortue / 2)),
+    ]
+    
+    print("\n=== VITESSES VARIABLES (RUNGE-KUTTA ADAPTATIF) ===")
+    print(f"Tortue: {vitesse_tortue} m/s constants, {position_tortue}m d'avance")
+    print(f"{'Profil Achille':>20} | {'Rattrapage':>14} | {'Rencontre':>11} | {'Pas RK':>6} | "
+          f"{'Évaluations':>11} | {'Pas Euler':>9}")
+    print("-" * 90)
+    
+    for nom, profil in profils:
+        resultat = course(profil, profil_constant(vitesse_tortue), position_tortue)
+        if resultat['temps_rattrapage'] is None:
+            print(f"{nom:>20} | {'jamais':>14} | {'-':>11} | {resultat['pas']:6d} | "
+                  f"{resultat['evaluations']:11d} | {'-':>9}")
+            continue
+        pas_euler = math.ceil(resultat['temps_rattrapage'] / dt_euler)
+        print(f"{nom:>20} | {resultat['temps_rattrapage']:12.8f} s | {resultat['position_rencontre']:9.4f} m | "
+              f"{resultat['pas']:6d} | {resultat['evaluations']:11d} | {pas_euler:9d}")
 
 if __name__ == "__main__":
     simulation_achille_tortue()
-    analyse_mathematique()
\ No newline at end of file
+    analyse_mathematique()
+    simulation_profils()
\ No newline at end of file
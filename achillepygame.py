@@ -4,49 +4,36 @@ Version graphique avec Pygame du paradoxe d'Achille et la Tortue
 """
 
 import pygame
-import sys
 import math
 
-# Initialisation de Pygame
-pygame.init()
+from boucle import PAS_SIMULATION
+from noyau import BLANC, BLEU, GRIS, NOIR, ROUGE, VERT, SimulationPygame
+from rattrapage import pas_rattrapage
 
 # Constantes
 LARGEUR = 1200
 HAUTEUR = 600
-FPS = 60
 
-# Couleurs
-BLANC = (255, 255, 255)
-NOIR = (0, 0, 0)
-ROUGE = (255, 0, 0)
-VERT = (0, 255, 0)
-BLEU = (0, 0, 255)
-GRIS = (128, 128, 128)
-JAUNE = (255, 255, 0)
-
-class CourseAchilleTortue:
+class CourseAchilleTortue(SimulationPygame):
+    # État interpolé entre deux pas de physique pour l'affichage
+    ATTRIBUTS_INTERPOLES = ("position_achille", "position_tortue", "temps")
+    # ↑/↓: vitesse de simulation
+    VITESSE_MAX = 5.0
+    PAS_VITESSE = 0.5
+    
     def __init__(self):
-        self.ecran = pygame.display.set_mode((LARGEUR, HAUTEUR))
-        pygame.display.set_caption("Paradoxe d'Achille et la Tortue - Zénon d'Élée")
-        self.horloge = pygame.time.Clock()
-        
-        # Police pour le texte
-        self.font = pygame.font.Font(None, 24)
-        self.font_titre = pygame.font.Font(None, 36)
+        super().__init__("Paradoxe d'Achille et la Tortue - Zénon d'Élée", LARGEUR, HAUTEUR)
         
-        # Paramètres de simulation
+        # Paramètres de simulation (physique à pas fixe)
         self.reset_simulation()
         
-        # Interface
-        self.simulation_active = False
-        self.vitesse_simulation = 1.0
-        
     def reset_simulation(self):
         """Remet à zéro la simulation"""
+        self.boucle.oublier()
         self.position_achille = 0.0
         self.position_tortue = 700.0  # 200 pixels d'avance
-        self.vitesse_achille = 2.5    # 5 pixels par frame
-        self.vitesse_tortue = 0.5     # 0.5 pixels par frame
+        self.vitesse_achille = 150.0  # 150 pixels par seconde (2.5 par frame à 60 FPS)
+        self.vitesse_tortue = 30.0    # 30 pixels par seconde (0.5 par frame à 60 FPS)
         self.temps = 0.0
         self.historique_achille = []
         self.historique_tortue = []
@@ -113,8 +100,8 @@ class CourseAchilleTortue:
             f"Position Achille: {self.position_achille:.2f}m",
             f"Position Tortue: {self.position_tortue:.2f}m",
             f"Distance entre eux: {abs(self.position_tortue - self.position_achille):.2f}m",
-            f"Vitesse Achille: {self.vitesse_achille:.1f} m/s",
-            f"Vitesse Tortue: {self.vitesse_tortue:.1f} m/s",
+            f"Vitesse Achille: {self.vitesse_achille:.1f} px/s",
+            f"Vitesse Tortue: {self.vitesse_tortue:.1f} px/s",
         ]
         
         for i, info in enumerate(infos):
@@ -140,66 +127,28 @@ class CourseAchilleTortue:
             texte = self.font.render(controle, True, couleur)
             self.ecran.blit(texte, (10, HAUTEUR - 130 + i * 20))
     
-    def mettre_a_jour_simulation(self):
-        """Met à jour la simulation"""
+    def mettre_a_jour_simulation(self, pas=PAS_SIMULATION):
+        """Avance la simulation d'un pas de physique (pas en secondes réelles)"""
         if self.simulation_active and self.position_achille < self.position_tortue:
-            # Mise à jour des positions
-            self.position_achille += self.vitesse_achille * self.vitesse_simulation
-            self.position_tortue += self.vitesse_tortue * self.vitesse_simulation
-            self.temps += 0.016 * self.vitesse_simulation  # ~60 FPS
+            # Mise à jour des positions (arrêt exact à la rencontre)
+            self.position_achille, self.position_tortue, duree, rattrape = pas_rattrapage(
+                self.position_achille, self.position_tortue,
+                self.vitesse_achille, self.vitesse_tortue, pas * self.vitesse_simulation
+            )
+            self.temps += duree
             
             # Enregistrement de l'historique
-            if len(self.historique_achille) == 0 or len(self.historique_achille) % 5 == 0:
+            if rattrape or len(self.historique_achille) == 0 or len(self.historique_achille) % 5 == 0:
                 self.historique_achille.append(self.position_achille)
                 self.historique_tortue.append(self.position_tortue)
     
-    def gerer_evenements(self):
-        """Gère les événements utilisateur"""
-        for evenement in pygame.event.get():
-            if evenement.type == pygame.QUIT:
-                return False
-            
-            elif evenement.type == pygame.KEYDOWN:
-                if evenement.key == pygame.K_SPACE:
-                    self.simulation_active = not self.simulation_active
-                
-                elif evenement.key == pygame.K_r:
-                    self.reset_simulation()
-                    self.simulation_active = False
-                
-                elif evenement.key == pygame.K_UP:
-                    self.vitesse_simulation = min(5.0, self.vitesse_simulation + 0.5)
-                
-                elif evenement.key == pygame.K_DOWN:
-                    self.vitesse_simulation = max(0.1, self.vitesse_simulation - 0.5)
-                
-                elif evenement.key == pygame.K_q:
-                    return False
-        
-        return True
-    
-    def executer(self):
-        """Boucle principale du programme"""
-        en_cours = True
-        
-        while en_cours:
-            en_cours = self.gerer_evenements()
-            
-            # Mise à jour
-            self.mettre_a_jour_simulation()
-            
-            # Rendu
-            self.ecran.fill(BLANC)
-            self.dessiner_piste()
-            self.dessiner_trajectoires()
-            self.dessiner_coureurs()
-            self.dessiner_info()
-            
-            pygame.display.flip()
-            self.horloge.tick(FPS)
-        
-        pygame.quit()
-        sys.exit()
+    def dessiner(self):
+        """Dessine une image complète de la simulation"""
+        self.ecran.fill(BLANC)
+        self.dessiner_piste()
+        self.dessiner_trajectoires()
+        self.dessiner_coureurs()
+        self.dessiner_info()
 
 if __name__ == "__main__":
     jeu = CourseAchilleTortue()
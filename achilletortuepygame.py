@@ -5,131 +5,142 @@ Simulation interactive avec visualisation en temps réel
 """
 
 import pygame
-import sys
 import math
 import random
 
-# Initialisation de Pygame
-pygame.init()
+from boucle import PAS_SIMULATION
+from fondstatique import CoucheStatique
+from graphique import GraphiqueIncremental
+from historique import HistoriqueCirculaire
+from integrateur import RK45, profil_constant, profil_fatigue, profil_sprint
+from noyau import (BLANC, BLEU, GRIS, GRIS_CLAIR, JAUNE, NOIR, ROUGE, VERT, VIOLET,
+                   SimulationPygame, analyseur, preparer)
+from particules import SystemeParticules
+from rattrapage import pas_rattrapage
 
 # Constantes
 LARGEUR = 1400
 HAUTEUR = 800
-FPS = 60
 
-# Couleurs
-BLANC = (255, 255, 255)
-NOIR = (0, 0, 0)
-ROUGE = (255, 0, 0)
-VERT = (0, 255, 0)
-BLEU = (0, 0, 255)
-GRIS = (128, 128, 128)
-GRIS_CLAIR = (200, 200, 200)
-JAUNE = (255, 255, 0)
-ORANGE = (255, 165, 0)
-VIOLET = (128, 0, 128)
-
-class CourseAchilleTortue:
+class CourseAchilleTortue(SimulationPygame):
+    # État interpolé entre deux pas de physique pour l'affichage
+    ATTRIBUTS_INTERPOLES = ("position_achille", "position_tortue", "temps")
+    # État écrit à chaque pas par l'enregistreur et restauré en relecture
+    ATTRIBUTS_ENREGISTRES = ("temps", "position_achille", "position_tortue",
+                             "vitesse_achille", "vitesse_tortue")
+    
+    # ↑/↓: vitesse de simulation
+    VITESSE_MAX = 5.0
+    PAS_VITESSE = 0.5
+    
     def __init__(self):
-        self.ecran = pygame.display.set_mode((LARGEUR, HAUTEUR))
-        pygame.display.set_caption("🏃‍♂️ Paradoxe d'Achille et la Tortue - Zénon d'Élée")
-        self.horloge = pygame.time.Clock()
+        super().__init__("🏃‍♂️ Paradoxe d'Achille et la Tortue - Zénon d'Élée", LARGEUR, HAUTEUR,
+                         taille_police_petite=20)
         
-        # Polices
-        self.font_petit = pygame.font.Font(None, 20)
-        self.font = pygame.font.Font(None, 24)
-        self.font_titre = pygame.font.Font(None, 36)
-        self.font_grand = pygame.font.Font(None, 48)
+        # Couche statique de la piste
+        self.fond_piste = CoucheStatique(self.construire_piste)
         
-        # Paramètres de simulation
+        # Graphique de la distance, tracé au fur et à mesure
+        self.graphique_distance = GraphiqueIncremental(300, 200, "temps", "distance", BLEU)
+        
+        # Paramètres de simulation (physique à pas fixe)
         self.reset_simulation()
         
         # Interface
-        self.simulation_active = False
-        self.vitesse_simulation = 1.0
         self.mode_affichage = "normal"  # "normal", "zenon", "mathematique"
         self.afficher_trajectoires = True
         self.afficher_graphique = True
         
         # Animation
-        self.particules = []
+        self.particules = SystemeParticules(rayon_vie=3)
         self.etape_zenon = 0
         self.temps_etape_zenon = 0.0
         
     def reset_simulation(self):
-        """Remet à zéro la simulation"""
+        """Remet à zéro la simulation (en relecture: retour au début)"""
+        self.boucle.oublier()
+        self.arreter_enregistrement()
         self.position_achille = 0.0
         self.position_tortue = 300.0  # 300 pixels d'avance
         self.vitesse_achille = 100.0   # 100 pixels par seconde
         self.vitesse_tortue = 10.0     # 10 pixels par seconde
         self.temps = 0.0
-        self.historique_achille = []
-        self.historique_tortue = []
-        self.historique_temps = []
+        self.historique = HistoriqueCirculaire(("temps", "achille", "tortue", "distance"))
         self.course_terminee = False
-        self.particules = []
+        self.particules = SystemeParticules(rayon_vie=3)
         self.etape_zenon = 0
         self.temps_etape_zenon = 0.0
-        
+        self.integrateur = None  # Vitesses variables (touches 4 et 5)
+        self.nom_profil = None
+        
+        if self.relecture is not None:
+            self.relecture.chercher(self, self.relecture.debut)
+        
+    def choisir_profils(self, nom, profil_achille, profil_tortue):
+        """Vitesses variables v(t), t compté à partir de maintenant, intégrées par RK45"""
+        depart = self.temps
+        self.vitesses_profil = lambda t: (profil_achille(t - depart), profil_tortue(t - depart))
+        self.integrateur = RK45(lambda t, y: self.vitesses_profil(t), self.temps,
+                                (self.position_achille, self.position_tortue),
+                                rtol=1e-8, atol=1e-8, evenement=lambda t, y: y[1] - y[0])
+        self.nom_profil = nom
+        self.vitesse_achille, self.vitesse_tortue = self.vitesses_profil(self.temps)
+    
+    def choisir_vitesses(self, vitesse_achille, vitesse_tortue):
+        """Vitesses constantes (pas exact de rattrapage.pas_rattrapage)"""
+        self.integrateur = None
+        self.nom_profil = None
+        self.vitesse_achille = vitesse_achille
+        self.vitesse_tortue = vitesse_tortue
+    
     def ajouter_particule(self, x, y, couleur):
         """Ajoute une particule d'effet visuel"""
-        for i in range(5):
-            particule = {
-                'x': x + random.uniform(-10, 10),
-                'y': y + random.uniform(-10, 10),
-                'vx': random.uniform(-50, 50),
-                'vy': random.uniform(-50, 50),
-                'vie': 1.0,
-                'couleur': couleur
-            }
-            self.particules.append(particule)
+        self.particules.emettre(5, x, y, dispersion=(10, 10),
+                                vx=(-50, 50), vy=(-50, 50), couleurs=(couleur,))
     
     def mettre_a_jour_particules(self, dt):
         """Met à jour les particules d'effet"""
-        for particule in self.particules[:]:
-            particule['x'] += particule['vx'] * dt
-            particule['y'] += particule['vy'] * dt
-            particule['vie'] -= dt * 2
-            if particule['vie'] <= 0:
-                self.particules.remove(particule)
+        self.particules.mettre_a_jour(dt)
     
     def dessiner_particules(self):
         """Dessine les particules d'effet"""
-        for particule in self.particules:
-            alpha = int(particule['vie'] * 255)
-            couleur = particule['couleur']
-            rayon = int(particule['vie'] * 3)
-            if rayon > 0:
-                pygame.draw.circle(self.ecran, couleur, 
-                                 (int(particule['x']), int(particule['y'])), rayon)
+        self.particules.dessiner(self.ecran)
     
-    def dessiner_piste(self):
-        """Dessine la piste de course avec décorations"""
+    def construire_piste(self, surface):
+        """Dessine les éléments fixes de la piste (fond, lignes, marqueurs)"""
         y_piste = HAUTEUR // 2
+        surface.fill(BLANC)
         
         # Fond de piste
-        pygame.draw.rect(self.ecran, GRIS_CLAIR, (50, y_piste - 30, LARGEUR - 100, 60))
+        pygame.draw.rect(surface, GRIS_CLAIR, (50, y_piste - 30, LARGEUR - 100, 60))
         
         # Ligne centrale
-        pygame.draw.line(self.ecran, NOIR, (50, y_piste), (LARGEUR - 50, y_piste), 3)
+        pygame.draw.line(surface, NOIR, (50, y_piste), (LARGEUR - 50, y_piste), 3)
         
         # Lignes de délimitation
-        pygame.draw.line(self.ecran, NOIR, (50, y_piste - 30), (LARGEUR - 50, y_piste - 30), 2)
-        pygame.draw.line(self.ecran, NOIR, (50, y_piste + 30), (LARGEUR - 50, y_piste + 30), 2)
+        pygame.draw.line(surface, NOIR, (50, y_piste - 30), (LARGEUR - 50, y_piste - 30), 2)
+        pygame.draw.line(surface, NOIR, (50, y_piste + 30), (LARGEUR - 50, y_piste + 30), 2)
         
         # Marqueurs de distance tous les 100 pixels
         for i in range(0, LARGEUR - 100, 100):
             x = 50 + i
-            pygame.draw.line(self.ecran, GRIS, (x, y_piste - 35), (x, y_piste + 35), 2)
+            pygame.draw.line(surface, GRIS, (x, y_piste - 35), (x, y_piste + 35), 2)
             distance_m = i // 10  # Conversion pixels vers mètres (1m = 10px)
             texte = self.font_petit.render(f"{distance_m}m", True, GRIS)
-            self.ecran.blit(texte, (x - 10, y_piste + 40))
+            surface.blit(texte, (x - 10, y_piste + 40))
+    
+    def dessiner_piste(self):
+        """Dessine la piste de course avec décorations"""
+        y_piste = HAUTEUR // 2
+        
+        # Fond pré-rendu (reconstruit seulement si la fenêtre change)
+        self.fond_piste.blit(self.ecran)
         
         # Ligne d'arrivée (si Achille a rattrapé)
         if self.position_achille >= self.position_tortue:
             x_arrivee = 50 + self.position_achille
             pygame.draw.line(self.ecran, ROUGE, (x_arrivee, y_piste - 40), (x_arrivee, y_piste + 40), 3)
-            texte_arrivee = self.font.render("ARRIVÉE!", True, ROUGE)
+            texte_arrivee = self.textes.rendre(self.font, "ARRIVÉE!", ROUGE)
             self.ecran.blit(texte_arrivee, (x_arrivee - 30, y_piste - 60))
     
     def dessiner_coureurs(self):
@@ -151,8 +162,8 @@ class CourseAchilleTortue:
                            (x_achille + 5 - jambe_offset, y_piste + 10), 3)
             
             # Nom et vitesse
-            texte_achille = self.font.render(f"Achille", True, ROUGE)
-            vitesse_achille = self.font_petit.render(f"{self.vitesse_achille:.1f} px/s", True, ROUGE)
+            texte_achille = self.textes.rendre(self.font, f"Achille", ROUGE)
+            vitesse_achille = self.textes.rendre(self.font_petit, f"{self.vitesse_achille:.1f} px/s", ROUGE)
             self.ecran.blit(texte_achille, (x_achille - 30, y_piste - 55))
             self.ecran.blit(vitesse_achille, (x_achille - 35, y_piste - 75))
         
@@ -171,85 +182,59 @@ class CourseAchilleTortue:
                                (x_tortue + offset_x, patte_y), 2)
             
             # Nom et vitesse
-            texte_tortue = self.font.render("Tortue", True, VERT)
-            vitesse_tortue = self.font_petit.render(f"{self.vitesse_tortue:.1f} px/s", True, VERT)
+            texte_tortue = self.textes.rendre(self.font, "Tortue", VERT)
+            vitesse_tortue = self.textes.rendre(self.font_petit, f"{self.vitesse_tortue:.1f} px/s", VERT)
             self.ecran.blit(texte_tortue, (x_tortue - 25, y_piste - 55))
             self.ecran.blit(vitesse_tortue, (x_tortue - 30, y_piste - 75))
     
     def dessiner_trajectoires(self):
         """Dessine les trajectoires historiques"""
-        if not self.afficher_trajectoires or len(self.historique_achille) < 2:
+        if not self.afficher_trajectoires or len(self.historique) < 2:
             return
         
         y_traj_achille = 150
         y_traj_tortue = 200
         
-        # Trajectoire d'Achille (rouge)
-        points_achille = [(50 + pos, y_traj_achille) for pos in self.historique_achille]
-        if len(points_achille) > 1:
-            pygame.draw.lines(self.ecran, ROUGE, False, points_achille, 2)
+        # Trajectoire d'Achille (rouge): de la plus ancienne à la plus récente position
+        historique = self.historique
+        pygame.draw.line(self.ecran, ROUGE, (50 + historique.minimum("achille"), y_traj_achille),
+                         (50 + historique.maximum("achille"), y_traj_achille), 2)
         
         # Trajectoire de la tortue (verte)
-        points_tortue = [(50 + pos, y_traj_tortue) for pos in self.historique_tortue]
-        if len(points_tortue) > 1:
-            pygame.draw.lines(self.ecran, VERT, False, points_tortue, 2)
+        pygame.draw.line(self.ecran, VERT, (50 + historique.minimum("tortue"), y_traj_tortue),
+                         (50 + historique.maximum("tortue"), y_traj_tortue), 2)
         
         # Légendes
         pygame.draw.line(self.ecran, ROUGE, (60, y_traj_achille), (90, y_traj_achille), 3)
-        texte = self.font_petit.render("Trajectoire Achille", True, ROUGE)
+        texte = self.textes.rendre(self.font_petit, "Trajectoire Achille", ROUGE)
         self.ecran.blit(texte, (95, y_traj_achille - 8))
         
         pygame.draw.line(self.ecran, VERT, (60, y_traj_tortue), (90, y_traj_tortue), 3)
-        texte = self.font_petit.render("Trajectoire Tortue", True, VERT)
+        texte = self.textes.rendre(self.font_petit, "Trajectoire Tortue", VERT)
         self.ecran.blit(texte, (95, y_traj_tortue - 8))
     
     def dessiner_graphique_distance(self):
         """Dessine un graphique de l'évolution de la distance"""
-        if not self.afficher_graphique or len(self.historique_temps) < 2:
+        if not self.afficher_graphique or len(self.historique) < 2:
             return
         
         # Zone du graphique
         graph_x, graph_y = LARGEUR - 350, 100
         graph_w, graph_h = 300, 200
         
-        pygame.draw.rect(self.ecran, BLANC, (graph_x, graph_y, graph_w, graph_h))
-        pygame.draw.rect(self.ecran, NOIR, (graph_x, graph_y, graph_w, graph_h), 2)
+        # Courbe persistante: seuls les nouveaux points sont tracés
+        self.graphique_distance.mettre_a_jour(self.historique)
+        self.graphique_distance.blit(self.ecran, (graph_x, graph_y))
         
-        # Titre
-        titre = self.font.render("Distance entre Achille et la Tortue", True, NOIR)
+        # Titre et étiquettes
+        titre = self.textes.rendre(self.font, "Distance entre Achille et la Tortue", NOIR)
         self.ecran.blit(titre, (graph_x + 20, graph_y - 25))
         
-        # Données
-        if len(self.historique_achille) > 1:
-            distances = [abs(self.historique_tortue[i] - self.historique_achille[i]) 
-                        for i in range(len(self.historique_achille))]
-            
-            max_distance = max(distances) if distances else 1
-            max_temps = max(self.historique_temps) if self.historique_temps else 1
-            
-            # Points du graphique
-            points = []
-            for i, (temps, distance) in enumerate(zip(self.historique_temps, distances)):
-                x = graph_x + (temps / max_temps) * (graph_w - 20)
-                y = graph_y + graph_h - 20 - (distance / max_distance) * (graph_h - 40)
-                points.append((x, y))
-            
-            # Ligne du graphique
-            if len(points) > 1:
-                pygame.draw.lines(self.ecran, BLEU, False, points, 2)
-            
-            # Axes
-            pygame.draw.line(self.ecran, NOIR, (graph_x + 10, graph_y + graph_h - 10), 
-                           (graph_x + graph_w - 10, graph_y + graph_h - 10), 1)
-            pygame.draw.line(self.ecran, NOIR, (graph_x + 10, graph_y + 10), 
-                           (graph_x + 10, graph_y + graph_h - 10), 1)
-            
-            # Étiquettes
-            texte_x = self.font_petit.render("Temps (s)", True, NOIR)
-            self.ecran.blit(texte_x, (graph_x + graph_w//2 - 30, graph_y + graph_h + 5))
-            
-            texte_y = self.font_petit.render("Distance", True, NOIR)
-            self.ecran.blit(texte_y, (graph_x - 50, graph_y + graph_h//2))
+        texte_x = self.textes.rendre(self.font_petit, "Temps (s)", NOIR)
+        self.ecran.blit(texte_x, (graph_x + graph_w//2 - 30, graph_y + graph_h + 5))
+        
+        texte_y = self.textes.rendre(self.font_petit, "Distance", NOIR)
+        self.ecran.blit(texte_y, (graph_x - 50, graph_y + graph_h//2))
     
     def dessiner_analyse_zenon(self):
         """Dessine l'analyse selon l'approche de Zénon"""
@@ -259,7 +244,7 @@ class CourseAchilleTortue:
         y_start = 500
         
         # Titre de l'analyse
-        titre = self.font_titre.render("Analyse de Zénon : Étapes de Rattrapage", True, VIOLET)
+        titre = self.textes.rendre(self.font_titre, "Analyse de Zénon : Étapes de Rattrapage", VIOLET)
         self.ecran.blit(titre, (50, y_start))
         
         # Calcul des étapes de Zénon
@@ -279,7 +264,7 @@ class CourseAchilleTortue:
             
             for i, info in enumerate(infos_zenon):
                 if info:
-                    texte = self.font.render(info, True, VIOLET)
+                    texte = self.textes.rendre(self.font, info, VIOLET)
                     self.ecran.blit(texte, (50, y_start + 40 + i * 25))
     
     def dessiner_info(self):
@@ -287,7 +272,7 @@ class CourseAchilleTortue:
         y_info = 50
         
         # Titre principal
-        titre = self.font_grand.render("🏃‍♂️ Paradoxe d'Achille et la Tortue", True, NOIR)
+        titre = self.textes.rendre(self.font_grand, "🏃‍♂️ Paradoxe d'Achille et la Tortue", NOIR)
         self.ecran.blit(titre, (50, 10))
         
         # Informations actuelles
@@ -300,26 +285,36 @@ class CourseAchilleTortue:
         ]
         
         for i, info in enumerate(infos_gauche):
-            texte = self.font.render(info, True, NOIR)
+            texte = self.textes.rendre(self.font, info, NOIR)
             self.ecran.blit(texte, (50, y_info + i * 25))
         
         # Calculs mathématiques
-        infos_droite = [
-            "📊 Calculs Théoriques:",
-            f"Temps de rattrapage: {300/(self.vitesse_achille - self.vitesse_tortue):.3f}s",
-            f"Position de croisement: {300 * self.vitesse_achille/(self.vitesse_achille - self.vitesse_tortue):.1f}px",
-            f"Avance initiale: 300px (30m)",
-            f"Différence de vitesse: {self.vitesse_achille - self.vitesse_tortue:.1f}px/s"
-        ]
+        if self.integrateur is not None:
+            infos_droite = [
+                f"📊 Profil de vitesse: {self.nom_profil} (RK45 adaptatif)",
+                f"Vitesses: Achille {self.vitesse_achille:.1f}px/s, Tortue {self.vitesse_tortue:.1f}px/s",
+                f"Pas acceptés: {self.integrateur.pas_acceptes}, rejetés: {self.integrateur.pas_rejetes}",
+                f"Évaluations de v(t): {self.integrateur.evaluations}",
+                (f"Rencontre: t = {self.integrateur.t_evenement:.6f}s"
+                 if self.integrateur.t_evenement is not None else "Rencontre: pas encore"),
+            ]
+        else:
+            infos_droite = [
+                "📊 Calculs Théoriques:",
+                f"Temps de rattrapage: {300/(self.vitesse_achille - self.vitesse_tortue):.3f}s",
+                f"Position de croisement: {300 * self.vitesse_achille/(self.vitesse_achille - self.vitesse_tortue):.1f}px",
+                f"Avance initiale: 300px (30m)",
+                f"Différence de vitesse: {self.vitesse_achille - self.vitesse_tortue:.1f}px/s"
+            ]
         
         for i, info in enumerate(infos_droite):
             couleur = BLEU if i == 0 else NOIR
-            texte = self.font.render(info, True, couleur)
+            texte = self.textes.rendre(self.font, info, couleur)
             self.ecran.blit(texte, (700, y_info + i * 25))
         
         # État de la course
         if self.position_achille >= self.position_tortue and not self.course_terminee:
-            victoire = self.font_titre.render("🏆 Achille a dépassé la tortue !", True, ROUGE)
+            victoire = self.textes.rendre(self.font_titre, "🏆 Achille a dépassé la tortue !", ROUGE)
             self.ecran.blit(victoire, (50, y_info + len(infos_gauche) * 25 + 20))
             self.course_terminee = True
         
@@ -329,38 +324,65 @@ class CourseAchilleTortue:
             "🎮 CONTRÔLES:",
             "ESPACE: ▶️ Start/Pause    R: 🔄 Reset    M: 📊 Mode d'affichage",
             "↑/↓: ⚡ Vitesse simulation    T: 📈 Trajectoires    G: 📊 Graphique",
-            "1,2,3: 🎛️ Paramètres prédéfinis    Q: ❌ Quitter"
+            "1-5: 🎛️ Paramètres prédéfinis (4: sprint, 5: fatigue)    ←/→: ⏩ Relecture ±5s    F3: 📈 Profilage    Q: ❌ Quitter"
         ]
         
         for i, controle in enumerate(controles):
             couleur = BLEU if i == 0 else GRIS
             font_utilise = self.font if i == 0 else self.font_petit
-            texte = font_utilise.render(controle, True, couleur)
+            texte = self.textes.rendre(font_utilise, controle, couleur)
             self.ecran.blit(texte, (50, y_controles + i * 25))
         
         # Mode actuel
         mode_texte = f"Mode: {self.mode_affichage.title()}"
-        texte_mode = self.font.render(mode_texte, True, VIOLET)
+        texte_mode = self.textes.rendre(self.font, mode_texte, VIOLET)
         self.ecran.blit(texte_mode, (LARGEUR - 200, y_controles))
+        
+        # Tête de lecture
+        if self.relecture is not None:
+            lecture = f"⏯️ Relecture: {self.relecture.temps:.1f}/{self.relecture.fin:.1f}s"
+            texte_lecture = self.textes.rendre(self.font, lecture, VIOLET)
+            self.ecran.blit(texte_lecture, (LARGEUR - 250, y_controles + 25))
+    
+    def memoriser_historique(self, force=False):
+        """Ajoute l'état courant à l'historique, au plus tous les 0.1 s simulés"""
+        if (force or len(self.historique) == 0
+                or self.temps - self.historique.dernier("temps") >= 0.1):
+            self.historique.ajouter(self.temps, self.position_achille, self.position_tortue,
+                                    abs(self.position_tortue - self.position_achille))
     
-    def mettre_a_jour_simulation(self):
-        """Met à jour la simulation"""
+    def mettre_a_jour_simulation(self, pas=PAS_SIMULATION):
+        """Avance la simulation d'un pas de physique (pas en secondes réelles)"""
         if not self.simulation_active:
             return
         
-        dt = 1/60 * self.vitesse_simulation  # Delta temps
+        dt = pas * self.vitesse_simulation  # Delta temps simulé
+        
+        if self.relecture is not None:
+            # Relecture: l'état vient du fichier, rien n'est recalculé
+            self.relecture.avancer(self, dt)
+            self.memoriser_historique()
+            self.mettre_a_jour_particules(dt)
+            return
         
         if self.position_achille < self.position_tortue:
-            # Mise à jour des positions
-            self.position_achille += self.vitesse_achille * dt
-            self.position_tortue += self.vitesse_tortue * dt
-            self.temps += dt
+            if self.integrateur is not None:
+                # Vitesses variables: pas adaptatifs, les images entre deux pas sont interpolées
+                self.temps, positions, rattrape = self.integrateur.avancer_jusqu_a(self.temps + dt)
+                self.position_achille, self.position_tortue = map(float, positions)
+                if rattrape:
+                    self.position_achille = self.position_tortue
+                self.vitesse_achille, self.vitesse_tortue = self.vitesses_profil(self.temps)
+            else:
+                # Mise à jour des positions (arrêt exact à la rencontre)
+                self.position_achille, self.position_tortue, duree, rattrape = pas_rattrapage(
+                    self.position_achille, self.position_tortue,
+                    self.vitesse_achille, self.vitesse_tortue, dt
+                )
+                self.temps += duree
             
-            # Enregistrement de l'historique
-            if len(self.historique_achille) == 0 or self.temps - self.historique_temps[-1] >= 0.1:
-                self.historique_achille.append(self.position_achille)
-                self.historique_tortue.append(self.position_tortue)
-                self.historique_temps.append(self.temps)
+            # Enregistrement de l'historique (toujours au moment de la rencontre)
+            self.memoriser_historique(force=rattrape)
             
             # Effets spéciaux quand Achille se rapproche
             if abs(self.position_tortue - self.position_achille) < 50:
@@ -377,89 +399,65 @@ class CourseAchilleTortue:
             if self.temps_etape_zenon > 1.0:  # Nouvelle étape chaque seconde
                 self.etape_zenon += 1
                 self.temps_etape_zenon = 0.0
+        
+        if self.enregistreur is not None:
+            self.enregistreur.ajouter_etat(self)
     
-    def gerer_evenements(self):
-        """Gère les événements utilisateur"""
-        for evenement in pygame.event.get():
-            if evenement.type == pygame.QUIT:
-                return False
-            
-            elif evenement.type == pygame.KEYDOWN:
-                if evenement.key == pygame.K_SPACE:
-                    self.simulation_active = not self.simulation_active
-                
-                elif evenement.key == pygame.K_r:
-                    self.reset_simulation()
-                    self.simulation_active = False
-                
-                elif evenement.key == pygame.K_UP:
-                    self.vitesse_simulation = min(5.0, self.vitesse_simulation + 0.5)
-                
-                elif evenement.key == pygame.K_DOWN:
-                    self.vitesse_simulation = max(0.1, self.vitesse_simulation - 0.5)
-                
-                elif evenement.key == pygame.K_m:
-                    modes = ["normal", "zenon", "mathematique"]
-                    current_index = modes.index(self.mode_affichage)
-                    self.mode_affichage = modes[(current_index + 1) % len(modes)]
-                
-                elif evenement.key == pygame.K_t:
-                    self.afficher_trajectoires = not self.afficher_trajectoires
-                
-                elif evenement.key == pygame.K_g:
-                    self.afficher_graphique = not self.afficher_graphique
-                
-                elif evenement.key == pygame.K_1:
-                    # Paramètres classiques
-                    self.vitesse_achille = 100.0
-                    self.vitesse_tortue = 10.0
-                
-                elif evenement.key == pygame.K_2:
-                    # Course serrée
-                    self.vitesse_achille = 50.0
-                    self.vitesse_tortue = 45.0
-                
-                elif evenement.key == pygame.K_3:
-                    # Achille très rapide
-                    self.vitesse_achille = 200.0
-                    self.vitesse_tortue = 5.0
-                
-                elif evenement.key == pygame.K_q:
-                    return False
-        
-        return True
+    def gerer_touche(self, touche):
+        """Touches propres à la simulation (les autres: SimulationPygame)"""
+        if touche == pygame.K_m:
+            modes = ["normal", "zenon", "mathematique"]
+            current_index = modes.index(self.mode_affichage)
+            self.mode_affichage = modes[(current_index + 1) % len(modes)]
+        
+        elif touche == pygame.K_t:
+            self.afficher_trajectoires = not self.afficher_trajectoires
+        
+        elif touche == pygame.K_g:
+            self.afficher_graphique = not self.afficher_graphique
+        
+        elif touche == pygame.K_1:
+            # Paramètres classiques
+            self.choisir_vitesses(100.0, 10.0)
+        
+        elif touche == pygame.K_2:
+            # Course serrée
+            self.choisir_vitesses(50.0, 45.0)
+        
+        elif touche == pygame.K_3:
+            # Achille très rapide
+            self.choisir_vitesses(200.0, 5.0)
+        
+        elif touche == pygame.K_4:
+            # Achille part arrêté et accélère
+            self.choisir_profils("sprint", profil_sprint(150.0, duree=2.0), profil_constant(10.0))
+        
+        elif touche == pygame.K_5:
+            # Achille part vite puis se fatigue
+            self.choisir_profils("fatigue", profil_fatigue(120.0, taux=0.1, vitesse_min=5.0),
+                                 profil_constant(10.0))
+        
+        else:
+            super().gerer_touche(touche)
     
-    def executer(self):
-        """Boucle principale du programme"""
-        en_cours = True
+    def dessiner(self):
+        """Dessine une image complète de la simulation"""
+        # Rendu (la piste commence par le fond pré-rendu)
+        self.dessiner_piste()
         
-        while en_cours:
-            en_cours = self.gerer_evenements()
-            
-            # Mise à jour
-            self.mettre_a_jour_simulation()
-            
-            # Rendu
-            self.ecran.fill(BLANC)
-            self.dessiner_piste()
-            
-            if self.afficher_trajectoires:
-                self.dessiner_trajectoires()
-            
-            if self.afficher_graphique:
-                self.dessiner_graphique_distance()
-            
-            self.dessiner_coureurs()
-            self.dessiner_particules()
-            self.dessiner_analyse_zenon()
-            self.dessiner_info()
-            
-            pygame.display.flip()
-            self.horloge.tick(FPS)
+        if self.afficher_trajectoires:
+            self.dessiner_trajectoires()
         
-        pygame.quit()
-        sys.exit()
+        if self.afficher_graphique:
+            self.dessiner_graphique_distance()
+        
+        self.dessiner_coureurs()
+        self.dessiner_particules()
+        self.dessiner_analyse_zenon()
+        self.dessiner_info()
 
 if __name__ == "__main__":
-    jeu = CourseAchilleTortue()
-    jeu.executer()
\ No newline at end of file
+    args = analyseur("Paradoxe d'Achille et la Tortue").parse_args()
+    
+    jeu = preparer(CourseAchilleTortue(), args)
+    jeu.executer()
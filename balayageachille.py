@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Balayage vectorisé des paramètres du paradoxe d'Achille et la Tortue
+Calcule en un seul appel NumPy des millions de courses différentes
+"""
+
+import numpy as np
+
+
+def balayage_achille_tortue(vitesse_achille, vitesse_tortue, avance, dt, iterations_max=None):
+    """
+    Calcule le résultat de nombreuses courses en une seule fois.
+
+    Les quatre paramètres sont des scalaires ou des tableaux NumPy compatibles
+    par diffusion (broadcasting). Pour chaque combinaison on obtient ce que
+    donnerait la boucle pas à pas de simulation_achille_tortue, sans boucle Python.
+
+    Retourne un dictionnaire de tableaux:
+        'temps_rattrapage'  : instant exact de la rencontre (inf si jamais)
+        'position_rencontre': position exacte de la rencontre (inf si jamais)
+        'iterations'        : nombre de pas de durée dt avant le dépassement (-1 si jamais)
+        'temps_discret'     : instant où la boucle discrète détecte le dépassement
+        'depassement'       : avance d'Achille sur la tortue à ce moment (m)
+    """
+    vitesse_achille, vitesse_tortue, avance, dt = np.broadcast_arrays(
+        np.asarray(vitesse_achille, dtype=np.float64),
+        np.asarray(vitesse_tortue, dtype=np.float64),
+        np.asarray(avance, dtype=np.float64),
+        np.asarray(dt, dtype=np.float64),
+    )
+
+    difference = vitesse_achille - vitesse_tortue
+    rattrape = difference > 0
+    difference_sure = np.where(rattrape, difference, 1.0)
+
+    # Solution exacte: vitesse_achille * t = avance + vitesse_tortue * t
+    temps_rattrapage = np.where(rattrape, avance / difference_sure, np.inf)
+    position_rencontre = np.where(rattrape, vitesse_achille * temps_rattrapage, np.inf)
+
+    # Nombre de pas: plus petit n tel que n * dt * difference >= avance
+    gain_par_pas = difference_sure * dt
+    iterations = np.ceil(avance / gain_par_pas)
+    iterations = np.maximum(iterations, 0)
+    # Correction des arrondis quand avance est un multiple exact du gain
+    iterations -= ((iterations - 1) * gain_par_pas >= avance) & (iterations > 0)
+
+    if iterations_max is not None:
+        rattrape &= iterations <= iterations_max
+
+    temps_discret = np.where(rattrape, iterations * dt, np.inf)
+    depassement = np.where(rattrape, iterations * gain_par_pas - avance, np.nan)
+    iterations = np.where(rattrape, iterations, -1).astype(np.int64)
+
+    return {
+        'temps_rattrapage': temps_rattrapage,
+        'position_rencontre': position_rencontre,
+        'iterations': iterations,
+        'temps_discret': temps_discret,
+        'depassement': depassement,
+    }
+
+
+def afficher_table(resultats, vitesse_achille, vitesse_tortue, avance, dt, lignes_max=20):
+    """
+    Affiche les premières lignes d'un balayage sous forme de tableau
+    """
+    vitesse_achille, vitesse_tortue, avance, dt = (
+        np.broadcast_to(x, resultats['iterations'].shape).ravel()
+        for x in (vitesse_achille, vitesse_tortue, avance, dt)
+    )
+    colonnes = {nom: valeurs.ravel() for nom, valeurs in resultats.items()}
+
+    print(f"{'V.Achille':>9} | {'V.Tortue':>8} | {'Avance':>7} | {'dt':>6} | "
+          f"{'t exact':>9} | {'Rencontre':>9} | {'Pas':>5} | {'Dépassement':>11}")
+    print("-" * 90)
+
+    for i in range(min(lignes_max, len(vitesse_achille))):
+        print(f"{vitesse_achille[i]:9.2f} | {vitesse_tortue[i]:8.2f} | {avance[i]:7.1f} | {dt[i]:6.3f} | "
+              f"{colonnes['temps_rattrapage'][i]:9.3f} | {colonnes['position_rencontre'][i]:9.2f} | "
+              f"{colonnes['iterations'][i]:5d} | {colonnes['depassement'][i]:11.3f}")
+
+
+if __name__ == "__main__":
+    import time
+
+    print("=== BALAYAGE DES PARAMÈTRES D'ACHILLE ET LA TORTUE ===")
+
+    # Cas classique: 10 m/s contre 1 m/s, 100m d'avance, pas de 1 seconde
+    classique = balayage_achille_tortue(10.0, 1.0, 100.0, 1.0)
+    print(f"Cas classique: rencontre à t = {classique['temps_rattrapage']:.4f}s "
+          f"({classique['iterations']} pas, dépassement {classique['depassement']:.2f}m)\n")
+
+    # Grille de paramètres
+    vitesses_achille = np.linspace(2.0, 12.0, 100)[:, None, None, None]
+    vitesses_tortue = np.linspace(0.5, 3.0, 100)[None, :, None, None]
+    avances = np.linspace(10.0, 200.0, 20)[None, None, :, None]
+    pas = np.array([1.0, 0.5, 0.1, 0.01, 0.001])[None, None, None, :]
+
+    debut = time.perf_counter()
+    resultats = balayage_achille_tortue(vitesses_achille, vitesses_tortue, avances, pas)
+    duree = time.perf_counter() - debut
+
+    print(f"{resultats['iterations'].size} courses calculées en {duree * 1000:.1f} ms\n")
+    afficher_table(resultats, vitesses_achille, vitesses_tortue, avances, pas)
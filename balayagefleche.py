@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Balayage vectorisé des intervalles Δt du paradoxe de la flèche en vol
+Pour chaque Δt, le vol complet est calculé sans boucle Python par instant:
+forme fermée pour le nombre d'instants, et sommes cumulées NumPy par blocs
+pour refaire exactement les additions flottantes de la boucle pas à pas
+"""
+
+import math
+
+import numpy as np
+
+TAILLE_BLOC = 1 << 20       # Instants simulés par bloc (8 Mo par tableau)
+SIMULATION_MAX = 10**8      # Au-delà, forme fermée seulement
+
+
+def instants_exacts(dt, position_cible=50.0, vitesse_fleche=25.0):
+    """
+    Nombre d'instants du vol sans erreur d'accumulation (un seul produit
+    par Δt), pour un ou plusieurs Δt (scalaires ou tableaux NumPy
+    compatibles par diffusion).
+
+    Retourne un dictionnaire de tableaux:
+        'instants'       : plus petit n tel que n·(v·Δt) >= position_cible
+        'temps'          : durée du vol discrétisé, n·Δt
+        'erreur'         : écart à temps_theorique = position_cible / v
+        'erreur_relative': erreur / temps_theorique
+    """
+    dt, position_cible, vitesse_fleche = np.broadcast_arrays(
+        np.asarray(dt, dtype=np.float64),
+        np.asarray(position_cible, dtype=np.float64),
+        np.asarray(vitesse_fleche, dtype=np.float64),
+    )
+
+    deplacement = vitesse_fleche * dt
+    instants = np.maximum(np.ceil(position_cible / deplacement), 0)
+    # Corrections des arrondis de la division, dans les deux sens
+    instants -= ((instants - 1) * deplacement >= position_cible) & (instants > 0)
+    instants += instants * deplacement < position_cible
+
+    temps_theorique = position_cible / vitesse_fleche
+    temps = instants * dt
+    return {
+        'instants': instants.astype(np.int64),
+        'temps': temps,
+        'erreur': temps - temps_theorique,
+        'erreur_relative': (temps - temps_theorique) / temps_theorique,
+    }
+
+
+def vol_discretise(dt, position_cible=50.0, vitesse_fleche=25.0, taille_bloc=TAILLE_BLOC):
+    """
+    Vol complet tel que le calcule etapes_fleche (position += v·Δt et
+    temps += Δt en flottants), par blocs de taille_bloc instants: np.cumsum
+    additionne dans le même ordre que la boucle, les arrondis sont identiques
+    et la mémoire ne dépend pas du nombre d'instants.
+
+    Retourne un dictionnaire:
+        'instants'       : nombre d'instants avant d'atteindre la cible
+        'temps'          : temps accumulé à l'arrivée
+        'position'       : position accumulée à l'arrivée
+        'derive'         : écart de cette position à instants·v·Δt
+        'vitesse_moyenne', 'vitesse_min', 'vitesse_max', 'vitesse_ecart_type':
+                           statistiques des vitesses Δx/Δt réalisées instant par instant
+    """
+    deplacement = vitesse_fleche * dt
+    if not (math.isfinite(deplacement) and deplacement > 0):
+        raise ValueError(f"déplacement par instant non positif ou non fini: v·Δt = {deplacement}")
+    position, temps, instants = 0.0, 0.0, 0
+    moyenne, m2, vitesse_min, vitesse_max = 0.0, 0.0, math.inf, -math.inf
+
+    while position < position_cible:
+        pas = np.full(taille_bloc, deplacement)
+        pas[0] += position
+        positions = np.cumsum(pas)
+
+        atteinte = positions >= position_cible
+        premier = int(np.argmax(atteinte))
+        nombre = premier + 1 if atteinte[premier] else taille_bloc
+
+        # Vitesses réalisées, combinées bloc par bloc (moyenne et écart type de Chan)
+        vitesses = np.diff(positions[:nombre], prepend=position) / dt
+        moyenne_bloc = float(vitesses.mean())
+        m2_bloc = float(np.square(vitesses - moyenne_bloc).sum())
+        total = instants + nombre
+        ecart = moyenne_bloc - moyenne
+        moyenne += ecart * nombre / total
+        m2 += m2_bloc + ecart * ecart * instants * nombre / total
+        vitesse_min = min(vitesse_min, float(vitesses.min()))
+        vitesse_max = max(vitesse_max, float(vitesses.max()))
+
+        durees = np.full(nombre, dt)
+        durees[0] += temps
+        temps = float(np.cumsum(durees)[-1])
+        position = float(positions[nombre - 1])
+        instants = total
+
+    return {
+        'instants': instants,
+        'temps': temps,
+        'position': position,
+        'derive': position - instants * deplacement,
+        'vitesse_moyenne': moyenne if instants else math.nan,
+        'vitesse_min': vitesse_min if instants else math.nan,
+        'vitesse_max': vitesse_max if instants else math.nan,
+        'vitesse_ecart_type': math.sqrt(m2 / instants) if instants else math.nan,
+    }
+
+
+def verifier_balayage(dts, position_cible=50.0, vitesse_fleche=25.0):
+    """
+    Δt d'un balayage en tableau 1D; lève ValueError si un Δt, la cible ou la
+    vitesse n'est pas strictement positif et fini (le vol n'arriverait jamais)
+    """
+    dts = np.asarray(dts, dtype=np.float64).ravel()
+    for nom, valeurs in (("Δt", dts), ("cible", position_cible), ("vitesse", vitesse_fleche)):
+        valeurs = np.asarray(valeurs, dtype=np.float64)
+        if not (np.isfinite(valeurs).all() and (valeurs > 0).all()):
+            raise ValueError(f"{nom} doit être strictement positif et fini: {valeurs}")
+    return dts
+
+
+def balayage_fleche(dts, position_cible=50.0, vitesse_fleche=25.0, simulation_max=SIMULATION_MAX,
+                    taille_bloc=TAILLE_BLOC):
+    """
+    Générateur: une ligne (dictionnaire) par Δt, produite dès qu'elle est
+    calculée. Les colonnes de instants_exacts sont toujours présentes; celles
+    de vol_discretise (préfixe 'simule_' pour instants, temps et erreur) valent
+    -1 ou nan quand le vol dépasse simulation_max instants.
+    """
+    dts = verifier_balayage(dts, position_cible, vitesse_fleche)
+    exacts = instants_exacts(dts, position_cible, vitesse_fleche)
+    temps_theorique = position_cible / vitesse_fleche
+
+    for i, dt in enumerate(dts.tolist()):
+        ligne = {'dt': dt}
+        ligne.update((nom, valeurs[i].item()) for nom, valeurs in exacts.items())
+
+        if ligne['instants'] <= simulation_max:
+            vol = vol_discretise(dt, position_cible, vitesse_fleche, taille_bloc)
+            ligne.update({
+                'simule_instants': vol.pop('instants'),
+                'simule_temps': vol['temps'],
+                'simule_erreur': vol.pop('temps') - temps_theorique,
+            })
+            ligne.update(vol)
+        else:
+            ligne.update({'simule_instants': -1, 'simule_temps': math.nan, 'simule_erreur': math.nan,
+                          'position': math.nan, 'derive': math.nan, 'vitesse_moyenne': math.nan,
+                          'vitesse_min': math.nan, 'vitesse_max': math.nan, 'vitesse_ecart_type': math.nan})
+        yield ligne
+
+
+def collecter(lignes):
+    """Lignes d'un balayage en dictionnaire de tableaux NumPy (graphiques log-log)"""
+    lignes = list(lignes)
+    if not lignes:
+        return {}
+    return {nom: np.array([ligne[nom] for ligne in lignes]) for nom in lignes[0]}
+
+
+def formater_ligne_balayage(ligne):
+    """Ligne du tableau console d'un balayage"""
+    simule = f"{ligne['simule_instants']:>12d}" if ligne['simule_instants'] >= 0 else f"{'-':>12}"
+    return (f"{ligne['dt']:9.1e} | {ligne['instants']:>12d} | {ligne['erreur']:10.2e} | {simule} | "
+            f"{ligne['simule_erreur']:10.2e} | {ligne['derive']:10.2e} | {ligne['vitesse_min']:12.6f} | "
+            f"{ligne['vitesse_max']:12.6f} | {ligne['vitesse_ecart_type']:9.2e}")
+
+
+ENTETE_BALAYAGE = (f"{'Δt':>9} | {'Instants':>12} | {'Erreur':>10} | {'Simulés':>12} | {'Err. sim.':>10} | "
+                   f"{'Dérive':>10} | {'V min':>12} | {'V max':>12} | {'σ(V)':>9}")
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+    import time
+
+    from sorties import SortieCSV, SortieJSONL, SortieTamponnee
+
+    parser = argparse.ArgumentParser(description="Balayage des Δt du paradoxe de la flèche en vol")
+    parser.add_argument("--dt", type=float, nargs="+", help="intervalles (par défaut 1 à 1e-9, 2 par décade)")
+    parser.add_argument("--cible", type=float, default=50.0, help="distance de la cible (m)")
+    parser.add_argument("--vitesse", type=float, default=25.0, help="vitesse de la flèche (m/s)")
+    parser.add_argument("--simulation-max", type=int, default=SIMULATION_MAX,
+                        help="instants au-delà desquels seule la forme fermée est calculée")
+    parser.add_argument("--format", choices=("table", "csv", "jsonl"), default="table")
+    args = parser.parse_args()
+
+    dts = args.dt if args.dt else np.logspace(0, -9, 19)
+    try:
+        verifier_balayage(dts, args.cible, args.vitesse)
+    except ValueError as erreur:
+        parser.error(str(erreur))
+    lignes = balayage_fleche(dts, args.cible, args.vitesse, args.simulation_max)
+
+    # Une ligne écrite par Δt calculé: le tableau se remplit au fil du calcul
+    if args.format == "csv":
+        sortie = SortieCSV(taille_lot=1)
+    elif args.format == "jsonl":
+        sortie = SortieJSONL(taille_lot=1)
+    else:
+        print("=== BALAYAGE DES Δt DE LA FLÈCHE EN VOL ===")
+        print(f"Cible à {args.cible}m, flèche à {args.vitesse} m/s: "
+              f"temps théorique {args.cible / args.vitesse:.6f}s\n")
+        print(ENTETE_BALAYAGE)
+        print("-" * len(ENTETE_BALAYAGE))
+        sortie = SortieTamponnee(formater_ligne_balayage, taille_lot=1)
+
+    debut = time.perf_counter()
+    nombre = sortie.ecrire(lignes)
+    print(f"\n{nombre} intervalles calculés en {time.perf_counter() - debut:.2f}s", file=sys.stderr)
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Banc de mesure sans fenêtre des simulations Pygame
+Fait tourner chaque simulation sur des scénarios scriptés, horloge non bridée,
+et affiche la durée de chaque phase d'une image (p50/p95/p99)
+"""
+
+import argparse
+import os
+import time
+from collections import defaultdict
+
+# Pilote vidéo factice: doit être choisi avant l'initialisation de Pygame
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np
+import pygame
+
+from profilage import desinstrumenter, instrumenter
+
+
+def mesurer(simulation, frames, preparation=None):
+    """Fait tourner frames images de la simulation et retourne les mesures par phase"""
+    simulation.reset_simulation()
+    simulation.simulation_active = True
+    if preparation:
+        preparation(simulation)
+
+    mesures = defaultdict(list)
+    noms = instrumenter(simulation, lambda nom, debut, fin: mesures[nom].append(fin - debut))
+    for _ in range(frames):
+        debut = time.perf_counter()
+        simulation.gerer_evenements()
+        simulation.mettre_a_jour_simulation()
+        simulation.dessiner()
+
+        debut_affichage = time.perf_counter()
+        pygame.display.flip()
+        fin = time.perf_counter()
+
+        mesures["affichage"].append(fin - debut_affichage)
+        mesures["image"].append(fin - debut)
+
+    desinstrumenter(simulation, noms)
+    return mesures
+
+
+def percentiles(mesures):
+    """p50/p95/p99 en millisecondes pour chaque phase"""
+    return {nom: np.percentile(np.array(durees) * 1000, [50, 95, 99])
+            for nom, durees in mesures.items() if durees}
+
+
+def afficher_resultats(titre, mesures):
+    print(f"\n--- {titre} ---")
+    print(f"{'Phase':<32} | {'Appels':>6} | {'p50 (ms)':>9} | {'p95 (ms)':>9} | {'p99 (ms)':>9}")
+    print("-" * 78)
+    resultats = percentiles(mesures)
+    ordre = sorted(resultats, key=lambda nom: (nom == "image", nom))
+    for nom in ordre:
+        p50, p95, p99 = resultats[nom]
+        print(f"{nom:<32} | {len(mesures[nom]):6d} | {p50:9.3f} | {p95:9.3f} | {p99:9.3f}")
+
+
+def rafale_achille(simulation):
+    for _ in range(40):
+        simulation.ajouter_particule(50 + simulation.position_achille, simulation.ecran.get_height() // 2,
+                                     (255, 0, 0))
+
+
+def rafale_dichotomie(simulation):
+    for _ in range(20):
+        simulation.ajouter_particule_pierre(simulation.position_arbre, simulation.ecran.get_height() // 2 + 80)
+
+
+def scenarios_achille():
+    from achilletortuepygame import CourseAchilleTortue
+
+    def mode(nom):
+        def preparation(simulation):
+            simulation.mode_affichage = nom
+            simulation.vitesse_simulation = 5.0
+        return preparation
+
+    def rafale(simulation):
+        mode("zenon")(simulation)
+        rafale_achille(simulation)
+
+    return CourseAchilleTortue, [
+        ("normal, vitesse max", mode("normal")),
+        ("zenon, vitesse max", mode("zenon")),
+        ("mathematique, vitesse max", mode("mathematique")),
+        ("rafale de particules", rafale),
+    ]
+
+
+def scenarios_dichotomie():
+    from delesodomiepygae import DichotomieSimulation
+
+    def mode(nom):
+        def preparation(simulation):
+            simulation.mode_affichage = nom
+            simulation.vitesse_simulation = 3.0
+        return preparation
+
+    def rafale(simulation):
+        mode("normal")(simulation)
+        rafale_dichotomie(simulation)
+
+    return DichotomieSimulation, [
+        ("normal, vitesse max", mode("normal")),
+        ("zenon, vitesse max", mode("zenon")),
+        ("mathematique, vitesse max", mode("mathematique")),
+        ("energie, vitesse max", mode("energie")),
+        ("explosion de la pierre", rafale),
+    ]
+
+
+def scenarios_fleche():
+    from flechefollepygame import FlecheVolSimulation
+
+    def mode(nom):
+        def preparation(simulation):
+            simulation.mode_analyse = nom
+            simulation.vitesse_simulation = 3.0
+            simulation.incertitude_active = True
+        return preparation
+
+    return FlecheVolSimulation, [
+        ("continu, vitesse max", mode("continu")),
+        ("instants, vitesse max", mode("instants")),
+        ("derivee, vitesse max", mode("derivee")),
+        ("quantique, vitesse max", mode("quantique")),
+    ]
+
+
+def scenarios_foule():
+    from foulepygame import SimulationFoule
+
+    def foule(poursuivants, meneurs, echelle):
+        def preparation(simulation):
+            simulation.nouvelle_foule(poursuivants, meneurs, graine=0)
+            simulation.simulation_active = True
+            simulation.echelle = echelle
+            simulation.vitesse_simulation = 5.0
+        return preparation
+
+    return SimulationFoule, [
+        ("10^4 Achilles, 10^3 tortues", foule(10_000, 1_000, 1.0)),
+        ("10^5 Achilles, 10^4 tortues", foule(100_000, 10_000, 1.0)),
+        ("10^5 Achilles, 10^5 tortues, zoom 4x", foule(100_000, 100_000, 4.0)),
+    ]
+
+
+SIMULATIONS = {
+    "achille": scenarios_achille,
+    "dichotomie": scenarios_dichotomie,
+    "fleche": scenarios_fleche,
+    "foule": scenarios_foule,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Banc de mesure des simulations Pygame")
+    parser.add_argument("simulations", nargs="*", metavar="simulation",
+                        help=f"simulations à mesurer parmi {', '.join(SIMULATIONS)} (toutes par défaut)")
+    parser.add_argument("-n", "--frames", type=int, default=600,
+                        help="nombre d'images par scénario")
+    args = parser.parse_args()
+
+    inconnues = set(args.simulations) - set(SIMULATIONS)
+    if inconnues:
+        parser.error(f"simulation inconnue: {', '.join(sorted(inconnues))}")
+
+    for nom in args.simulations or SIMULATIONS:
+        classe, scenarios = SIMULATIONS[nom]()
+        simulation = classe()
+        print(f"\n=== {classe.__name__} ({args.frames} images par scénario) ===")
+        for titre, preparation in scenarios:
+            afficher_resultats(titre, mesurer(simulation, args.frames, preparation))
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Boucle à pas fixe pour les simulations Pygame
+La physique avance par pas de durée constante quel que soit le nombre
+d'images par seconde; l'affichage interpole entre les deux derniers états
+"""
+
+from contextlib import contextmanager
+
+PAS_SIMULATION = 1 / 60  # Durée d'un pas de physique (secondes)
+
+
+class BoucleFixe:
+    """
+    Accumulateur de temps réel converti en pas de physique de durée pas.
+    pas_max limite le nombre de pas par image: au-delà, le retard est
+    abandonné plutôt que de ralentir encore l'affichage.
+    """
+
+    def __init__(self, pas=PAS_SIMULATION, pas_max=8):
+        self.pas = pas
+        self.pas_max = pas_max
+        self.accumulateur = 0.0
+        self.precedent = None
+        self.pas_abandonnes = 0
+
+    def avancer(self, duree_reelle):
+        """Ajoute le temps réel écoulé et retourne le nombre de pas à exécuter"""
+        self.accumulateur += duree_reelle
+        nombre = int(self.accumulateur // self.pas)
+        if nombre > self.pas_max:
+            self.pas_abandonnes += nombre - self.pas_max
+            self.accumulateur -= (nombre - self.pas_max) * self.pas
+            nombre = self.pas_max
+        self.accumulateur -= nombre * self.pas
+        return nombre
+
+    @property
+    def alpha(self):
+        """Fraction du pas suivant déjà écoulée (entre 0 et 1)"""
+        return min(1.0, self.accumulateur / self.pas)
+
+    def memoriser(self, objet, attributs):
+        """Mémorise l'état avant un pas de physique"""
+        self.precedent = {nom: getattr(objet, nom) for nom in attributs}
+
+    def oublier(self):
+        """Oublie l'état mémorisé (après un reset, rien à interpoler)"""
+        self.precedent = None
+
+    @contextmanager
+    def interpoler(self, objet, attributs):
+        """Place temporairement l'objet dans l'état interpolé le temps du dessin"""
+        if self.precedent is None:
+            yield
+            return
+
+        actuels = {nom: getattr(objet, nom) for nom in attributs}
+        alpha = self.alpha
+        for nom in attributs:
+            precedent = self.precedent.get(nom, actuels[nom])
+            setattr(objet, nom, precedent + (actuels[nom] - precedent) * alpha)
+        try:
+            yield
+        finally:
+            for nom, valeur in actuels.items():
+                setattr(objet, nom, valeur)
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Cache des textes rendus par Pygame
+Un texte déjà rendu (même police, même chaîne, même couleur) coûte un seul blit
+"""
+
+from collections import OrderedDict
+
+
+class CacheTexte:
+    """Surfaces de texte rendues, avec éviction LRU au-delà de capacite"""
+
+    def __init__(self, capacite=512):
+        self.capacite = capacite
+        self.surfaces = OrderedDict()
+        self.succes = 0
+        self.echecs = 0
+
+    def __len__(self):
+        return len(self.surfaces)
+
+    def rendre(self, font, texte, couleur):
+        """Surface du texte (antialiasé), rendue seulement si absente du cache"""
+        cle = (font, texte, couleur)
+        surface = self.surfaces.get(cle)
+
+        if surface is not None:
+            self.surfaces.move_to_end(cle)
+            self.succes += 1
+            return surface
+
+        self.echecs += 1
+        surface = font.render(texte, True, couleur)
+        self.surfaces[cle] = surface
+        if len(self.surfaces) > self.capacite:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def vider(self):
+        """Oublie toutes les surfaces (par exemple après un changement de police)"""
+        self.surfaces.clear()
@@ -5,77 +5,79 @@ Simulation interactive de la pierre qui doit atteindre l'arbre
 """
 
 import pygame
-import sys
 import math
-import random
 
-# Initialisation de Pygame
-pygame.init()
+from boucle import PAS_SIMULATION
+from dichotomieexacte import DichotomieExacte, notation_scientifique
+from fondstatique import CoucheStatique
+from historique import HistoriqueCirculaire
+from noyau import (BLANC, BLEU, GRIS, GRIS_CLAIR, JAUNE, MARRON, NOIR, ORANGE, ROUGE, VERT,
+                   VERT_FONCE, VIOLET, SimulationPygame, analyseur, preparer)
+from particules import SystemeParticules
 
 # Constantes
 LARGEUR = 1400
 HAUTEUR = 900
-FPS = 60
 
-# Couleurs
-BLANC = (255, 255, 255)
-NOIR = (0, 0, 0)
-ROUGE = (255, 0, 0)
-VERT = (0, 255, 0)
-BLEU = (0, 0, 255)
-GRIS = (128, 128, 128)
-GRIS_CLAIR = (200, 200, 200)
-JAUNE = (255, 255, 0)
-ORANGE = (255, 165, 0)
-VIOLET = (128, 0, 128)
-MARRON = (139, 69, 19)
-VERT_FONCE = (0, 100, 0)
+# Zoom profond
+ETAPES_PAR_SECONDE_ZOOM = 2.0  # Moitiés du reste parcourues par seconde simulée
+LARGEUR_ZOOM = 1200            # Pixels entre le bord gauche de la vue et l'arbre
+LARGEUR_ETIQUETTE = 70         # Largeur minimale d'une barre étiquetée (pixels)
+DECALAGE_ZOOM_MAX = 10         # Moitiés de zoom au-delà de la pierre (PgUp)
 
-class DichotomieSimulation:
+class DichotomieSimulation(SimulationPygame):
+    # État interpolé entre deux pas de physique pour l'affichage
+    ATTRIBUTS_INTERPOLES = ("temps", "profondeur_pierre")
+    # État écrit à chaque pas par l'enregistreur et restauré en relecture
+    ATTRIBUTS_ENREGISTRES = ("temps", "position_pierre", "etape_actuelle", "lancement_termine",
+                             "zoom_profond", "decalage_zoom", "profondeur_pierre")
+    
     def __init__(self):
-        self.ecran = pygame.display.set_mode((LARGEUR, HAUTEUR))
-        pygame.display.set_caption("🌳 Paradoxe de la Dichotomie - Zénon d'Élée")
-        self.horloge = pygame.time.Clock()
+        super().__init__("🌳 Paradoxe de la Dichotomie - Zénon d'Élée", LARGEUR, HAUTEUR)
         
-        # Polices
-        self.font_petit = pygame.font.Font(None, 18)
-        self.font = pygame.font.Font(None, 24)
-        self.font_titre = pygame.font.Font(None, 36)
-        self.font_grand = pygame.font.Font(None, 48)
+        # Couche statique de la scène
+        self.fond_scene = CoucheStatique(self.construire_scene)
         
-        # Paramètres de simulation
+        # Paramètres de simulation (physique à pas fixe)
         self.reset_simulation()
         
         # Interface
-        self.simulation_active = False
-        self.vitesse_simulation = 1.0
         self.mode_affichage = "normal"  # "normal", "zenon", "mathematique", "energie"
         self.afficher_etapes = True
         self.afficher_serie = True
         self.animation_automatique = True
+        self.zoom_profond = False
+        self.decalage_zoom = 0  # Moitiés de zoom ajoutées à celui qui suit la pierre
+        
+        # Étape à laquelle la dichotomie en float64 cesse d'avancer
+        self.stagnation_flottants = self.dichotomie.divergence(float)['stagnation']
         
         # Effets visuels
-        self.particules_pierre = []
+        self.particules_pierre = SystemeParticules(gravite=100, perte_vie=1.5,
+                                                   decroissance_taille=0.98)
         self.trail_pierre = []
         self.etapes_zenon = []
         
     def reset_simulation(self):
-        """Remet à zéro la simulation"""
+        """Remet à zéro la simulation (en relecture: retour au début)"""
+        self.boucle.oublier()
+        self.arreter_enregistrement()
         self.position_zeno = 100.0  # Position de Zénon
         self.position_pierre = 100.0  # Position de la pierre (commence avec Zénon)
         self.position_arbre = 900.0   # Position de l'arbre (800 pixels = 8 mètres)
         self.distance_totale = self.position_arbre - self.position_zeno
+        self.dichotomie = DichotomieExacte(self.distance_totale / 100)  # En mètres
         
         self.etape_actuelle = 0
+        self.profondeur_pierre = 0.0  # Moitiés parcourues dans le zoom profond
         self.distance_a_parcourir = 0.0
         self.temps = 0.0
-        self.historique_positions = []
-        self.historique_distances = []
-        self.historique_temps = []
+        self.historique = HistoriqueCirculaire(("temps", "position", "distance"))
         self.lancement_termine = False
         
         # Animation
-        self.particules_pierre = []
+        self.particules_pierre = SystemeParticules(gravite=100, perte_vie=1.5,
+                                                   decroissance_taille=0.98)
         self.trail_pierre = []
         self.etapes_zenon = []
         self.temps_etape = 0.0
@@ -85,91 +87,83 @@ class DichotomieSimulation:
         self.serie_termes = []
         self.somme_partielle = 0.0
         
+        if self.relecture is not None:
+            self.relecture.chercher(self, self.relecture.debut)
+        
     def ajouter_particule_pierre(self, x, y):
         """Ajoute des particules d'effet pour la pierre"""
-        for i in range(8):
-            particule = {
-                'x': x + random.uniform(-8, 8),
-                'y': y + random.uniform(-8, 8),
-                'vx': random.uniform(-30, 30),
-                'vy': random.uniform(-30, 30),
-                'vie': 1.0,
-                'taille': random.uniform(2, 5),
-                'couleur': random.choice([GRIS, GRIS_CLAIR, NOIR])
-            }
-            self.particules_pierre.append(particule)
+        self.particules_pierre.emettre(8, x, y, dispersion=(8, 8), vx=(-30, 30), vy=(-30, 30),
+                                       taille=(2, 5), couleurs=(GRIS, GRIS_CLAIR, NOIR))
     
     def mettre_a_jour_particules(self, dt):
         """Met à jour les particules d'effet"""
-        for particule in self.particules_pierre[:]:
-            particule['x'] += particule['vx'] * dt
-            particule['y'] += particule['vy'] * dt
-            particule['vy'] += 100 * dt  # Gravité
-            particule['vie'] -= dt * 1.5
-            particule['taille'] *= 0.98
-            if particule['vie'] <= 0:
-                self.particules_pierre.remove(particule)
+        self.particules_pierre.mettre_a_jour(dt)
     
     def dessiner_particules(self):
         """Dessine les particules d'effet"""
-        for particule in self.particules_pierre:
-            alpha = int(particule['vie'] * 255)
-            couleur = particule['couleur']
-            rayon = max(1, int(particule['taille']))
-            pygame.draw.circle(self.ecran, couleur, 
-                             (int(particule['x']), int(particule['y'])), rayon)
+        self.particules_pierre.dessiner(self.ecran)
     
-    def dessiner_scene(self):
-        """Dessine la scène avec Zénon, l'arbre et l'environnement"""
+    def construire_scene(self, surface):
+        """Dessine les éléments fixes de la scène (ciel, sol, Zénon, arbre, marqueurs)"""
         y_sol = HAUTEUR // 2 + 100
+        surface.fill((135, 206, 235))  # Bleu ciel
         
         # Sol/herbe
-        pygame.draw.rect(self.ecran, VERT, (0, y_sol, LARGEUR, HAUTEUR - y_sol))
+        pygame.draw.rect(surface, VERT, (0, y_sol, LARGEUR, HAUTEUR - y_sol))
         
         # Ligne de lancement
-        pygame.draw.line(self.ecran, GRIS_CLAIR, 
+        pygame.draw.line(surface, GRIS_CLAIR, 
                         (self.position_zeno, y_sol), 
                         (self.position_arbre, y_sol), 2)
         
         # Zénon (philosophe avec toge)
         x_zeno = self.position_zeno
         # Corps (rectangle beige/blanc)
-        pygame.draw.rect(self.ecran, BLANC, (x_zeno - 15, y_sol - 50, 30, 50))
+        pygame.draw.rect(surface, BLANC, (x_zeno - 15, y_sol - 50, 30, 50))
         # Tête
-        pygame.draw.circle(self.ecran, (255, 220, 177), (int(x_zeno), y_sol - 65), 12)
-        # Bras tenant la pierre (si pas encore lancée)
-        if self.etape_actuelle == 0:
-            pygame.draw.line(self.ecran, (255, 220, 177), 
-                           (x_zeno + 10, y_sol - 40), (x_zeno + 25, y_sol - 30), 3)
+        pygame.draw.circle(surface, (255, 220, 177), (int(x_zeno), y_sol - 65), 12)
         
         # Texte "Zénon"
         texte_zeno = self.font.render("Zénon d'Élée", True, NOIR)
-        self.ecran.blit(texte_zeno, (x_zeno - 40, y_sol - 90))
+        surface.blit(texte_zeno, (x_zeno - 40, y_sol - 90))
         
         # Arbre (tronc + feuillage)
         x_arbre = self.position_arbre
         # Tronc
-        pygame.draw.rect(self.ecran, MARRON, (x_arbre - 15, y_sol - 80, 30, 80))
+        pygame.draw.rect(surface, MARRON, (x_arbre - 15, y_sol - 80, 30, 80))
         # Feuillage (plusieurs cercles verts)
         for i, (offset_x, offset_y, rayon) in enumerate([
             (-10, -70, 25), (10, -75, 20), (0, -90, 30)
         ]):
-            pygame.draw.circle(self.ecran, VERT_FONCE, 
+            pygame.draw.circle(surface, VERT_FONCE, 
                              (int(x_arbre + offset_x), y_sol + offset_y), rayon)
         
         # Texte "Arbre"
         texte_arbre = self.font.render("Arbre", True, VERT_FONCE)
-        self.ecran.blit(texte_arbre, (x_arbre - 20, y_sol - 120))
+        surface.blit(texte_arbre, (x_arbre - 20, y_sol - 120))
         
         # Marqueurs de distance
         distance_totale_m = self.distance_totale / 100  # Conversion pixels -> mètres
         for i in range(int(distance_totale_m) + 1):
             x_marqueur = self.position_zeno + (i * 100)  # Tous les mètres
             if x_marqueur <= self.position_arbre:
-                pygame.draw.line(self.ecran, GRIS, 
+                pygame.draw.line(surface, GRIS, 
                                (x_marqueur, y_sol - 5), (x_marqueur, y_sol + 5), 1)
                 texte_dist = self.font_petit.render(f"{i}m", True, GRIS)
-                self.ecran.blit(texte_dist, (x_marqueur - 8, y_sol + 10))
+                surface.blit(texte_dist, (x_marqueur - 8, y_sol + 10))
+    
+    def dessiner_scene(self):
+        """Dessine la scène avec Zénon, l'arbre et l'environnement"""
+        y_sol = HAUTEUR // 2 + 100
+        x_zeno = self.position_zeno
+        
+        # Fond pré-rendu (reconstruit si Zénon ou l'arbre changent de place)
+        self.fond_scene.blit(self.ecran, cle=(self.position_zeno, self.position_arbre))
+        
+        # Bras tenant la pierre (si pas encore lancée)
+        if self.etape_actuelle == 0:
+            pygame.draw.line(self.ecran, (255, 220, 177), 
+                           (x_zeno + 10, y_sol - 40), (x_zeno + 25, y_sol - 30), 3)
     
     def dessiner_pierre(self):
         """Dessine la pierre avec trail de mouvement"""
@@ -219,7 +213,7 @@ class DichotomieSimulation:
         pygame.draw.rect(self.ecran, NOIR, (50, y_start, LARGEUR - 100, 250), 2)
         
         # Titre
-        titre = self.font_titre.render("Étapes de la Dichotomie de Zénon", True, VIOLET)
+        titre = self.textes.rendre(self.font_titre, "Étapes de la Dichotomie de Zénon", VIOLET)
         self.ecran.blit(titre, (60, y_start + 10))
         
         # Ligne représentant la distance totale
@@ -236,9 +230,9 @@ class DichotomieSimulation:
         pygame.draw.circle(self.ecran, VERT_FONCE, (ligne_start + ligne_longueur, ligne_y), 8)
         
         # Étiquettes
-        texte_zeno = self.font_petit.render("Zénon", True, BLEU)
+        texte_zeno = self.textes.rendre(self.font_petit, "Zénon", BLEU)
         self.ecran.blit(texte_zeno, (ligne_start - 20, ligne_y - 25))
-        texte_arbre = self.font_petit.render("Arbre", True, VERT_FONCE)
+        texte_arbre = self.textes.rendre(self.font_petit, "Arbre", VERT_FONCE)
         self.ecran.blit(texte_arbre, (ligne_start + ligne_longueur - 20, ligne_y - 25))
         
         # Visualisation des étapes
@@ -259,8 +253,8 @@ class DichotomieSimulation:
                            (ligne_start + fin_etape, ligne_y - 10), 8)
             
             # Étiquette de l'étape
-            texte_etape = self.font_petit.render(f"Étape {i+1}", True, couleur)
-            texte_dist = self.font_petit.render(f"{8/(2**(i+1)):.3f}m", True, couleur)
+            texte_etape = self.textes.rendre(self.font_petit, f"Étape {i+1}", couleur)
+            texte_dist = self.textes.rendre(self.font_petit, f"{8/(2**(i+1)):.3f}m", couleur)
             self.ecran.blit(texte_etape, (ligne_start + position_actuelle + 5, ligne_y + 15))
             self.ecran.blit(texte_dist, (ligne_start + position_actuelle + 5, ligne_y + 35))
             
@@ -272,6 +266,91 @@ class DichotomieSimulation:
             x_pierre_ligne = ligne_start + pos_pierre_relative * ligne_longueur
             pygame.draw.circle(self.ecran, ROUGE, (int(x_pierre_ligne), ligne_y), 6)
     
+    def dessiner_zoom_profond(self):
+        """
+        Vue zoomée qui suit la pierre vers l'arbre sur des centaines de moitiés.
+        Les abscisses sont relatives à l'arbre, en unités du zoom courant
+        (2^(zoom - k) pour la fin de l'étape k): elles restent dans la
+        précision des flottants à toute profondeur. Seules les étapes d'au
+        moins un pixel qui entrent dans la vue sont dessinées, une douzaine
+        à n'importe quel zoom; le reste tient dans le dernier pixel.
+        """
+        y_start = 600
+        pygame.draw.rect(self.ecran, BLANC, (50, y_start, LARGEUR - 100, 250))
+        pygame.draw.rect(self.ecran, NOIR, (50, y_start, LARGEUR - 100, 250), 2)
+        
+        # La pierre au milieu de la vue, sauf décalage demandé (PgUp/PgDn)
+        profondeur = max(self.profondeur_pierre, self.etape_actuelle)
+        zoom = profondeur - 1 + self.limiter_decalage_zoom(self.decalage_zoom)
+        etape = int(profondeur)
+        
+        titre = self.textes.rendre(self.font_titre, f"Zoom profond : étape {etape}, zoom ×2^{math.floor(zoom)}",
+                                   VIOLET)
+        self.ecran.blit(titre, (60, y_start + 10))
+        
+        ligne_y = y_start + 110
+        x_gauche = 100
+        x_arbre = x_gauche + LARGEUR_ZOOM
+        pygame.draw.line(self.ecran, NOIR, (x_gauche, ligne_y), (x_arbre, ligne_y), 3)
+        
+        def abscisse(profondeur_point):
+            """Abscisse du point où il reste dichotomie.reste(profondeur_point)"""
+            return x_arbre - 2.0 ** (zoom - profondeur_point) * LARGEUR_ZOOM
+        
+        # Étapes visibles: fin dans la vue et au moins un pixel de long
+        couleurs = [ROUGE, ORANGE, JAUNE, VERT, BLEU, VIOLET]
+        premiere = max(1, math.floor(zoom) + 1)
+        derniere = max(premiere, math.floor(zoom + math.log2(LARGEUR_ZOOM)))
+        for k in range(premiere, derniere + 1):
+            x_debut = max(x_gauche, abscisse(k - 1))
+            x_fin = abscisse(k)
+            couleur = couleurs[(k - 1) % len(couleurs)]
+            
+            if k <= etape + 1:
+                pygame.draw.line(self.ecran, couleur, (x_debut, ligne_y - 10), (x_fin, ligne_y - 10), 8)
+            pygame.draw.line(self.ecran, GRIS, (x_fin, ligne_y - 6), (x_fin, ligne_y + 6), 1)
+            
+            if x_fin - x_debut >= LARGEUR_ETIQUETTE:
+                longueur = notation_scientifique(self.dichotomie.log10_reste(k))
+                texte_etape = self.textes.rendre(self.font_petit, f"Étape {k}", couleur)
+                texte_dist = self.textes.rendre(self.font_petit, f"{longueur} m", couleur)
+                self.ecran.blit(texte_etape, (x_debut + 5, ligne_y + 15))
+                self.ecran.blit(texte_dist, (x_debut + 5, ligne_y + 35))
+        
+        # Zénon s'il est dans la vue, l'arbre et l'infinité d'étapes restantes
+        if zoom <= 0:
+            pygame.draw.circle(self.ecran, BLEU, (int(abscisse(0)), ligne_y), 8)
+        pygame.draw.circle(self.ecran, VERT_FONCE, (x_arbre, ligne_y), 8)
+        texte_arbre = self.textes.rendre(self.font_petit, "Arbre", VERT_FONCE)
+        self.ecran.blit(texte_arbre, (x_arbre - 20, ligne_y - 35))
+        texte_reste = self.textes.rendre(self.font_petit, "étapes < 1 px", GRIS)
+        self.ecran.blit(texte_reste, (x_arbre - 60, ligne_y + 15))
+        
+        # Pierre, sauf si le zoom l'a laissée à gauche de la vue
+        x_pierre = abscisse(profondeur)
+        if x_pierre >= x_gauche:
+            pygame.draw.circle(self.ecran, GRIS, (int(x_pierre), ligne_y), 6)
+            pygame.draw.circle(self.ecran, NOIR, (int(x_pierre), ligne_y), 6, 2)
+        
+        infos = [
+            f"Largeur de la vue : {notation_scientifique(self.dichotomie.log10_reste(zoom))} m"
+            f"    Reste de la pierre : {notation_scientifique(self.dichotomie.log10_reste(profondeur))} m",
+            f"En float64 la pierre s'arrête à l'étape {self.stagnation_flottants}; ici le reste est exact"
+            f" ({self.dichotomie.distance:g}/2^k)    PgUp/PgDn : zoom    Z : quitter",
+        ]
+        for i, info in enumerate(infos):
+            texte = self.textes.rendre(self.font_petit, info, NOIR)
+            self.ecran.blit(texte, (60, y_start + 195 + i * 22))
+    
+    def limiter_decalage_zoom(self, decalage):
+        """
+        Décalage de zoom borné à ce que la profondeur de la pierre permet:
+        au plus large, toute la distance depuis Zénon (zoom 0); au plus serré,
+        DECALAGE_ZOOM_MAX moitiés au-delà de la pierre
+        """
+        profondeur = max(self.profondeur_pierre, self.etape_actuelle)
+        return min(max(decalage, 1 - math.ceil(profondeur)), DECALAGE_ZOOM_MAX)
+    
     def dessiner_serie_mathematique(self):
         """Dessine l'analyse de la série mathématique"""
         if not self.afficher_serie:
@@ -285,14 +364,14 @@ class DichotomieSimulation:
         pygame.draw.rect(self.ecran, NOIR, (x_start, y_start, 450, 400), 2)
         
         # Titre
-        titre = self.font_titre.render("Série Géométrique", True, BLEU)
+        titre = self.textes.rendre(self.font_titre, "Série Géométrique", BLEU)
         self.ecran.blit(titre, (x_start + 10, y_start + 10))
         
         # Formule générale
-        formule = self.font.render("S = 4 + 2 + 1 + 0.5 + 0.25 + ...", True, NOIR)
+        formule = self.textes.rendre(self.font, "S = 4 + 2 + 1 + 0.5 + 0.25 + ...", NOIR)
         self.ecran.blit(formule, (x_start + 10, y_start + 50))
         
-        formule2 = self.font.render("S = 4/(1-0.5) = 8 mètres", True, BLEU)
+        formule2 = self.textes.rendre(self.font, "S = 4/(1-0.5) = 8 mètres", BLEU)
         self.ecran.blit(formule2, (x_start + 10, y_start + 75))
         
         # Tableau des termes
@@ -302,7 +381,7 @@ class DichotomieSimulation:
         
         # En-têtes
         for i, header in enumerate(headers):
-            texte = self.font_petit.render(header, True, NOIR)
+            texte = self.textes.rendre(self.font_petit, header, NOIR)
             self.ecran.blit(texte, (x_start + 10 + i * col_width, y_tableau))
         
         # Ligne de séparation
@@ -333,21 +412,21 @@ class DichotomieSimulation:
             ]
             
             for j, donnee in enumerate(donnees):
-                texte = self.font_petit.render(donnee, True, couleur)
+                texte = self.textes.rendre(self.font_petit, donnee, couleur)
                 self.ecran.blit(texte, (x_start + 15 + j * col_width, y_ligne))
         
         # Convergence
         if self.etape_actuelle > 3:
-            convergence = self.font.render("→ Converge vers 8m", True, VERT)
+            convergence = self.textes.rendre(self.font, "→ Converge vers 8m", VERT)
             self.ecran.blit(convergence, (x_start + 10, y_start + 350))
             
-            conclusion = self.font.render("La pierre atteint l'arbre !", True, VERT)
+            conclusion = self.textes.rendre(self.font, "La pierre atteint l'arbre !", VERT)
             self.ecran.blit(conclusion, (x_start + 10, y_start + 370))
     
     def dessiner_info_principale(self):
         """Dessine les informations principales"""
         # Titre
-        titre = self.font_grand.render("🌳 Paradoxe de la Dichotomie", True, NOIR)
+        titre = self.textes.rendre(self.font_grand, "🌳 Paradoxe de la Dichotomie", NOIR)
         self.ecran.blit(titre, (50, 10))
         
         # Informations de base
@@ -364,12 +443,12 @@ class DichotomieSimulation:
         ]
         
         for i, info in enumerate(infos_base):
-            texte = self.font.render(info, True, NOIR)
+            texte = self.textes.rendre(self.font, info, NOIR)
             self.ecran.blit(texte, (50, y_info + i * 25))
         
         # Paradoxe de Zénon
         y_paradoxe = 200
-        paradoxe_titre = self.font_titre.render("🤔 Le Paradoxe", True, VIOLET)
+        paradoxe_titre = self.textes.rendre(self.font_titre, "🤔 Le Paradoxe", VIOLET)
         self.ecran.blit(paradoxe_titre, (50, y_paradoxe))
         
         explication = [
@@ -386,47 +465,69 @@ class DichotomieSimulation:
         
         for i, ligne in enumerate(explication):
             couleur = VERT if ligne.startswith("🔬") else NOIR
-            texte = self.font.render(ligne, True, couleur)
+            texte = self.textes.rendre(self.font, ligne, couleur)
             self.ecran.blit(texte, (50, y_paradoxe + 40 + i * 22))
         
         # État du lancement
         if distance_restante < 5:  # Très proche
-            impact = self.font_titre.render("🎯 La pierre a atteint l'arbre !", True, VERT)
+            impact = self.textes.rendre(self.font_titre, "🎯 La pierre a atteint l'arbre !", VERT)
             self.ecran.blit(impact, (50, y_paradoxe + 280))
             if not self.lancement_termine:
                 self.lancement_termine = True
-                # Explosion de particules
-                for _ in range(20):
-                    self.ajouter_particule_pierre(self.position_arbre, HAUTEUR//2 + 80)
+                # Explosion de particules (20 salves de 8 en un seul appel)
+                self.particules_pierre.emettre(20 * 8, self.position_arbre, HAUTEUR//2 + 80,
+                                               dispersion=(8, 8), vx=(-30, 30), vy=(-30, 30),
+                                               taille=(2, 5), couleurs=(GRIS, GRIS_CLAIR, NOIR))
         
         # Contrôles
         y_controles = 50
         x_controles = 900
         
-        controles_titre = self.font_titre.render("🎮 Contrôles", True, BLEU)
+        controles_titre = self.textes.rendre(self.font_titre, "🎮 Contrôles", BLEU)
         self.ecran.blit(controles_titre, (x_controles, y_controles - 30))
         
         controles = [
             "ESPACE: ▶️ Start/Pause",
             "R: 🔄 Reset",
             "M: 📊 Mode affichage", 
-            "E: 📈 Étapes on/off",
+            "E: 📈 Étapes on/off    Z: 🔍 Zoom profond",
             "S: 🧮 Série on/off",
             "A: 🤖 Animation auto",
             "↑/↓: ⚡ Vitesse",
-            "Q: ❌ Quitter"
+            "←/→: ⏩ Relecture ±5s",
+            "F3: 📈 Profilage    Q: ❌ Quitter"
         ]
         
         for i, controle in enumerate(controles):
-            texte = self.font_petit.render(controle, True, GRIS)
+            texte = self.textes.rendre(self.font_petit, controle, GRIS)
             self.ecran.blit(texte, (x_controles, y_controles + i * 18))
+        
+        # Tête de lecture
+        if self.relecture is not None:
+            lecture = f"⏯️ Relecture: {self.relecture.temps:.1f}/{self.relecture.fin:.1f}s"
+            texte_lecture = self.textes.rendre(self.font, lecture, VIOLET)
+            self.ecran.blit(texte_lecture, (x_controles, y_controles + len(controles) * 18 + 10))
+    
+    def memoriser_historique(self):
+        """Ajoute l'état courant à l'historique, au plus tous les 0.1 s simulés"""
+        if len(self.historique) == 0 or self.temps - self.historique.dernier("temps") >= 0.1:
+            self.historique.ajouter(self.temps, self.position_pierre,
+                                    self.position_arbre - self.position_pierre)
     
-    def mettre_a_jour_simulation(self):
-        """Met à jour la simulation"""
+    def mettre_a_jour_simulation(self, pas=PAS_SIMULATION):
+        """Avance la simulation d'un pas de physique (pas en secondes réelles)"""
         if not self.simulation_active:
             return
         
-        dt = 1/60 * self.vitesse_simulation
+        dt = pas * self.vitesse_simulation
+        
+        if self.relecture is not None:
+            # Relecture: l'état vient du fichier, rien n'est recalculé
+            self.relecture.avancer(self, dt)
+            self.memoriser_historique()
+            self.mettre_a_jour_particules(dt)
+            return
+        
         self.temps += dt
         
         if not self.lancement_termine and self.animation_automatique:
@@ -437,14 +538,19 @@ class DichotomieSimulation:
                 self.etape_suivante()
                 self.temps_etape = 0.0
         
+        # Zoom profond: la pierre continue au-delà du pixel, sans fin
+        if self.zoom_profond:
+            self.profondeur_pierre = (max(self.profondeur_pierre, self.etape_actuelle)
+                                      + dt * ETAPES_PAR_SECONDE_ZOOM)
+        
         # Mise à jour des particules
         self.mettre_a_jour_particules(dt)
         
         # Historique
-        if len(self.historique_temps) == 0 or self.temps - self.historique_temps[-1] >= 0.1:
-            self.historique_positions.append(self.position_pierre)
-            self.historique_distances.append(self.position_arbre - self.position_pierre)
-            self.historique_temps.append(self.temps)
+        self.memoriser_historique()
+        
+        if self.enregistreur is not None:
+            self.enregistreur.ajouter_etat(self)
     
     def etape_suivante(self):
         """Passe à l'étape suivante de la dichotomie"""
@@ -470,84 +576,61 @@ class DichotomieSimulation:
         else:
             self.lancement_termine = True
     
-    def gerer_evenements(self):
-        """Gère les événements utilisateur"""
-        for evenement in pygame.event.get():
-            if evenement.type == pygame.QUIT:
-                return False
-            
-            elif evenement.type == pygame.KEYDOWN:
-                if evenement.key == pygame.K_SPACE:
-                    self.simulation_active = not self.simulation_active
-                
-                elif evenement.key == pygame.K_r:
-                    self.reset_simulation()
-                    self.simulation_active = False
-                
-                elif evenement.key == pygame.K_m:
-                    modes = ["normal", "zenon", "mathematique", "energie"]
-                    try:
-                        current_index = modes.index(self.mode_affichage)
-                        self.mode_affichage = modes[(current_index + 1) % len(modes)]
-                    except ValueError:
-                        self.mode_affichage = "normal"
-                
-                elif evenement.key == pygame.K_e:
-                    self.afficher_etapes = not self.afficher_etapes
-                
-                elif evenement.key == pygame.K_s:
-                    self.afficher_serie = not self.afficher_serie
-                
-                elif evenement.key == pygame.K_a:
-                    self.animation_automatique = not self.animation_automatique
-                
-                elif evenement.key == pygame.K_UP:
-                    self.vitesse_simulation = min(3.0, self.vitesse_simulation + 0.2)
-                
-                elif evenement.key == pygame.K_DOWN:
-                    self.vitesse_simulation = max(0.1, self.vitesse_simulation - 0.2)
-                
-                elif evenement.key == pygame.K_RETURN:
-                    # Étape manuelle
-                    if not self.animation_automatique:
-                        self.etape_suivante()
-                
-                elif evenement.key == pygame.K_q:
-                    return False
-        
-        return True
-    
-    def executer(self):
-        """Boucle principale"""
-        en_cours = True
-        
-        while en_cours:
-            en_cours = self.gerer_evenements()
-            
-            # Mise à jour
-            self.mettre_a_jour_simulation()
-            
-            # Rendu
-            self.ecran.fill((135, 206, 235))  # Bleu ciel
-            
-            # Dessiner tous les éléments
-            self.dessiner_scene()
-            self.dessiner_pierre()
-            self.dessiner_particules()
-            self.dessiner_info_principale()
-            
-            if self.afficher_etapes:
-                self.dessiner_etapes_zenon()
-            
-            if self.afficher_serie:
-                self.dessiner_serie_mathematique()
-            
-            pygame.display.flip()
-            self.horloge.tick(FPS)
+    def gerer_touche(self, touche):
+        """Touches propres à la simulation (les autres: SimulationPygame)"""
+        if touche == pygame.K_m:
+            modes = ["normal", "zenon", "mathematique", "energie"]
+            try:
+                current_index = modes.index(self.mode_affichage)
+                self.mode_affichage = modes[(current_index + 1) % len(modes)]
+            except ValueError:
+                self.mode_affichage = "normal"
+        
+        elif touche == pygame.K_e:
+            self.afficher_etapes = not self.afficher_etapes
+        
+        elif touche == pygame.K_s:
+            self.afficher_serie = not self.afficher_serie
+        
+        elif touche == pygame.K_a:
+            self.animation_automatique = not self.animation_automatique
+        
+        elif touche == pygame.K_z:
+            self.zoom_profond = not self.zoom_profond
+            self.decalage_zoom = 0
+        
+        elif touche == pygame.K_PAGEUP and self.zoom_profond:
+            self.decalage_zoom = self.limiter_decalage_zoom(self.decalage_zoom + 1)
+        
+        elif touche == pygame.K_PAGEDOWN and self.zoom_profond:
+            self.decalage_zoom = self.limiter_decalage_zoom(self.decalage_zoom - 1)
+        
+        elif touche == pygame.K_RETURN:
+            # Étape manuelle
+            if not self.animation_automatique:
+                self.etape_suivante()
         
-        pygame.quit()
-        sys.exit()
+        else:
+            super().gerer_touche(touche)
+    
+    def dessiner(self):
+        """Dessine une image complète de la simulation"""
+        # Rendu: la scène commence par le fond pré-rendu
+        self.dessiner_scene()
+        self.dessiner_pierre()
+        self.dessiner_particules()
+        self.dessiner_info_principale()
+        
+        if self.zoom_profond:
+            self.dessiner_zoom_profond()
+        elif self.afficher_etapes:
+            self.dessiner_etapes_zenon()
+        
+        if self.afficher_serie:
+            self.dessiner_serie_mathematique()
 
 if __name__ == "__main__":
-    simulation = DichotomieSimulation()
-    simulation.executer()
\ No newline at end of file
+    args = analyseur("Paradoxe de la Dichotomie").parse_args()
+    
+    simulation = preparer(DichotomieSimulation(), args)
+    simulation.executer()
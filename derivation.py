@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Dérivation numérique de précision
+Différences finies avant et centrées, extrapolation de Richardson et
+dérivée par pas complexe, vectorisées sur des tableaux d'instants t et de
+pas h; chaque méthode retourne (derivee, erreur estimee)
+
+f doit accepter des tableaux NumPy (et des complexes pour le pas complexe):
+np.sin, np.exp, polynômes...
+"""
+
+import numpy as np
+
+EPSILON = np.finfo(np.float64).eps
+
+
+def pas_optimal(t, ordre=2):
+    """
+    Pas qui équilibre troncature et annulation pour une différence
+    d'ordre donné: eps^(1/(ordre+1)) à l'échelle de t
+    """
+    return EPSILON ** (1.0 / (ordre + 1)) * np.maximum(np.abs(t), 1.0)
+
+
+def _erreur_arrondi(f, t, h):
+    """Erreur d'annulation de f(t+h) - f(t-h) divisée par h"""
+    return EPSILON * np.abs(f(t)) / h
+
+
+def difference_avant(f, t, h):
+    """
+    (f(t+h) - f(t)) / h, erreur en O(h).
+    L'erreur est estimée par l'écart avec le pas 2h plus l'annulation.
+    """
+    t, h = np.broadcast_arrays(np.asarray(t, dtype=np.float64), np.asarray(h, dtype=np.float64))
+    ft = f(t)
+    derivee = (f(t + h) - ft) / h
+    derivee_2h = (f(t + 2 * h) - ft) / (2 * h)
+    return derivee, np.abs(derivee_2h - derivee) + _erreur_arrondi(f, t, h)
+
+
+def difference_centree(f, t, h):
+    """
+    (f(t+h) - f(t-h)) / 2h, erreur en O(h²).
+    L'écart avec le pas 2h vaut environ 3 fois l'erreur de troncature.
+    """
+    t, h = np.broadcast_arrays(np.asarray(t, dtype=np.float64), np.asarray(h, dtype=np.float64))
+    derivee = (f(t + h) - f(t - h)) / (2 * h)
+    derivee_2h = (f(t + 2 * h) - f(t - 2 * h)) / (4 * h)
+    return derivee, np.abs(derivee_2h - derivee) / 3 + _erreur_arrondi(f, t, h)
+
+
+def richardson(f, t, h, niveaux=4):
+    """
+    Extrapolation de Richardson des différences centrées aux pas
+    h, h/2, ..., h/2^(niveaux-1): erreur en O(h^(2*niveaux)).
+    L'erreur est l'écart entre les deux dernières diagonales du tableau.
+    """
+    t, h = np.broadcast_arrays(np.asarray(t, dtype=np.float64), np.asarray(h, dtype=np.float64))
+    tableau = []
+    for k in range(niveaux):
+        hk = h / 2 ** k
+        ligne = [(f(t + hk) - f(t - hk)) / (2 * hk)]
+        for j in range(1, k + 1):
+            facteur = 4.0 ** j
+            ligne.append((facteur * ligne[j - 1] - tableau[k - 1][j - 1]) / (facteur - 1))
+        tableau.append(ligne)
+
+    derivee = tableau[-1][-1]
+    if niveaux == 1:
+        precedente = (f(t + 2 * h) - f(t - 2 * h)) / (4 * h)
+    else:
+        precedente = tableau[-2][-1]
+    hmin = h / 2 ** (niveaux - 1)
+    return derivee, np.abs(derivee - precedente) + _erreur_arrondi(f, t, hmin)
+
+
+def pas_complexe(f, t, h=1e-20):
+    """
+    Im(f(t + ih)) / h: aucune soustraction, donc aucune annulation, et
+    une erreur en O(h²) négligeable pour h minuscule. Exige une fonction
+    analytique évaluable en complexe.
+    """
+    t, h = np.broadcast_arrays(np.asarray(t, dtype=np.float64), np.asarray(h, dtype=np.float64))
+    derivee = np.imag(f(t + 1j * h)) / h
+    # Troncature en h² f'''/6, bornée par l'écart avec un pas mille fois plus grand
+    derivee_grand = np.imag(f(t + 1j * h * 1000)) / (h * 1000)
+    erreur = np.abs(derivee_grand - derivee) * 1e-6 + EPSILON * np.abs(derivee)
+    return derivee, erreur
+
+
+METHODES = {
+    'avant': difference_avant,
+    'centrée': difference_centree,
+    'Richardson': richardson,
+    'pas complexe': pas_complexe,
+}
+
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Dichotomie exacte en rationnels dyadiques
+Chaque position est un entier divisé par une puissance de deux: la
+représentation est exacte à n'importe quelle profondeur, là où les
+flottants s'effondrent après quelques dizaines d'étapes
+"""
+
+import math
+
+import numpy as np
+
+LOG10_2 = math.log10(2)
+
+
+def dyadique(valeur):
+    """
+    Écrit valeur (entier ou flottant) sous la forme (numerateur, exposant)
+    avec valeur = numerateur / 2**exposant et numerateur impair (ou nul).
+    """
+    numerateur, denominateur = float(valeur).as_integer_ratio()
+    exposant = denominateur.bit_length() - 1
+    if numerateur == 0:
+        return 0, 0
+    zeros = (numerateur & -numerateur).bit_length() - 1
+    return numerateur >> zeros, exposant - zeros
+
+
+def comparer(a, b):
+    """Compare deux dyadiques (numerateur, exposant): -1, 0 ou 1"""
+    (na, ea), (nb, eb) = a, b
+    if ea < eb:
+        na <<= eb - ea
+    else:
+        nb <<= ea - eb
+    return (na > nb) - (na < nb)
+
+
+def notation_scientifique(log10_valeur, chiffres=3):
+    """Texte « m.mme-x » d'une valeur connue par son log10, même hors de portée des flottants"""
+    exposant = math.floor(log10_valeur)
+    mantisse = 10 ** (log10_valeur - exposant)
+    if round(mantisse, chiffres - 1) >= 10:
+        mantisse /= 10
+        exposant += 1
+    return f"{mantisse:.{chiffres - 1}f}e{exposant}"
+
+
+class DichotomieExacte:
+    """
+    Dichotomie de Zénon sur une distance donnée, calculée exactement.
+    À l'étape n la pierre a parcouru distance * (1 - 2**-n) et il lui
+    reste distance * 2**-n.
+    """
+
+    def __init__(self, distance=8.0):
+        self.distance = distance
+        self.numerateur, self.exposant = dyadique(distance)
+
+    def reste(self, n):
+        """Distance restante après n étapes, exacte, en O(1): (numerateur, exposant)"""
+        return self.numerateur, self.exposant + n
+
+    def position(self, n):
+        """Position exacte après n étapes: (numerateur, exposant)"""
+        return (self.numerateur << n) - self.numerateur, self.exposant + n
+
+    def pas(self, n):
+        """Longueur exacte de l'étape n (n >= 1): la moitié du reste précédent"""
+        return self.reste(n)
+
+    def reste_float(self, n):
+        """
+        Distance restante arrondie en float64: sous-normale (précision
+        réduite) sous 2^-1022, 0.0 seulement sous 2^-1075
+        """
+        return math.ldexp(self.numerateur, -(self.exposant + n))
+
+    def log10_reste(self, n):
+        """log10 de la distance restante, valable à n'importe quelle profondeur"""
+        return math.log10(self.numerateur) - (self.exposant + n) * LOG10_2
+
+    def log10_restes(self, debut, fin):
+        """log10 des distances restantes pour les étapes debut..fin-1 (tableau NumPy)"""
+        etapes = np.arange(debut, fin, dtype=np.float64)
+        return math.log10(self.numerateur) - (self.exposant + etapes) * LOG10_2
+
+    def divergence(self, type_flottant=float, etapes_max=10**6):
+        """
+        Refait la dichotomie en flottants (float, np.float32, np.float64...)
+        et la compare au résultat exact.
+
+        Retourne un dictionnaire:
+            'premier_ecart': première étape où la position flottante n'est plus exacte
+            'stagnation'   : première étape où la position flottante ne bouge plus
+            'arrivee'      : première étape où le reste flottant vaut 0 (la pierre
+                             « touche » l'arbre), None si jamais
+            'position'     : position flottante finale
+        """
+        arbre = type_flottant(self.distance)
+        deux = type_flottant(2)
+        position = type_flottant(0)
+        resultat = {'premier_ecart': None, 'stagnation': None, 'arrivee': None}
+
+        for n in range(etapes_max + 1):
+            if resultat['premier_ecart'] is None and comparer(dyadique(position), self.position(n)):
+                resultat['premier_ecart'] = n
+
+            reste = arbre - position
+            if reste == 0 and resultat['arrivee'] is None:
+                resultat['arrivee'] = n
+
+            suivante = position + reste / deux
+            if suivante == position:
+                # Point fixe: toutes les étapes suivantes sont identiques
+                resultat['stagnation'] = n
+                if resultat['premier_ecart'] is None:
+                    resultat['premier_ecart'] = n + 1
+                break
+            position = suivante
+
+        resultat['position'] = float(position)
+        return resultat
+
+
+def afficher_divergence(distance=8.0):
+    """Compare float32, float64 et le calcul exact"""
+    dichotomie = DichotomieExacte(distance)
+
+    print(f"\n=== DICHOTOMIE EXACTE ET FLOTTANTS (distance {distance}m) ===")
+    print(f"{'Type':>8} | {'1er écart':>9} | {'Stagnation':>10} | {'Reste = 0':>9} | {'Position finale':>18}")
+    print("-" * 68)
+    for nom, type_flottant in (("float32", np.float32), ("float64", np.float64)):
+        d = dichotomie.divergence(type_flottant)
+        arrivee = d['arrivee'] if d['arrivee'] is not None else "jamais"
+        print(f"{nom:>8} | {d['premier_ecart']:>9} | {d['stagnation']:>10} | {arrivee:>9} | {d['position']:18.15f}")
+
+    print("\nCalcul exact (le reste n'est jamais nul):")
+    for n in (10, 100, 1000, 10**6, 10**9):
+        numerateur, exposant = dichotomie.reste(n)
+        print(f"Étape {n:>10}: reste = {numerateur}/2^{exposant} ≈ 10^{dichotomie.log10_reste(n):.1f} m")
+
+
+if __name__ == "__main__":
+    import time
+
+    afficher_divergence()
+
+    dichotomie = DichotomieExacte(8.0)
+    debut = time.perf_counter()
+    numerateur, exposant = dichotomie.position(10**6)
+    duree = time.perf_counter() - debut
+    print(f"\nPosition exacte après 10^6 étapes: {numerateur.bit_length()} bits "
+          f"sur 2^{exposant}, calculée en {duree * 1000:.2f} ms")
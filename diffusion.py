@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+Diffusion en direct d'une simulation vers les appareils de la classe
+Le serveur asyncio fait tourner une simulation Pygame sans fenêtre (sa
+propre mettre_a_jour_simulation) et envoie à chaque client, en Server-Sent
+Events, les seules valeurs qui ont changé. Chaque client a une file bornée:
+celui qui ne suit pas est déconnecté au lieu de ralentir les autres
+"""
+
+import argparse
+import asyncio
+import importlib
+import json
+import os
+import socket
+import time
+
+# Pas de fenêtre ni de son côté serveur
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from lanceur import SCENES
+
+TAILLE_FILE = 32             # Messages en attente par client avant déconnexion
+DELAI_ECRITURE = 2.0         # Secondes d'écriture bloquée avant déconnexion
+TAMPON_ENVOI = 16 * 1024     # Octets tamponnés par client (socket et transport)
+ENTRETIEN = 15.0             # Commentaire SSE envoyé en l'absence de changement (s)
+
+PAGE = """<!doctype html>
+<meta charset="utf-8"><title>Zénon en direct</title>
+<h1>Zénon en direct</h1><pre id="etat">connexion...</pre>
+<script>
+const etat = {};
+const source = new EventSource("/flux");
+const afficher = e => { Object.assign(etat, JSON.parse(e.data));
+  document.getElementById("etat").textContent = JSON.stringify(etat, null, 2); };
+source.addEventListener("etat", afficher);
+source.addEventListener("delta", afficher);
+</script>
+"""
+
+
+def arrondir(valeur):
+    """Valeurs compactes pour le JSON (les flottants à 1e-3 près)"""
+    if isinstance(valeur, float):
+        return round(valeur, 3)
+    if hasattr(valeur, "item"):  # Scalaire NumPy
+        return arrondir(valeur.item())
+    return valeur
+
+
+def evenement_sse(nom, identifiant, donnees):
+    """Message SSE encodé une fois pour tous les clients"""
+    texte = json.dumps(donnees, separators=(",", ":"), ensure_ascii=False)
+    return f"event: {nom}\nid: {identifiant}\ndata: {texte}\n\n".encode("utf-8")
+
+
+class Client:
+    """Connexion d'un appareil: sa file de messages et son flux d'écriture"""
+
+    def __init__(self, writer, taille_file):
+        self.writer = writer
+        self.file = asyncio.Queue(maxsize=taille_file)
+        self.envoyes = 0
+        self.abandonne = False
+        self.tache = asyncio.current_task()
+
+
+class Diffuseur:
+    """
+    Fait avancer simulation à pas fixe (sa BoucleFixe, son
+    mettre_a_jour_simulation) et publie frequence fois par seconde les
+    attributs enregistrés, l'indice du pas et le mode d'affichage.
+    """
+
+    def __init__(self, simulation, frequence=20.0, taille_file=TAILLE_FILE, delai_ecriture=DELAI_ECRITURE):
+        self.simulation = simulation
+        self.frequence = frequence
+        self.taille_file = taille_file
+        self.delai_ecriture = delai_ecriture
+        self.clients = set()
+        self.pas = 0
+        self.dernier = {}
+        self.publications = 0
+        self.abandons = 0
+
+    def etat(self):
+        """État complet de la simulation (attributs enregistrés, pas, mode)"""
+        simulation = self.simulation
+        etat = {nom: arrondir(getattr(simulation, nom)) for nom in simulation.ATTRIBUTS_ENREGISTRES}
+        etat["pas"] = self.pas
+        etat["mode"] = getattr(simulation, "mode_affichage", getattr(simulation, "mode_analyse", None))
+        etat["active"] = simulation.simulation_active
+        return etat
+
+    def publier(self):
+        """Envoie à tous les clients ce qui a changé depuis la dernière publication"""
+        etat = self.etat()
+        delta = {nom: valeur for nom, valeur in etat.items() if self.dernier.get(nom) != valeur}
+        if delta.keys() <= {"pas"}:
+            return  # Simulation arrêtée: seul le compteur de pas a bougé
+        self.dernier = etat
+        message = evenement_sse("delta", self.pas, delta)
+        self.publications += 1
+        for client in list(self.clients):
+            try:
+                client.file.put_nowait(message)
+            except asyncio.QueueFull:
+                self.abandonner(client)
+
+    def abandonner(self, client):
+        """Déconnecte un client trop lent: sa file est pleine ou son écriture bloquée"""
+        if client.abandonne:
+            return
+        client.abandonne = True
+        self.abandons += 1
+        self.clients.discard(client)
+        client.writer.transport.abort()
+
+    async def fermer(self, delai=1.0):
+        """
+        Termine les flux en cours (arrêt du serveur): chaque client reçoit la
+        fin de sa file et se ferme de lui-même au lieu d'être annulé
+        """
+        taches = []
+        for client in list(self.clients):
+            while not client.file.empty():
+                client.file.get_nowait()
+            client.file.put_nowait(None)
+            taches.append(client.tache)
+        if taches:
+            await asyncio.wait(taches, timeout=delai)
+
+    async def simuler(self):
+        """Physique en temps réel, publication à la fréquence demandée"""
+        boucle = self.simulation.boucle
+        horloge = asyncio.get_running_loop().time
+        precedent = horloge()
+        while True:
+            await asyncio.sleep(1 / self.frequence)
+            maintenant = horloge()
+            for _ in range(boucle.avancer(maintenant - precedent)):
+                self.simulation.mettre_a_jour_simulation(boucle.pas)
+                self.pas += 1
+            precedent = maintenant
+            self.publier()
+
+    async def servir(self, reader, writer):
+        """Une connexion HTTP: / (page), /etat (JSON) ou /flux (SSE)"""
+        try:
+            requete = await asyncio.wait_for(reader.readline(), 10.0)
+            while (await asyncio.wait_for(reader.readline(), 10.0)) not in (b"\r\n", b"\n", b""):
+                pass  # En-têtes ignorés
+        except (asyncio.TimeoutError, ConnectionError):
+            writer.close()
+            return
+
+        parties = requete.decode("latin1").split()
+        chemin = parties[1] if len(parties) >= 2 else "/"
+        if chemin == "/flux":
+            await self.diffuser(writer)
+            return
+
+        if chemin == "/etat":
+            corps, type_contenu, statut = json.dumps(self.etat()).encode(), "application/json", "200 OK"
+        elif chemin == "/":
+            corps, type_contenu, statut = PAGE.encode("utf-8"), "text/html; charset=utf-8", "200 OK"
+        else:
+            corps, type_contenu, statut = b"introuvable\n", "text/plain", "404 Not Found"
+        writer.write(f"HTTP/1.1 {statut}\r\nContent-Type: {type_contenu}\r\n"
+                     f"Content-Length: {len(corps)}\r\nConnection: close\r\n\r\n".encode() + corps)
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def diffuser(self, writer):
+        """Flux SSE d'un client: état complet, puis les deltas de sa file"""
+        # Tampons bornés: un client lent remplit vite sa file et est déconnecté
+        writer.transport.set_write_buffer_limits(high=TAMPON_ENVOI)
+        sock = writer.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, TAMPON_ENVOI)
+
+        client = Client(writer, self.taille_file)
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\n"
+                     b"Cache-Control: no-cache\r\nConnection: keep-alive\r\n\r\n")
+        writer.write(evenement_sse("etat", self.pas, self.etat()))
+        self.clients.add(client)
+        try:
+            while True:
+                try:
+                    message = await asyncio.wait_for(client.file.get(), ENTRETIEN)
+                except asyncio.TimeoutError:
+                    message = b": entretien\n\n"
+                if message is None:
+                    break  # Arrêt du serveur
+                writer.write(message)
+                await asyncio.wait_for(writer.drain(), self.delai_ecriture)
+                client.envoyes += 1
+        except asyncio.TimeoutError:
+            self.abandonner(client)
+        except ConnectionError:
+            pass
+        finally:
+            self.clients.discard(client)
+            writer.close()
+
+    async def rapporter(self, periode=5.0):
+        while True:
+            await asyncio.sleep(periode)
+            print(f"t = {self.simulation.temps:.2f}s, pas {self.pas}: {len(self.clients)} clients, "
+                  f"{self.publications} publications, {self.abandons} clients lents déconnectés")
+
+
+async def serveur(scene, hote="0.0.0.0", port=8765, frequence=20.0, taille_file=TAILLE_FILE):
+    """Construit la scène sans fenêtre, la démarre et la diffuse jusqu'à interruption"""
+    module, classe, _ = SCENES[scene]
+    simulation = getattr(importlib.import_module(module), classe)()
+    simulation.simulation_active = True
+    diffuseur = Diffuseur(simulation, frequence, taille_file)
+
+    serveur_tcp = await asyncio.start_server(diffuseur.servir, hote, port, backlog=256)
+    print(f"Diffusion de {scene} sur http://{hote}:{port}/ ({frequence:g} Hz)")
+    async with serveur_tcp:
+        try:
+            await asyncio.gather(diffuseur.simuler(), diffuseur.rapporter(), serveur_tcp.serve_forever())
+        finally:
+            await diffuseur.fermer()
+
+
+async def client_test(hote, port, duree, lent=False):
+    """
+    Client de substitution: lit le flux pendant duree secondes et retourne
+    (messages reçus, déconnecté par le serveur). Un client lent lit la
+    réponse initiale puis plus rien, avec un petit tampon de réception.
+    """
+    boucle = asyncio.get_running_loop()
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setblocking(False)
+    if lent:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+    await boucle.sock_connect(sock, (hote, port))
+    await boucle.sock_sendall(sock, b"GET /flux HTTP/1.1\r\nHost: zenon\r\nAccept: text/event-stream\r\n\r\n")
+
+    messages, deconnecte = 0, False
+    fin = time.perf_counter() + duree
+    try:
+        if lent:
+            messages = (await boucle.sock_recv(sock, 4096)).count(b"data:")
+            await asyncio.sleep(duree)
+            # Le serveur a-t-il coupé? Le reste du tampon puis la fin du flux,
+            # dans un délai borné: un client encore servi n'a pas été déconnecté
+            fin = time.perf_counter() + max(duree, 1.0)
+            while time.perf_counter() < fin:
+                donnees = await asyncio.wait_for(boucle.sock_recv(sock, 1 << 16),
+                                                 min(0.5, fin - time.perf_counter()))
+                if not donnees:
+                    deconnecte = True
+                    break
+        else:
+            while time.perf_counter() < fin:
+                donnees = await asyncio.wait_for(boucle.sock_recv(sock, 1 << 16), fin - time.perf_counter())
+                if not donnees:
+                    deconnecte = True
+                    break
+                messages += donnees.count(b"data:")
+    except asyncio.TimeoutError:
+        pass
+    except ConnectionError:
+        deconnecte = True
+    sock.close()
+    return messages, deconnecte
+
+
+async def charge(hote, port, clients, duree, lents=0):
+    """Lance clients clients de test (dont lents clients lents) et affiche le bilan"""
+    resultats = await asyncio.gather(*(client_test(hote, port, duree, lent=i < lents) for i in range(clients)))
+    normaux = resultats[lents:]
+    recus = [messages for messages, _ in normaux]
+    print(f"{len(normaux)} clients normaux: {min(recus)}-{max(recus)} messages en {duree:g}s "
+          f"({sum(recus) / len(recus) / duree:.1f}/s par client), "
+          f"{sum(d for _, d in normaux)} déconnectés")
+    if lents:
+        print(f"{lents} clients lents: {sum(d for _, d in resultats[:lents])} déconnectés par le serveur")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Diffusion en direct d'une simulation (Server-Sent Events)")
+    sous = parser.add_subparsers(dest="commande", required=True)
+
+    p_serveur = sous.add_parser("serveur", help="fait tourner et diffuse une simulation")
+    p_serveur.add_argument("scene", nargs="?", choices=SCENES, default="achille")
+    p_serveur.add_argument("--hote", default="0.0.0.0")
+    p_serveur.add_argument("--port", type=int, default=8765)
+    p_serveur.add_argument("--frequence", type=float, default=20.0, help="publications par seconde")
+    p_serveur.add_argument("--file", type=int, default=TAILLE_FILE,
+                           help="messages en attente par client avant déconnexion")
+
+    p_client = sous.add_parser("client", help="clients de test (mesure de charge)")
+    p_client.add_argument("--hote", default="127.0.0.1")
+    p_client.add_argument("--port", type=int, default=8765)
+    p_client.add_argument("-n", "--clients", type=int, default=50)
+    p_client.add_argument("--lents", type=int, default=0, help="clients qui cessent de lire")
+    p_client.add_argument("--duree", type=float, default=5.0)
+
+    args = parser.parse_args()
+    try:
+        if args.commande == "serveur":
+            asyncio.run(serveur(args.scene, args.hote, args.port, args.frequence, args.file))
+        else:
+            asyncio.run(charge(args.hote, args.port, args.clients, args.duree, args.lents))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Enregistrement et relecture des trajectoires
+L'état de la simulation est écrit pas à pas dans un fichier .npy à
+colonnes (dtype structuré) par un thread d'écriture; la relecture projette
+le fichier en mémoire et se positionne par recherche dichotomique sur le
+temps, sans rien recalculer ni charger
+"""
+
+import queue
+import struct
+import threading
+
+import numpy as np
+
+MAGIC = b"\x93NUMPY\x01\x00"
+TAILLE_ENTETE = 256  # Octets réservés à l'en-tête .npy (multiple de 64)
+
+
+def type_colonne(valeur):
+    """Type NumPy d'une colonne d'après sa valeur initiale"""
+    if isinstance(valeur, (bool, np.bool_)):
+        return "?"
+    if isinstance(valeur, (int, np.integer)):
+        return "<i8"
+    return "<f8"
+
+
+def entete_npy(dtype, nombre):
+    """
+    En-tête .npy version 1.0 de taille fixe TAILLE_ENTETE pour nombre lignes:
+    il peut être réécrit en place quand le nombre de lignes change.
+    """
+    description = {'descr': np.lib.format.dtype_to_descr(dtype),
+                   'fortran_order': False, 'shape': (nombre,)}
+    texte = repr(description).encode("latin1")
+    longueur = TAILLE_ENTETE - len(MAGIC) - 2
+    if len(texte) + 1 > longueur:
+        raise ValueError(f"trop de colonnes pour un en-tête de {TAILLE_ENTETE} octets")
+    return MAGIC + struct.pack("<H", longueur) + texte.ljust(longueur - 1) + b"\n"
+
+
+class Enregistreur:
+    """
+    Enregistre les attributs d'un objet (une colonne par attribut) dans
+    chemin. Les lignes sont regroupées par lots de taille_lot et écrites par
+    un thread en arrière-plan; l'en-tête est mis à jour après chaque lot,
+    le fichier reste donc lisible pendant l'enregistrement. Une erreur
+    d'écriture (disque plein...) arrête le thread et est relancée par le
+    prochain envoi ou par fermer(), au lieu de bloquer la simulation.
+    """
+
+    def __init__(self, chemin, objet, attributs, taille_lot=1024):
+        self.chemin = chemin
+        self.attributs = tuple(attributs)
+        self.dtype = np.dtype([(nom, type_colonne(getattr(objet, nom))) for nom in self.attributs])
+        self.taille_lot = taille_lot
+        self.lot = []
+        self.lignes = 0  # Lignes écrites sur disque
+        self.erreur = None  # Exception du thread d'écriture
+
+        self.fichier = open(chemin, "wb")
+        self.fichier.write(entete_npy(self.dtype, 0))
+        self.file = queue.Queue(maxsize=64)
+        self.thread = threading.Thread(target=self._ecrire, daemon=True)
+        self.thread.start()
+
+    def ajouter_etat(self, objet):
+        """Ajoute l'état courant de l'objet"""
+        self.lot.append(tuple(getattr(objet, nom) for nom in self.attributs))
+        if len(self.lot) >= self.taille_lot:
+            self._envoyer()
+
+    def _verifier(self):
+        """Relance l'erreur du thread d'écriture, s'il s'est arrêté sur une erreur"""
+        if self.erreur is not None:
+            raise OSError(f"échec de l'enregistrement dans {self.chemin}") from self.erreur
+
+    def _deposer(self, element):
+        """Met element dans la file sans attendre indéfiniment un thread arrêté"""
+        while True:
+            self._verifier()
+            if not self.thread.is_alive():
+                raise RuntimeError(f"thread d'écriture arrêté: {self.chemin}")
+            try:
+                self.file.put(element, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
+    def _envoyer(self):
+        if self.lot:
+            lot, self.lot = self.lot, []
+            self._deposer(np.array(lot, dtype=self.dtype))
+
+    def _ecrire(self):
+        """Thread d'écriture: données en fin de fichier puis en-tête à jour"""
+        try:
+            while True:
+                donnees = self.file.get()
+                if donnees is None:
+                    break
+                self.fichier.write(donnees.tobytes())
+                self.lignes += len(donnees)
+                self.fichier.seek(0)
+                self.fichier.write(entete_npy(self.dtype, self.lignes))
+                self.fichier.seek(0, 2)
+        except Exception as erreur:  # Relancée dans le thread de la simulation
+            self.erreur = erreur
+
+    def fermer(self):
+        """Écrit les dernières lignes et ferme le fichier"""
+        if self.fichier.closed:
+            return
+        try:
+            if self.thread.is_alive():
+                self._envoyer()
+                self._deposer(None)
+                self.thread.join()
+        finally:
+            self.fichier.close()
+        self._verifier()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fermer()
+
+
+class Relecture:
+    """
+    Relecture d'un enregistrement projeté en mémoire (np.load, mmap_mode='r'):
+    seules les pages lues sont chargées, même pour des fichiers de centaines de Mo.
+    La colonne temps doit être croissante.
+    """
+
+    def __init__(self, chemin):
+        self.donnees = np.load(chemin, mmap_mode="r")
+        if len(self.donnees) == 0:
+            raise ValueError(f"enregistrement vide: {chemin}")
+        self.attributs = self.donnees.dtype.names
+        self.temps_colonne = self.donnees["temps"]
+        self.debut = float(self.temps_colonne[0])
+        self.fin = float(self.temps_colonne[-1])
+        self.temps = self.debut
+
+    def __len__(self):
+        return len(self.donnees)
+
+    @property
+    def terminee(self):
+        return self.temps >= self.fin
+
+    def index(self, temps):
+        """Index de la dernière ligne enregistrée à un instant <= temps"""
+        i = int(np.searchsorted(self.temps_colonne, temps, side="right")) - 1
+        return min(max(i, 0), len(self.donnees) - 1)
+
+    def appliquer(self, objet):
+        """Place l'objet dans l'état enregistré à l'instant courant"""
+        ligne = self.donnees[self.index(self.temps)]
+        for nom in self.attributs:
+            setattr(objet, nom, ligne[nom].item())
+
+    def chercher(self, objet, temps):
+        """Se positionne à l'instant temps (borné à l'enregistrement)"""
+        self.temps = min(max(temps, self.debut), self.fin)
+        self.appliquer(objet)
+
+    def avancer(self, objet, dt):
+        """Avance la tête de lecture de dt secondes simulées"""
+        self.chercher(objet, self.temps + dt)
+
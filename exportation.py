@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Export vidéo sans fenêtre des simulations Pygame
+Chaque image est rendue hors écran à pas de temps fixe (aucune image perdue,
+quelle que soit la durée du rendu), puis encodée en PNG, ou en GIF animé si
+Pillow est installé, par un groupe de threads. Un nombre fixe de surfaces
+circule entre le rendu et les encodeurs: la mémoire reste constante quelle
+que soit la durée de l'export.
+
+Séquence PNG vers vidéo: ffmpeg -framerate 60 -i image_%06d.png video.mp4
+"""
+
+import importlib
+import io
+import math
+import os
+import queue
+import struct
+import time
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+# Pas de fenêtre ni de son: doit être choisi avant l'initialisation de Pygame
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np
+import pygame
+
+try:
+    from PIL import Image
+except ImportError:  # Export GIF indisponible, PNG seulement
+    Image = None
+
+from lanceur import SCENES
+from noyau import analyseur, preparer
+
+SIGNATURE_PNG = b"\x89PNG\r\n\x1a\n"
+# Surfaces 24 bits dont les octets sont dans l'ordre R, G, B: pixels3d en
+# donne des lignes contiguës, que l'encodeur lit sans rien copier
+MASQUES_RGB = (0x0000FF, 0x00FF00, 0xFF0000, 0)
+FPS_GIF_MAX = 50  # Les navigateurs ralentissent les délais GIF de moins de 2/100 s
+
+
+def bloc_png(type_bloc, donnees):
+    """Bloc PNG: longueur, type, données, CRC"""
+    crc = zlib.crc32(donnees, zlib.crc32(type_bloc))
+    return struct.pack(">I", len(donnees)) + type_bloc + donnees + struct.pack(">I", crc)
+
+
+def encoder_png(pixels, niveau=3):
+    """
+    PNG RGB d'un tableau (largeur, hauteur, 3) comme ceux de pygame.surfarray.
+    Filtre Sub (chaque octet moins celui du pixel de gauche) calculé par
+    NumPy: les aplats des simulations se compressent alors très bien.
+    """
+    largeur, hauteur, _ = pixels.shape
+    # Lignes d'octets R, G, B: une simple vue pour une surface MASQUES_RGB
+    lignes = pixels.transpose(1, 0, 2).reshape(hauteur, 3 * largeur)
+
+    brut = np.empty((hauteur, 1 + 3 * largeur), dtype=np.uint8)
+    brut[:, 0] = 1  # Type de filtre de chaque ligne
+    brut[:, 1:4] = lignes[:, :3]
+    np.subtract(lignes[:, 3:], lignes[:, :-3], out=brut[:, 4:])
+
+    entete = struct.pack(">IIBBBBB", largeur, hauteur, 8, 2, 0, 0, 0)  # 8 bits, RGB
+    return (SIGNATURE_PNG + bloc_png(b"IHDR", entete)
+            + bloc_png(b"IDAT", zlib.compress(brut, niveau)) + bloc_png(b"IEND", b""))
+
+
+def encoder_gif(pixels, couleurs=256):
+    """GIF d'une seule image (palette adaptative) d'un tableau surfarray"""
+    image = Image.fromarray(np.ascontiguousarray(pixels.transpose(1, 0, 2)))
+    tampon = io.BytesIO()
+    image.quantize(couleurs, method=Image.Quantize.FASTOCTREE).save(tampon, "GIF")
+    return tampon.getvalue()
+
+
+def decouper_gif(donnees):
+    """
+    Image d'un GIF isolé, prête à être ajoutée à une animation: descripteur
+    avec table de couleurs locale (la table globale du fichier) et données LZW
+    """
+    drapeaux = donnees[10]
+    position = 13
+    palette = b""
+    if drapeaux & 0x80:
+        taille = 3 << ((drapeaux & 0x07) + 1)
+        palette = donnees[position:position + taille]
+        position += taille
+
+    while donnees[position] == 0x21:  # Extensions ignorées: le délai est réécrit
+        position += 2
+        while donnees[position]:
+            position += donnees[position] + 1
+        position += 1
+
+    if donnees[position] != 0x2C or donnees[-1] != 0x3B:
+        raise ValueError("GIF inattendu: pas de descripteur d'image")
+    descripteur = bytearray(donnees[position:position + 10])
+    if not descripteur[9] & 0x80:
+        descripteur[9] |= 0x80 | (drapeaux & 0x07)
+        return bytes(descripteur) + palette + donnees[position + 10:-1]
+    return donnees[position:-1]
+
+
+class EcrivainGIF:
+    """
+    GIF animé écrit au fil de l'eau, image après image: chaque image garde
+    sa propre palette, rien n'est conservé en mémoire
+    """
+
+    def __init__(self, chemin, largeur, hauteur, fps):
+        self.fichier = open(chemin, "wb")
+        self.fps = fps
+        self.images = 0
+        # En-tête sans table globale, puis boucle infinie (extension NETSCAPE2.0)
+        self.fichier.write(b"GIF89a" + struct.pack("<HHBBB", largeur, hauteur, 0, 0, 0))
+        self.fichier.write(b"\x21\xff\x0bNETSCAPE2.0\x03\x01\x00\x00\x00")
+
+    def ajouter(self, donnees):
+        """Ajoute une image produite par encoder_gif"""
+        # Délais en centièmes de seconde, arrondis sans dérive sur toute la durée
+        delai = round((self.images + 1) * 100 / self.fps) - round(self.images * 100 / self.fps)
+        controle = b"\x21\xf9\x04\x04" + struct.pack("<H", delai) + b"\x00\x00"
+        self.fichier.write(controle + decouper_gif(donnees))
+        self.images += 1
+
+    def fermer(self):
+        self.fichier.write(b"\x3b")
+        self.fichier.close()
+
+
+class Exportateur:
+    """
+    Rend images images de simulation à fps images par seconde de temps
+    simulé et les encode en parallèle.
+
+    La scène dessine directement dans une surface RGB du réservoir
+    (self.ecran est remplacé à chaque image); l'encodeur la lit sans copie
+    par pygame.surfarray.pixels3d puis la rend au réservoir. Le rendu attend
+    une surface libre: au plus en_vol images existent à la fois.
+    """
+
+    def __init__(self, simulation, sortie, format="png", fps=60, travailleurs=None, niveau=3, en_vol=None):
+        if format == "gif" and Image is None:
+            raise RuntimeError("l'export GIF nécessite Pillow (pip install pillow)")
+        self.simulation = simulation
+        self.sortie = sortie
+        self.format = format
+        self.fps = fps
+        self.niveau = niveau
+        self.travailleurs = travailleurs or os.cpu_count() or 1
+
+        # Aucun pas de physique abandonné, même à faible fps
+        boucle = simulation.boucle
+        boucle.pas_max = max(boucle.pas_max, math.ceil(1 / (fps * boucle.pas)) + 1)
+
+        largeur, hauteur = simulation.ecran.get_size()
+        self.libres = queue.Queue()
+        for _ in range(en_vol or 2 * self.travailleurs):
+            self.libres.put(pygame.Surface((largeur, hauteur), 0, 24, MASQUES_RGB))
+
+        if format == "gif":
+            self.gif = EcrivainGIF(sortie, largeur, hauteur, fps)
+        else:
+            self.gif = None
+            os.makedirs(sortie, exist_ok=True)
+
+    def encoder(self, surface, numero):
+        """Thread d'encodage: lit la surface sans copie puis la rend au réservoir"""
+        try:
+            pixels = pygame.surfarray.pixels3d(surface)  # Verrouille la surface
+            try:
+                if self.gif is not None:
+                    return encoder_gif(pixels)
+                donnees = encoder_png(pixels, self.niveau)
+            finally:
+                del pixels
+            with open(os.path.join(self.sortie, f"image_{numero:06d}.png"), "wb") as fichier:
+                fichier.write(donnees)
+            return None
+        finally:
+            self.libres.put(surface)
+
+    def terminer(self, resultat):
+        """Image encodée, dans l'ordre (propage l'erreur éventuelle d'un encodeur)"""
+        donnees = resultat.result()
+        if self.gif is not None:
+            self.gif.ajouter(donnees)
+
+    def exporter(self, images):
+        """Rend et encode images images; retourne la durée (s) de l'export"""
+        simulation = self.simulation
+        ecran = simulation.ecran
+        debut = time.perf_counter()
+        en_cours = deque()
+
+        with ThreadPoolExecutor(self.travailleurs, thread_name_prefix="encodeur") as encodeurs:
+            try:
+                for numero in range(images):
+                    surface = self.libres.get()
+                    simulation.ecran = surface
+                    simulation.avancer_physique(1 / self.fps)
+                    simulation.rendre_image()
+                    en_cours.append(encodeurs.submit(self.encoder, surface, numero))
+
+                    # Les images terminées sont écrites dans l'ordre; les résultats
+                    # en attente ne s'accumulent pas derrière une image lente
+                    while en_cours and (en_cours[0].done() or len(en_cours) > 2 * self.travailleurs):
+                        self.terminer(en_cours.popleft())
+
+                    if (numero + 1) % (10 * self.fps) == 0:
+                        print(f"{(numero + 1) / self.fps:.0f}s exportées "
+                              f"({time.perf_counter() - debut:.1f}s écoulées)")
+
+                while en_cours:
+                    self.terminer(en_cours.popleft())
+            finally:
+                simulation.ecran = ecran
+                for resultat in en_cours:
+                    resultat.cancel()
+                if self.gif is not None:
+                    self.gif.fermer()
+
+        return time.perf_counter() - debut
+
+
+def main():
+    parser = analyseur("Export sans fenêtre d'une simulation en PNG ou GIF animé")
+    parser.add_argument("scene", choices=SCENES, help="simulation à exporter")
+    parser.add_argument("sortie", help="dossier des images PNG, ou fichier .gif")
+    parser.add_argument("-d", "--duree", type=float, default=10.0, help="durée exportée (secondes)")
+    parser.add_argument("--fps", type=int, help=f"images par seconde (60 en PNG, 25 en GIF, au plus {FPS_GIF_MAX})")
+    parser.add_argument("--format", choices=("png", "gif"),
+                        help="png ou gif (par défaut d'après l'extension de la sortie)")
+    parser.add_argument("--mode", help="mode d'affichage ou d'analyse de la scène")
+    parser.add_argument("--vitesse", type=float, default=1.0, help="vitesse de simulation")
+    parser.add_argument("-j", "--travailleurs", type=int, help="threads d'encodage (un par cœur par défaut)")
+    parser.add_argument("--niveau", type=int, default=3, choices=range(10), metavar="0-9",
+                        help="compression zlib des PNG")
+    args = parser.parse_args()
+
+    format_sortie = args.format or ("gif" if args.sortie.lower().endswith(".gif") else "png")
+    fps = args.fps or (25 if format_sortie == "gif" else 60)
+    if format_sortie == "gif" and Image is None:
+        parser.error("l'export GIF nécessite Pillow (pip install pillow)")
+    if format_sortie == "gif" and fps > FPS_GIF_MAX:
+        parser.error(f"un GIF ne dépasse pas {FPS_GIF_MAX} images par seconde")
+
+    module, classe, _ = SCENES[args.scene]
+    simulation = preparer(getattr(importlib.import_module(module), classe)(), args)
+    simulation.simulation_active = True
+    simulation.vitesse_simulation = args.vitesse
+    if args.mode:
+        attribut = "mode_analyse" if hasattr(simulation, "mode_analyse") else "mode_affichage"
+        setattr(simulation, attribut, args.mode)
+
+    images = round(args.duree * fps)
+    exportateur = Exportateur(simulation, args.sortie, format_sortie, fps, args.travailleurs, args.niveau)
+    duree = exportateur.exporter(images)
+    print(f"{images} images ({args.duree:g}s à {fps} FPS) exportées en {duree:.1f}s: "
+          f"{images / duree:.0f} images/s, {args.duree / duree:.1f}x le temps réel "
+          f"({exportateur.travailleurs} encodeurs) -> {args.sortie}")
+
+    simulation.fermer()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -5,142 +5,141 @@ Simulation interactive avec analyse des instants
 """
 
 import pygame
-import sys
 import math
 import random
 
-# Initialisation de Pygame
-pygame.init()
+import numpy as np
+
+from boucle import PAS_SIMULATION
+from fondstatique import CoucheStatique
+from historique import HistoriqueCirculaire
+from noyau import (BLANC, BLEU, CYAN, GRIS, GRIS_CLAIR, NOIR, ORANGE, ROUGE, VERT, VIOLET,
+                   SimulationPygame, analyseur, preparer)
+from particules import SystemeParticules
 
 # Constantes
 LARGEUR = 1400
 HAUTEUR = 900
-FPS = 60
 
-# Couleurs
-BLANC = (255, 255, 255)
-NOIR = (0, 0, 0)
-ROUGE = (255, 0, 0)
-VERT = (0, 255, 0)
-BLEU = (0, 0, 255)
-GRIS = (128, 128, 128)
-GRIS_CLAIR = (200, 200, 200)
-JAUNE = (255, 255, 0)
-ORANGE = (255, 165, 0)
-VIOLET = (128, 0, 128)
-CYAN = (0, 255, 255)
-ROSE = (255, 192, 203)
+# Tailles des graphiques d'analyse (pixels)
+TAILLE_GRILLE_INSTANTS = (800, 200)
+TAILLE_GRAPHE_DERIVEE = (300, 150)
+
+# Densité de probabilité du mode quantique
+ECHANTILLONS_QUANTIQUES = 100_000  # Tirages par image
+INCERTITUDE = 20.0                 # Écart-type de la position (px)
+INCERTITUDE_VERTICALE = 8.0        # Étalement autour de la ligne de vol (px)
+DECROISSANCE_DENSITE = 0.85        # Part de l'histogramme gardée d'une image à l'autre
+CELLULE_QUANTIQUE = 2              # Côté d'une case de l'histogramme (px)
+ZONE_QUANTIQUE = (100, 80, 800, 160)  # x, y (depuis la ligne de vol), largeur, hauteur
 
-class FlecheVolSimulation:
+class FlecheVolSimulation(SimulationPygame):
+    # État interpolé entre deux pas de physique pour l'affichage
+    ATTRIBUTS_INTERPOLES = ("position_fleche", "temps")
+    # État écrit à chaque pas par l'enregistreur et restauré en relecture
+    ATTRIBUTS_ENREGISTRES = ("temps", "position_fleche", "vitesse_fleche")
+    
     def __init__(self):
-        self.ecran = pygame.display.set_mode((LARGEUR, HAUTEUR))
-        pygame.display.set_caption("🏹 Paradoxe de la Flèche en Vol - Zénon d'Élée")
-        self.horloge = pygame.time.Clock()
-        
-        # Polices
-        self.font_petit = pygame.font.Font(None, 18)
-        self.font = pygame.font.Font(None, 24)
-        self.font_titre = pygame.font.Font(None, 36)
-        self.font_grand = pygame.font.Font(None, 48)
-        
-        # Paramètres de simulation
+        super().__init__("🏹 Paradoxe de la Flèche en Vol - Zénon d'Élée", LARGEUR, HAUTEUR)
+        
+        # Couches statiques de la scène et des graphiques d'analyse
+        self.fond_scene = CoucheStatique(self.construire_scene)
+        self.grille_instants = CoucheStatique(self.construire_grille_instants)
+        self.graphe_derivee = CoucheStatique(self.construire_graphe_derivee)
+        
+        # Analyse quantique: histogramme des tirages, rendu en carte de chaleur
+        self.generateur = np.random.default_rng()
+        _, _, largeur_zone, hauteur_zone = ZONE_QUANTIQUE
+        self.surface_quantique = pygame.Surface((largeur_zone // CELLULE_QUANTIQUE,
+                                                 hauteur_zone // CELLULE_QUANTIQUE))
+        self.surface_quantique_echelle = pygame.Surface((largeur_zone, hauteur_zone))
+        self.densite_quantique = np.zeros(self.surface_quantique.get_size())
+        
+        # Paramètres de simulation (physique à pas fixe)
         self.reset_simulation()
         
         # Interface
-        self.simulation_active = False
-        self.vitesse_simulation = 1.0
         self.mode_analyse = "continu"  # "continu", "instants", "derivee", "quantique"
         self.delta_t_actuel = 0.1
         self.deltas_disponibles = [1.0, 0.5, 0.1, 0.05, 0.01, 0.001]
         self.index_delta = 2
         
         # Effets visuels
-        self.particules_fleche = []
+        self.particules_fleche = SystemeParticules(capacite=64, decroissance_taille=0.99)
         self.trail_fleche = []
         self.instant_fige = False
         self.temps_gel = 0.0
-        
-        # Analyse quantique
-        self.positions_quantiques = []
         self.incertitude_active = False
         
     def reset_simulation(self):
-        """Remet à zéro la simulation"""
+        """Remet à zéro la simulation (en relecture: retour au début)"""
+        self.boucle.oublier()
+        self.arreter_enregistrement()
         self.position_fleche = 0.0
         self.position_cible = 800.0  # 800 pixels = 80m
         self.vitesse_fleche = 120.0  # 120 pixels/seconde = 12 m/s
         self.temps = 0.0
-        self.historique_positions = []
-        self.historique_temps = []
-        self.historique_vitesses = []
+        self.historique = HistoriqueCirculaire(("temps", "position", "vitesse"))
         self.vol_termine = False
-        self.particules_fleche = []
+        self.particules_fleche = SystemeParticules(capacite=64, decroissance_taille=0.99)
         self.trail_fleche = []
         self.instant_analyse = 0
-        self.positions_quantiques = []
+        self.densite_quantique.fill(0.0)
+        
+        if self.relecture is not None:
+            self.relecture.chercher(self, self.relecture.debut)
         
     def ajouter_particule_fleche(self):
         """Ajoute des particules de trainée pour la flèche"""
         if len(self.particules_fleche) < 50:
-            particule = {
-                'x': 100 + self.position_fleche + random.uniform(-5, 5),
-                'y': HAUTEUR//2 + random.uniform(-3, 3),
-                'vx': random.uniform(-20, -10),
-                'vy': random.uniform(-10, 10),
-                'vie': 1.0,
-                'taille': random.uniform(1, 3)
-            }
-            self.particules_fleche.append(particule)
+            self.particules_fleche.emettre(1, 100 + self.position_fleche, HAUTEUR//2,
+                                           dispersion=(5, 3), vx=(-20, -10), vy=(-10, 10),
+                                           taille=(1, 3), couleurs=(ORANGE,))
     
     def mettre_a_jour_particules(self, dt):
         """Met à jour les particules d'effet"""
-        for particule in self.particules_fleche[:]:
-            particule['x'] += particule['vx'] * dt
-            particule['y'] += particule['vy'] * dt
-            particule['vie'] -= dt * 2
-            particule['taille'] *= 0.99
-            if particule['vie'] <= 0:
-                self.particules_fleche.remove(particule)
+        self.particules_fleche.mettre_a_jour(dt)
     
     def dessiner_particules(self):
         """Dessine les particules d'effet"""
-        for particule in self.particules_fleche:
-            alpha = int(particule['vie'] * 255)
-            couleur = ORANGE
-            rayon = max(1, int(particule['taille']))
-            pygame.draw.circle(self.ecran, couleur, 
-                             (int(particule['x']), int(particule['y'])), rayon)
+        self.particules_fleche.dessiner(self.ecran)
     
-    def dessiner_scene(self):
-        """Dessine la scène de tir (arc, flèche, cible)"""
+    def construire_scene(self, surface):
+        """Dessine les éléments fixes de la scène de tir (ligne de vol, arc, cible)"""
         y_vol = HAUTEUR // 2
+        surface.fill(BLANC)
         
         # Ligne de vol
-        pygame.draw.line(self.ecran, GRIS_CLAIR, (100, y_vol), (900, y_vol), 2)
+        pygame.draw.line(surface, GRIS_CLAIR, (100, y_vol), (900, y_vol), 2)
         
         # Arc (position de départ)
         arc_x = 80
-        pygame.draw.arc(self.ecran, NOIR, (arc_x - 15, y_vol - 30, 30, 60), 
+        pygame.draw.arc(surface, NOIR, (arc_x - 15, y_vol - 30, 30, 60), 
                        math.pi * 0.2, math.pi * 1.8, 3)
         # Corde d'arc
-        pygame.draw.line(self.ecran, NOIR, (arc_x - 10, y_vol - 25), (arc_x - 10, y_vol + 25), 2)
+        pygame.draw.line(surface, NOIR, (arc_x - 10, y_vol - 25), (arc_x - 10, y_vol + 25), 2)
         
         # Cible (cercles concentriques)
         cible_x = 100 + self.position_cible
         for i, (rayon, couleur) in enumerate([(30, ROUGE), (20, BLANC), (10, ROUGE)]):
-            pygame.draw.circle(self.ecran, couleur, (int(cible_x), y_vol), rayon)
-            pygame.draw.circle(self.ecran, NOIR, (int(cible_x), y_vol), rayon, 2)
+            pygame.draw.circle(surface, couleur, (int(cible_x), y_vol), rayon)
+            pygame.draw.circle(surface, NOIR, (int(cible_x), y_vol), rayon, 2)
         
         # Centre de la cible
-        pygame.draw.circle(self.ecran, NOIR, (int(cible_x), y_vol), 3)
+        pygame.draw.circle(surface, NOIR, (int(cible_x), y_vol), 3)
         
         # Marqueurs de distance
         for i in range(0, 900, 100):
             x = 100 + i
-            pygame.draw.line(self.ecran, GRIS, (x, y_vol - 5), (x, y_vol + 5), 1)
+            pygame.draw.line(surface, GRIS, (x, y_vol - 5), (x, y_vol + 5), 1)
             distance_m = i // 10  # 1m = 10 pixels
             texte = self.font_petit.render(f"{distance_m}m", True, GRIS)
-            self.ecran.blit(texte, (x - 8, y_vol + 10))
+            surface.blit(texte, (x - 8, y_vol + 10))
+    
+    def dessiner_scene(self):
+        """Dessine la scène de tir (arc, flèche, cible)"""
+        # Fond pré-rendu (reconstruit seulement si la cible change de place)
+        self.fond_scene.blit(self.ecran, cle=(self.position_cible,))
     
     def dessiner_fleche(self):
         """Dessine la flèche avec détails"""
@@ -179,12 +178,45 @@ class FlecheVolSimulation:
         # Vitesse instantanée (vecteur)
         if self.mode_analyse == "derivee":
             vitesse_scale = self.vitesse_fleche / 4
-            pygame.draw.arrow(self.ecran, BLEU, 
-                            (x_fleche, y_vol - 15), 
-                            (x_fleche + vitesse_scale, y_vol - 15), 2)
-            texte_v = self.font_petit.render(f"v = {self.vitesse_fleche:.1f} px/s", True, BLEU)
+            # pygame n'a pas de draw.arrow: ligne + pointe
+            x_pointe = x_fleche + vitesse_scale
+            pygame.draw.line(self.ecran, BLEU, 
+                           (x_fleche, y_vol - 15), 
+                           (x_pointe, y_vol - 15), 2)
+            pygame.draw.polygon(self.ecran, BLEU, [
+                (x_pointe, y_vol - 15),
+                (x_pointe - 6, y_vol - 19),
+                (x_pointe - 6, y_vol - 11)
+            ])
+            texte_v = self.textes.rendre(self.font_petit, f"v = {self.vitesse_fleche:.1f} px/s", BLEU)
             self.ecran.blit(texte_v, (x_fleche - 30, y_vol - 35))
     
+    def nombre_instants(self):
+        """Nombre d'instants affichés sur la grille (3 premières secondes)"""
+        return min(10, int(3.0 / self.delta_t_actuel))
+    
+    def ordonnee_instant(self, temps_instant):
+        """Ordonnée, dans la grille, de la position de la flèche à temps_instant"""
+        pos_instant = self.vitesse_fleche * temps_instant
+        return 10 + (pos_instant / self.position_cible) * 180
+    
+    def construire_grille_instants(self, surface):
+        """Dessine la grille temporelle et les positions de la flèche aux instants discrets"""
+        largeur, hauteur = surface.get_size()
+        surface.fill(BLANC)
+        pygame.draw.rect(surface, NOIR, (0, 0, largeur, hauteur), 2)
+        
+        for i in range(self.nombre_instants()):
+            temps_instant = i * self.delta_t_actuel
+            x_instant = (temps_instant / 3.0) * largeur
+            
+            # Ligne verticale pour l'instant
+            pygame.draw.line(surface, GRIS, (x_instant, 0), (x_instant, hauteur), 1)
+            
+            # Position de la flèche à cet instant
+            y_position = self.ordonnee_instant(temps_instant)
+            pygame.draw.circle(surface, GRIS, (int(x_instant), int(y_position)), 4)
+    
     def dessiner_analyse_instants(self):
         """Dessine l'analyse par instants discrets"""
         if self.mode_analyse != "instants":
@@ -193,40 +225,31 @@ class FlecheVolSimulation:
         y_start = 600
         
         # Titre
-        titre = self.font_titre.render(f"Analyse par Instants (Δt = {self.delta_t_actuel}s)", True, VIOLET)
+        titre = self.textes.rendre(self.font_titre, f"Analyse par Instants (Δt = {self.delta_t_actuel}s)", VIOLET)
         self.ecran.blit(titre, (50, y_start))
         
-        # Grille temporelle
-        pygame.draw.rect(self.ecran, BLANC, (50, y_start + 40, 800, 200))
-        pygame.draw.rect(self.ecran, NOIR, (50, y_start + 40, 800, 200), 2)
+        # Grille, lignes des instants et positions: pré-rendues pour ce Δt
+        self.grille_instants.blit(self.ecran, (50, y_start + 40), taille=TAILLE_GRILLE_INSTANTS,
+                                  cle=(self.delta_t_actuel, self.vitesse_fleche, self.position_cible))
         
-        # Instants discrets
-        nb_instants = min(10, int(3.0 / self.delta_t_actuel))
-        for i in range(nb_instants):
+        # Instant courant en surbrillance et étiquettes
+        for i in range(self.nombre_instants()):
             temps_instant = i * self.delta_t_actuel
             x_instant = 50 + (temps_instant / 3.0) * 800
             
-            # Ligne verticale pour l'instant
-            pygame.draw.line(self.ecran, GRIS, 
-                           (x_instant, y_start + 40), 
-                           (x_instant, y_start + 240), 1)
-            
-            # Position de la flèche à cet instant
-            pos_instant = self.vitesse_fleche * temps_instant
-            y_position = y_start + 50 + (pos_instant / self.position_cible) * 180
-            
-            # Point de position
             couleur = ROUGE if abs(temps_instant - self.temps) < self.delta_t_actuel/2 else GRIS
-            pygame.draw.circle(self.ecran, couleur, (int(x_instant), int(y_position)), 4)
+            if couleur == ROUGE:
+                y_position = y_start + 40 + self.ordonnee_instant(temps_instant)
+                pygame.draw.circle(self.ecran, ROUGE, (int(x_instant), int(y_position)), 4)
             
             # Étiquette temps
-            texte_t = self.font_petit.render(f"{temps_instant:.3f}s", True, couleur)
+            texte_t = self.textes.rendre(self.font_petit, f"{temps_instant:.3f}s", couleur)
             self.ecran.blit(texte_t, (x_instant - 20, y_start + 245))
         
         # Légendes
-        texte_pos = self.font_petit.render("Position", True, NOIR)
+        texte_pos = self.textes.rendre(self.font_petit, "Position", NOIR)
         self.ecran.blit(texte_pos, (10, y_start + 140))
-        texte_temps = self.font_petit.render("Temps →", True, NOIR)
+        texte_temps = self.textes.rendre(self.font_petit, "Temps →", NOIR)
         self.ecran.blit(texte_temps, (450, y_start + 250))
         
         # Analyse de l'instant actuel
@@ -241,9 +264,31 @@ class FlecheVolSimulation:
         
         for i, info in enumerate(infos_instant):
             couleur = VIOLET if i == 4 else NOIR
-            texte = self.font.render(info, True, couleur)
+            texte = self.textes.rendre(self.font, info, couleur)
             self.ecran.blit(texte, (900, y_start + 50 + i * 25))
     
+    def construire_graphe_derivee(self, surface):
+        """Dessine le cadre, les graduations (1 s) et la courbe position(temps) sur 10 s"""
+        graph_w, graph_h = surface.get_size()
+        surface.fill(BLANC)
+        
+        for seconde in range(1, 10):
+            x = seconde * graph_w / 10
+            pygame.draw.line(surface, GRIS_CLAIR, (x, graph_h - 6), (x, graph_h), 1)
+        
+        # Courbe position(temps)
+        points = []
+        for i in range(graph_w):
+            t = (i / graph_w) * 10  # 10 secondes max
+            x = self.vitesse_fleche * t
+            y_point = graph_h - (x / 1200) * graph_h  # Normalisation
+            points.append((i, y_point))
+        
+        if len(points) > 1:
+            pygame.draw.lines(surface, BLEU, False, points, 2)
+        
+        pygame.draw.rect(surface, NOIR, (0, 0, graph_w, graph_h), 2)
+    
     def dessiner_analyse_derivee(self):
         """Dessine l'analyse par dérivées"""
         if self.mode_analyse != "derivee":
@@ -252,7 +297,7 @@ class FlecheVolSimulation:
         y_start = 600
         
         # Titre
-        titre = self.font_titre.render("Analyse par Calcul Différentiel", True, BLEU)
+        titre = self.textes.rendre(self.font_titre, "Analyse par Calcul Différentiel", BLEU)
         self.ecran.blit(titre, (50, y_start))
         
         # Fonction position
@@ -272,26 +317,16 @@ class FlecheVolSimulation:
         for i, info in enumerate(infos_derivee):
             if info:
                 couleur = BLEU if "💡" in info else NOIR
-                texte = self.font.render(info, True, couleur)
+                texte = self.textes.rendre(self.font, info, couleur)
                 self.ecran.blit(texte, (50, y_start + 40 + i * 25))
         
         # Graphique de la fonction position
         graph_x, graph_y = 700, y_start + 50
-        graph_w, graph_h = 300, 150
-        
-        pygame.draw.rect(self.ecran, BLANC, (graph_x, graph_y, graph_w, graph_h))
-        pygame.draw.rect(self.ecran, NOIR, (graph_x, graph_y, graph_w, graph_h), 2)
+        graph_w, graph_h = TAILLE_GRAPHE_DERIVEE
         
-        # Courbe position(temps)
-        points = []
-        for i in range(graph_w):
-            t = (i / graph_w) * 10  # 10 secondes max
-            x = self.vitesse_fleche * t
-            y_point = graph_y + graph_h - (x / 1200) * graph_h  # Normalisation
-            points.append((graph_x + i, y_point))
-        
-        if len(points) > 1:
-            pygame.draw.lines(self.ecran, BLEU, False, points, 2)
+        # Cadre, graduations et courbe x(t): pré-rendus pour cette vitesse
+        self.graphe_derivee.blit(self.ecran, (graph_x, graph_y), taille=(graph_w, graph_h),
+                                 cle=(self.vitesse_fleche,))
         
         # Point actuel
         t_actuel = min(self.temps, 10)
@@ -301,36 +336,67 @@ class FlecheVolSimulation:
         
         # Tangente (dérivée)
         if t_actuel > 0:
-            slope = self.vitesse_fleche / 10 * graph_w / graph_h
+            # Pente en pixels: (v / 1200 · graph_h) par (graph_w / 10), l'axe y de l'écran descend
+            slope = self.vitesse_fleche / 1200 * graph_h / (graph_w / 10)
             x1, x2 = max(graph_x, x_point - 50), min(graph_x + graph_w, x_point + 50)
-            y1 = y_point - slope * (x_point - x1)
-            y2 = y_point + slope * (x2 - x_point)
+            y1 = y_point + slope * (x_point - x1)
+            y2 = y_point - slope * (x2 - x_point)
             pygame.draw.line(self.ecran, ROUGE, (x1, y1), (x2, y2), 2)
     
+    def accumuler_densite_quantique(self):
+        """
+        Ajoute ECHANTILLONS_QUANTIQUES positions tirées autour de la flèche à
+        l'histogramme, dont les anciennes valeurs s'estompent (DECROISSANCE_DENSITE)
+        """
+        x_zone, demi_hauteur, _, _ = ZONE_QUANTIQUE
+        colonnes, rangees = self.densite_quantique.shape
+        
+        # Tirages directement en cases (float32): une mise à l'échelle, un arrondi
+        cases = []
+        for centre, ecart_type in (((100 + self.position_fleche - x_zone), INCERTITUDE),
+                                   (demi_hauteur, INCERTITUDE_VERTICALE)):
+            tirage = self.generateur.standard_normal(ECHANTILLONS_QUANTIQUES, dtype=np.float32)
+            tirage *= ecart_type / CELLULE_QUANTIQUE
+            tirage += centre / CELLULE_QUANTIQUE
+            cases.append(np.floor(tirage, out=tirage).astype(np.intp))
+        colonne, rangee = cases
+        
+        dedans = (colonne >= 0) & (colonne < colonnes) & (rangee >= 0) & (rangee < rangees)
+        comptes = np.bincount(colonne[dedans] * rangees + rangee[dedans], minlength=colonnes * rangees)
+        
+        self.densite_quantique *= DECROISSANCE_DENSITE
+        self.densite_quantique += comptes.reshape(colonnes, rangees)
+    
+    def dessiner_densite_quantique(self):
+        """
+        Carte de chaleur de la densité, en une image: elle multiplie la scène
+        (le blanc la laisse intacte), la ligne de vol et la cible restent visibles
+        """
+        x_zone, demi_hauteur, _, _ = ZONE_QUANTIQUE
+        intensite = self.densite_quantique / max(self.densite_quantique.max(), 1.0)
+        image = np.empty((*intensite.shape, 3), dtype=np.uint8)
+        image[..., 0] = 255 * (1 - intensite)
+        image[..., 1] = 255 * (1 - 0.45 * intensite)
+        image[..., 2] = 255 * (1 - 0.1 * intensite)
+        
+        pygame.surfarray.blit_array(self.surface_quantique, image)
+        pygame.transform.scale(self.surface_quantique, self.surface_quantique_echelle.get_size(),
+                               self.surface_quantique_echelle)
+        self.ecran.blit(self.surface_quantique_echelle, (x_zone, HAUTEUR // 2 - demi_hauteur),
+                        special_flags=pygame.BLEND_MULT)
+    
     def dessiner_analyse_quantique(self):
         """Dessine l'analyse quantique (superposition)"""
         if self.mode_analyse != "quantique":
             return
         
-        y_vol = HAUTEUR // 2
-        
-        # Positions multiples de la flèche
         if self.incertitude_active:
-            for i in range(5):
-                pos_quantum = self.position_fleche + random.gauss(0, 20)  # Incertitude ±20px
-                x_quantum = 100 + pos_quantum
-                
-                if 100 <= x_quantum <= 900:
-                    # Flèche fantôme
-                    alpha = 100
-                    pygame.draw.line(self.ecran, (*CYAN, alpha), 
-                                   (x_quantum - 15, y_vol), (x_quantum, y_vol), 2)
-                    pygame.draw.circle(self.ecran, (*CYAN, alpha), 
-                                     (int(x_quantum), y_vol), 3)
+            self.accumuler_densite_quantique()
+            self.dessiner_densite_quantique()
         
         # Titre et explications
         y_start = 600
-        titre = self.font_titre.render("Analyse Quantique - Superposition", True, CYAN)
+        titre = self.textes.rendre(self.font_titre, "Analyse Quantique - Superposition", CYAN)
         self.ecran.blit(titre, (50, y_start))
         
         infos_quantum = [
@@ -341,20 +407,21 @@ class FlecheVolSimulation:
             "• Résolution: Le paradoxe disparaît dans l'incertitude",
             "",
             f"Position moyenne: {self.position_fleche:.1f} px",
-            f"Incertitude: ±20 px (principe d'Heisenberg)",
+            f"Incertitude: ±{INCERTITUDE:.0f} px (principe d'Heisenberg)",
+            f"Densité: {ECHANTILLONS_QUANTIQUES} tirages par image",
             "Appuyez sur U pour activer/désactiver l'incertitude"
         ]
         
         for i, info in enumerate(infos_quantum):
             if info:
                 couleur = CYAN if "🌌" in info or "•" in info else NOIR
-                texte = self.font.render(info, True, couleur)
+                texte = self.textes.rendre(self.font, info, couleur)
                 self.ecran.blit(texte, (50, y_start + 40 + i * 25))
     
     def dessiner_info_principale(self):
         """Dessine les informations principales"""
         # Titre
-        titre = self.font_grand.render("🏹 Paradoxe de la Flèche en Vol", True, NOIR)
+        titre = self.textes.rendre(self.font_grand, "🏹 Paradoxe de la Flèche en Vol", NOIR)
         self.ecran.blit(titre, (50, 10))
         
         # Informations de base
@@ -371,18 +438,18 @@ class FlecheVolSimulation:
             infos_base.append(f"📊 Δt actuel: {self.delta_t_actuel}s")
         
         for i, info in enumerate(infos_base):
-            texte = self.font.render(info, True, NOIR)
+            texte = self.textes.rendre(self.font, info, NOIR)
             self.ecran.blit(texte, (50, y_info + i * 25))
         
         # État du vol
         if self.position_fleche >= self.position_cible and not self.vol_termine:
-            impact = self.font_titre.render("🎯 Impact ! La flèche a atteint la cible !", True, ROUGE)
+            impact = self.textes.rendre(self.font_titre, "🎯 Impact ! La flèche a atteint la cible !", ROUGE)
             self.ecran.blit(impact, (50, y_info + len(infos_base) * 25 + 20))
             self.vol_termine = True
         
         # Paradoxe de Zénon
         y_paradoxe = 200
-        paradoxe_titre = self.font_titre.render("🤔 Paradoxe de Zénon", True, VIOLET)
+        paradoxe_titre = self.textes.rendre(self.font_titre, "🤔 Paradoxe de Zénon", VIOLET)
         self.ecran.blit(paradoxe_titre, (50, y_paradoxe))
         
         explication_zenon = [
@@ -396,30 +463,53 @@ class FlecheVolSimulation:
         
         for i, ligne in enumerate(explication_zenon):
             couleur = VIOLET if ligne.startswith("🔬") else NOIR
-            texte = self.font.render(ligne, True, couleur)
+            texte = self.textes.rendre(self.font, ligne, couleur)
             self.ecran.blit(texte, (50, y_paradoxe + 40 + i * 22))
         
         # Contrôles
         y_controles = HAUTEUR - 120
-        controles_titre = self.font_titre.render("🎮 Contrôles", True, BLEU)
+        controles_titre = self.textes.rendre(self.font_titre, "🎮 Contrôles", BLEU)
         self.ecran.blit(controles_titre, (50, y_controles - 30))
         
         controles = [
             "ESPACE: ▶️ Start/Pause    R: 🔄 Reset    M: 📊 Mode analyse",
             "↑/↓: ⚡ Vitesse simulation    +/-: 📏 Δt (mode instants)",
-            "U: 🌌 Incertitude quantique    F: ❄️ Figer instant    Q: ❌ Quitter"
+            "U: 🌌 Incertitude quantique    F: ❄️ Figer instant    ←/→: ⏩ Relecture ±5s    F3: 📈 Profilage    Q: ❌ Quitter"
         ]
         
         for i, controle in enumerate(controles):
-            texte = self.font_petit.render(controle, True, GRIS)
+            texte = self.textes.rendre(self.font_petit, controle, GRIS)
             self.ecran.blit(texte, (50, y_controles + i * 20))
+        
+        # Tête de lecture
+        if self.relecture is not None:
+            lecture = f"⏯️ Relecture: {self.relecture.temps:.1f}/{self.relecture.fin:.1f}s"
+            texte_lecture = self.textes.rendre(self.font, lecture, VIOLET)
+            self.ecran.blit(texte_lecture, (LARGEUR - 300, y_controles))
     
-    def mettre_a_jour_simulation(self):
-        """Met à jour la simulation"""
+    def memoriser_historique(self):
+        """Ajoute l'état courant à l'historique et au trail, au plus tous les 0.05 s simulés"""
+        if len(self.historique) == 0 or self.temps - self.historique.dernier("temps") >= 0.05:
+            self.historique.ajouter(self.temps, self.position_fleche, self.vitesse_fleche)
+            self.trail_fleche.append(self.position_fleche)
+            
+            # Limiter la longueur du trail
+            if len(self.trail_fleche) > 20:
+                self.trail_fleche.pop(0)
+    
+    def mettre_a_jour_simulation(self, pas=PAS_SIMULATION):
+        """Avance la simulation d'un pas de physique (pas en secondes réelles)"""
         if not self.simulation_active or self.instant_fige:
             return
         
-        dt = 1/60 * self.vitesse_simulation
+        dt = pas * self.vitesse_simulation
+        
+        if self.relecture is not None:
+            # Relecture: l'état vient du fichier, rien n'est recalculé
+            self.relecture.avancer(self, dt)
+            self.memoriser_historique()
+            self.mettre_a_jour_particules(dt)
+            return
         
         if self.position_fleche < self.position_cible:
             # Mise à jour position
@@ -427,15 +517,7 @@ class FlecheVolSimulation:
             self.temps += dt
             
             # Historique
-            if len(self.historique_temps) == 0 or self.temps - self.historique_temps[-1] >= 0.05:
-                self.historique_positions.append(self.position_fleche)
-                self.historique_temps.append(self.temps)
-                self.historique_vitesses.append(self.vitesse_fleche)
-                self.trail_fleche.append(self.position_fleche)
-                
-                # Limiter la longueur du trail
-                if len(self.trail_fleche) > 20:
-                    self.trail_fleche.pop(0)
+            self.memoriser_historique()
             
             # Effets visuels
             if random.random() < 0.3:  # 30% de chance
@@ -450,98 +532,70 @@ class FlecheVolSimulation:
             if self.temps_gel > 2.0:  # 2 secondes de gel
                 self.instant_fige = False
                 self.temps_gel = 0.0
-    
-    def gerer_evenements(self):
-        """Gère les événements utilisateur"""
-        for evenement in pygame.event.get():
-            if evenement.type == pygame.QUIT:
-                return False
-            
-            elif evenement.type == pygame.KEYDOWN:
-                if evenement.key == pygame.K_SPACE:
-                    self.simulation_active = not self.simulation_active
-                
-                elif evenement.key == pygame.K_r:
-                    self.reset_simulation()
-                    self.simulation_active = False
-                
-                elif evenement.key == pygame.K_m:
-                    modes = ["continu", "instants", "derivee", "quantique"]
-                    current_index = modes.index(self.mode_analyse)
-                    self.mode_analyse = modes[(current_index + 1) % len(modes)]
-                
-                elif evenement.key == pygame.K_UP:
-                    self.vitesse_simulation = min(3.0, self.vitesse_simulation + 0.2)
-                
-                elif evenement.key == pygame.K_DOWN:
-                    self.vitesse_simulation = max(0.1, self.vitesse_simulation - 0.2)
-                
-                elif evenement.key == pygame.K_PLUS or evenement.key == pygame.K_EQUALS:
-                    if self.index_delta > 0:
-                        self.index_delta -= 1
-                        self.delta_t_actuel = self.deltas_disponibles[self.index_delta]
-                
-                elif evenement.key == pygame.K_MINUS:
-                    if self.index_delta < len(self.deltas_disponibles) - 1:
-                        self.index_delta += 1
-                        self.delta_t_actuel = self.deltas_disponibles[self.index_delta]
-                
-                elif evenement.key == pygame.K_u:
-                    self.incertitude_active = not self.incertitude_active
-                
-                elif evenement.key == pygame.K_f:
-                    self.instant_fige = not self.instant_fige
-                    if self.instant_fige:
-                        self.temps_gel = 0.0
-                
-                elif evenement.key == pygame.K_q:
-                    return False
-        
-        return True
-    
-    def executer(self):
-        """Boucle principale"""
-        en_cours = True
         
-        while en_cours:
-            en_cours = self.gerer_evenements()
-            
-            # Mise à jour
-            self.mettre_a_jour_simulation()
-            
-            # Rendu
-            self.ecran.fill(BLANC)
-            
-            # Dessiner tous les éléments
-            self.dessiner_scene()
-            self.dessiner_particules()
-            self.dessiner_fleche()
-            self.dessiner_info_principale()
-            
-            # Analyses spécifiques selon le mode
-            if self.mode_analyse == "instants":
-                self.dessiner_analyse_instants()
-            elif self.mode_analyse == "derivee":
-                self.dessiner_analyse_derivee()
-            elif self.mode_analyse == "quantique":
-                self.dessiner_analyse_quantique()
-            
-            # Effet de gel temporel
+        if self.enregistreur is not None:
+            self.enregistreur.ajouter_etat(self)
+    
+    def gerer_touche(self, touche):
+        """Touches propres à la simulation (les autres: SimulationPygame)"""
+        if touche == pygame.K_m:
+            modes = ["continu", "instants", "derivee", "quantique"]
+            current_index = modes.index(self.mode_analyse)
+            self.mode_analyse = modes[(current_index + 1) % len(modes)]
+        
+        elif touche == pygame.K_PLUS or touche == pygame.K_EQUALS:
+            if self.index_delta > 0:
+                self.index_delta -= 1
+                self.delta_t_actuel = self.deltas_disponibles[self.index_delta]
+        
+        elif touche == pygame.K_MINUS:
+            if self.index_delta < len(self.deltas_disponibles) - 1:
+                self.index_delta += 1
+                self.delta_t_actuel = self.deltas_disponibles[self.index_delta]
+        
+        elif touche == pygame.K_u:
+            self.incertitude_active = not self.incertitude_active
+        
+        elif touche == pygame.K_f:
+            self.instant_fige = not self.instant_fige
             if self.instant_fige:
-                overlay = pygame.Surface((LARGEUR, HAUTEUR))
-                overlay.set_alpha(100)
-                overlay.fill(BLEU)
-                self.ecran.blit(overlay, (0, 0))
-                
-                texte_gel = self.font_titre.render("❄️ INSTANT FIGÉ", True, BLANC)
-                self.ecran.blit(texte_gel, (LARGEUR//2 - 100, HAUTEUR//2))
-            
-            pygame.display.flip()
-            self.horloge.tick(FPS)
+                self.temps_gel = 0.0
+        
+        else:
+            super().gerer_touche(touche)
+    
+    def dessiner(self):
+        """Dessine une image complète de la simulation"""
+        # Rendu: la scène commence par le fond pré-rendu
+        self.dessiner_scene()
+        self.dessiner_particules()
+        self.dessiner_fleche()
+        self.dessiner_info_principale()
+        
+        # Analyses spécifiques selon le mode
+        if self.mode_analyse == "instants":
+            self.dessiner_analyse_instants()
+        elif self.mode_analyse == "derivee":
+            self.dessiner_analyse_derivee()
+        elif self.mode_analyse == "quantique":
+            self.dessiner_analyse_quantique()
         
-        pygame.quit()
-        sys.exit()
+        # Effet de gel temporel
+        if self.instant_fige:
+            self.dessiner_gel()
+    
+    def dessiner_gel(self):
+        """Dessine le voile de l'instant figé"""
+        overlay = pygame.Surface((LARGEUR, HAUTEUR))
+        overlay.set_alpha(100)
+        overlay.fill(BLEU)
+        self.ecran.blit(overlay, (0, 0))
+        
+        texte_gel = self.textes.rendre(self.font_titre, "❄️ INSTANT FIGÉ", BLANC)
+        self.ecran.blit(texte_gel, (LARGEUR//2 - 100, HAUTEUR//2))
 
 if __name__ == "__main__":
-    simulation = FlecheVolSimulation()
-    simulation.executer()
\ No newline at end of file
+    args = analyseur("Paradoxe de la Flèche en Vol").parse_args()
+    
+    simulation = preparer(FlecheVolSimulation(), args)
+    simulation.executer()
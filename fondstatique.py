@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Couches statiques pré-rendues pour les simulations Pygame
+Les éléments qui ne changent pas sont dessinés une fois dans une surface
+"""
+
+import pygame
+
+
+class CoucheStatique:
+    """
+    Surface construite par la fonction dessiner(surface) et réutilisée
+    tant que la taille et la clé (paramètres dont dépend le dessin) ne changent pas.
+    """
+
+    def __init__(self, dessiner, transparente=False):
+        self.dessiner = dessiner
+        self.transparente = transparente
+        self.surface = None
+        self.cle = None
+        self.reconstructions = 0
+
+    def obtenir(self, taille, cle=()):
+        """Surface à jour pour cette taille et cette clé"""
+        cle = (tuple(taille), cle)
+        if self.surface is None or cle != self.cle:
+            drapeaux = pygame.SRCALPHA if self.transparente else 0
+            self.surface = pygame.Surface(cle[0], drapeaux)
+            self.dessiner(self.surface)
+            self.cle = cle
+            self.reconstructions += 1
+        return self.surface
+
+    def blit(self, ecran, position=(0, 0), cle=(), taille=None):
+        """Dessine la couche sur l'écran (par défaut à la taille de l'écran)"""
+        taille = taille if taille is not None else ecran.get_size()
+        ecran.blit(self.obtenir(taille, cle), position)
+
+    def invalider(self):
+        """Force la reconstruction au prochain affichage"""
+        self.surface = None
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Course à N coureurs: une foule d'Achilles poursuit une foule de tortues
+Positions et vitesses en tableaux NumPy; les premiers dépassements de
+toutes les paires sont trouvés par enveloppes (astuce de l'enveloppe
+convexe) et recherche dichotomique vectorisée, sans parcours en O(N²)
+"""
+
+import numpy as np
+
+
+def enveloppe_inferieure(origines, vitesses):
+    """
+    Enveloppe inférieure min_j(origines[j] + vitesses[j]·t) pour t >= 0.
+
+    Retourne (lignes, bornes): la droite lignes[k] est la plus basse sur
+    [bornes[k-1], bornes[k]] (avec bornes[-1] = 0 et la dernière jusqu'à +inf).
+    Tri par pente puis une passe avec pile: O(M log M).
+    """
+    # Pentes décroissantes; à pente égale seule la plus basse compte
+    ordre = np.lexsort((origines, -vitesses))
+    pile = []
+    for j in ordre.tolist():
+        a, b = origines[j], vitesses[j]
+        if pile and vitesses[pile[-1]] == b:
+            continue
+        while pile:
+            a1, b1 = origines[pile[-1]], vitesses[pile[-1]]
+            x = (a - a1) / (b1 - b)  # Croisement avec le sommet de la pile
+            if x <= 0:
+                pile.pop()  # Le sommet n'est jamais le plus bas pour t > 0
+                continue
+            if len(pile) >= 2:
+                a0, b0 = origines[pile[-2]], vitesses[pile[-2]]
+                if x <= (a1 - a0) / (b0 - b1):
+                    pile.pop()  # Le sommet est masqué entre ses deux voisins
+                    continue
+            break
+        pile.append(j)
+
+    lignes = np.array(pile, dtype=np.intp)
+    a, b = origines[lignes], vitesses[lignes]
+    bornes = (a[1:] - a[:-1]) / (b[:-1] - b[1:])
+    return lignes, bornes
+
+
+def premiers_croisements(origines, vitesses, env_origines, env_vitesses, lignes, bornes):
+    """
+    Pour chaque droite q(t) = origines + vitesses·t située sous l'enveloppe
+    inférieure en t = 0, premier instant t >= 0 où elle l'atteint, et la
+    droite de l'enveloppe touchée (inf et -1 si jamais).
+
+    q - enveloppe est convexe et négative en 0: son signe aux bornes ne
+    change qu'une fois, d'où une dichotomie menée pour toutes les droites
+    à la fois (log2(nombre de bornes) évaluations vectorisées).
+    """
+    bas = np.zeros(len(origines), dtype=np.intp)
+    haut = np.full(len(origines), len(bornes), dtype=np.intp)
+
+    # Premier segment k dont la borne droite est déjà atteinte
+    while np.any(bas < haut):
+        milieu = (bas + haut) // 2
+        actif = bas < haut
+        t = bornes[np.minimum(milieu, len(bornes) - 1)]
+        ligne = lignes[np.minimum(milieu, len(lignes) - 1)]
+        atteinte = origines + vitesses * t >= env_origines[ligne] + env_vitesses[ligne] * t
+        bas = np.where(actif & ~atteinte, milieu + 1, bas)
+        haut = np.where(actif & atteinte, milieu, haut)
+
+    # Croisement exact avec la droite de ce segment
+    ligne = lignes[bas]
+    rapprochement = vitesses - env_vitesses[ligne]
+    ecart = env_origines[ligne] - origines
+    possible = rapprochement > 0
+    temps = np.where(possible, ecart / np.where(possible, rapprochement, 1.0), np.inf)
+    temps = np.maximum(temps, 0.0)
+    return temps, np.where(possible, ligne, -1)
+
+
+class Foule:
+    """
+    Poursuivants (Achilles) partis derrière et meneurs (tortues) partis
+    devant, à vitesses constantes. Les positions sont recalculées à partir
+    de la forme exacte origine + vitesse·t (aucune dérive numérique).
+
+    Les départs ne se chevauchent pas (ValueError sinon): premiers_croisements
+    suppose chaque poursuivant derrière chaque meneur à t = 0.
+
+    Après construction:
+        depassement_poursuivant[i]: instant où le poursuivant i dépasse son premier meneur
+        premier_meneur[i]         : ce meneur (-1 si jamais)
+        depassement_meneur[j]     : instant où le meneur j est dépassé pour la première fois
+        premier_poursuivant[j]    : par quel poursuivant (-1 si jamais)
+    """
+
+    def __init__(self, poursuivants=10_000, meneurs=1_000, graine=None,
+                 vitesses_poursuivants=(60.0, 140.0), vitesses_meneurs=(5.0, 40.0),
+                 depart_poursuivants=(-200.0, 0.0), depart_meneurs=(100.0, 900.0)):
+        if not max(depart_poursuivants) < min(depart_meneurs):
+            raise ValueError(f"les poursuivants doivent partir derrière les meneurs: "
+                             f"départs {depart_poursuivants} et {depart_meneurs}")
+        generateur = np.random.default_rng(graine)
+        self.origine_poursuivants = generateur.uniform(*depart_poursuivants, poursuivants)
+        self.vitesse_poursuivants = generateur.uniform(*vitesses_poursuivants, poursuivants)
+        self.origine_meneurs = generateur.uniform(*depart_meneurs, meneurs)
+        self.vitesse_meneurs = generateur.uniform(*vitesses_meneurs, meneurs)
+        self.calculer_depassements()
+        self.placer(0.0)
+
+    def __len__(self):
+        return len(self.origine_poursuivants) + len(self.origine_meneurs)
+
+    def calculer_depassements(self):
+        """Premiers dépassements pour chaque poursuivant et chaque meneur"""
+        # Poursuivant i contre le meneur le plus en retard à chaque instant
+        lignes, bornes = enveloppe_inferieure(self.origine_meneurs, self.vitesse_meneurs)
+        self.depassement_poursuivant, self.premier_meneur = premiers_croisements(
+            self.origine_poursuivants, self.vitesse_poursuivants,
+            self.origine_meneurs, self.vitesse_meneurs, lignes, bornes)
+
+        # Meneur j contre le poursuivant le plus avancé: enveloppe supérieure = -inférieure(-q)
+        lignes, bornes = enveloppe_inferieure(-self.origine_poursuivants, -self.vitesse_poursuivants)
+        self.depassement_meneur, self.premier_poursuivant = premiers_croisements(
+            -self.origine_meneurs, -self.vitesse_meneurs,
+            -self.origine_poursuivants, -self.vitesse_poursuivants, lignes, bornes)
+
+        self.depassements_tries = np.sort(self.depassement_poursuivant)
+
+    def placer(self, temps):
+        """Positions de tous les coureurs à l'instant temps"""
+        self.temps = temps
+        self.positions_poursuivants = self.origine_poursuivants + self.vitesse_poursuivants * temps
+        self.positions_meneurs = self.origine_meneurs + self.vitesse_meneurs * temps
+
+    def avancer(self, dt):
+        self.placer(self.temps + dt)
+
+    def depassements_passes(self):
+        """Nombre de poursuivants ayant déjà dépassé au moins un meneur"""
+        return int(np.searchsorted(self.depassements_tries, self.temps, side="right"))
+
+
+def verifier(poursuivants=300, meneurs=200, graine=0):
+    """
+    Compare avec le calcul direct en O(N·M) (petites foules), avec des départs
+    disjoints et jointifs; des départs qui se chevauchent doivent être refusés
+    """
+    try:
+        Foule(poursuivants, meneurs, graine=graine, depart_poursuivants=(0.0, 500.0))
+        return False
+    except ValueError:
+        pass
+    return (verifier_foule(Foule(poursuivants, meneurs, graine=graine))
+            and verifier_foule(Foule(poursuivants, meneurs, graine=graine,
+                                     depart_poursuivants=(-200.0, 99.9), depart_meneurs=(100.0, 300.0))))
+
+
+def verifier_foule(foule):
+    """Premiers dépassements de foule contre le calcul direct en O(N·M)"""
+    ecart = foule.origine_meneurs[None, :] - foule.origine_poursuivants[:, None]
+    rapprochement = foule.vitesse_poursuivants[:, None] - foule.vitesse_meneurs[None, :]
+    with np.errstate(divide="ignore"):
+        temps = np.where(rapprochement > 0, ecart / rapprochement, np.inf)
+    return (np.allclose(foule.depassement_poursuivant, temps.min(axis=1))
+            and np.allclose(foule.depassement_meneur, temps.min(axis=0)))
+
+
+if __name__ == "__main__":
+    import time
+
+    print(f"Vérification contre le calcul direct: {'ok' if verifier() else 'ÉCHEC'}")
+    for n in (1_000, 10_000, 100_000):
+        debut = time.perf_counter()
+        foule = Foule(n, n, graine=1)
+        duree = time.perf_counter() - debut
+        print(f"{n:>7} poursuivants x {n:>7} meneurs: premiers dépassements en {duree * 1000:.1f} ms, "
+              f"médiane {np.median(foule.depassement_poursuivant):.3f}s")
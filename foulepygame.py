@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Version graphique avec Pygame de la course à N coureurs
+Une foule d'Achilles poursuit une foule de tortues: la densité de toute la
+foule visible est dessinée en une image, et seul un échantillon des
+coureurs visibles est dessiné individuellement
+"""
+
+import pygame
+
+import numpy as np
+
+from boucle import PAS_SIMULATION
+from fondstatique import CoucheStatique
+from foule import Foule
+from noyau import (BLANC, GRIS, GRIS_CLAIR, NOIR, ORANGE, ROUGE, VERT, VERT_FONCE,
+                   SimulationPygame, analyseur, preparer)
+
+# Constantes
+LARGEUR = 1400
+HAUTEUR = 800
+
+# Piste et niveaux de détail
+PISTE_HAUT = 150
+PISTE_BAS = 650
+CELLULE = 4            # Côté d'une cellule de densité (pixels)
+ECHANTILLON_MAX = 300  # Coureurs dessinés individuellement, par foule
+
+class SimulationFoule(SimulationPygame):
+    # État interpolé entre deux pas de physique pour l'affichage
+    ATTRIBUTS_INTERPOLES = ("temps",)
+    
+    # ↑/↓: vitesse de simulation
+    VITESSE_MAX = 10.0
+    PAS_VITESSE = 0.5
+    
+    def __init__(self, poursuivants=100_000, meneurs=10_000, graine=None):
+        super().__init__("🏃‍♂️ Une foule d'Achilles - Zénon d'Élée", LARGEUR, HAUTEUR)
+        
+        # Couche statique de la piste
+        self.fond_piste = CoucheStatique(self.construire_piste)
+        
+        # Grille de densité: comptage NumPy, puis une seule image mise à l'échelle
+        self.colonnes = LARGEUR // CELLULE
+        self.rangees = (PISTE_BAS - PISTE_HAUT) // CELLULE
+        self.surface_densite = pygame.Surface((self.colonnes, self.rangees))
+        self.surface_densite_echelle = pygame.Surface((self.colonnes * CELLULE, self.rangees * CELLULE))
+        
+        # Paramètres de simulation (physique à pas fixe)
+        self.nouvelle_foule(poursuivants, meneurs, graine)
+        
+        # Interface
+        self.echelle = 1.0  # Pixels par unité de distance
+        self.afficher_densite = True
+        self.echantillon_dessine = 0
+    
+    def nouvelle_foule(self, poursuivants, meneurs, graine=None):
+        """Tire une nouvelle foule; les premiers dépassements sont calculés une fois pour toutes"""
+        self.poursuivants = poursuivants
+        self.meneurs = meneurs
+        self.foule = Foule(poursuivants, meneurs, graine=graine)
+        # Flux distinct de celui de la foule: les couloirs ne dépendent pas des départs
+        generateur = np.random.default_rng(np.random.SeedSequence(graine).spawn(1)[0])
+        self.couloir_poursuivants = generateur.uniform(PISTE_HAUT, PISTE_BAS, poursuivants)
+        self.couloir_meneurs = generateur.uniform(PISTE_HAUT, PISTE_BAS, meneurs)
+        self.reset_simulation()
+    
+    def reset_simulation(self):
+        """Remet à zéro la simulation"""
+        self.boucle.oublier()
+        self.temps = 0.0
+        self.foule.placer(0.0)
+    
+    def construire_piste(self, surface):
+        """Dessine les éléments fixes (fond, bords de piste)"""
+        surface.fill(BLANC)
+        pygame.draw.rect(surface, GRIS_CLAIR, (0, PISTE_HAUT, LARGEUR, PISTE_BAS - PISTE_HAUT), 1)
+        pygame.draw.line(surface, NOIR, (0, PISTE_HAUT - 2), (LARGEUR, PISTE_HAUT - 2), 2)
+        pygame.draw.line(surface, NOIR, (0, PISTE_BAS + 2), (LARGEUR, PISTE_BAS + 2), 2)
+    
+    def camera(self):
+        """Abscisse du monde au bord gauche de l'écran: suit le centre de la foule"""
+        centre = (self.foule.positions_poursuivants.mean() + self.foule.positions_meneurs.mean()) / 2
+        return centre - LARGEUR / 2 / self.echelle
+    
+    def visibles(self, positions, x_camera):
+        """Masque des coureurs dans le champ de la caméra"""
+        x = (positions - x_camera) * self.echelle
+        return (x >= 0) & (x < LARGEUR), x
+    
+    def dessiner_piste(self, x_camera):
+        """Fond pré-rendu et graduations qui défilent avec la caméra"""
+        self.fond_piste.blit(self.ecran)
+        
+        pas = 100 if self.echelle >= 0.5 else 1000
+        premiere = int(np.ceil(x_camera / pas)) * pas
+        for distance in range(premiere, int(x_camera + LARGEUR / self.echelle) + 1, pas):
+            x = (distance - x_camera) * self.echelle
+            pygame.draw.line(self.ecran, GRIS, (x, PISTE_BAS + 4), (x, PISTE_BAS + 14), 1)
+            texte = self.textes.rendre(self.font_petit, f"{distance // 10}m", GRIS)
+            self.ecran.blit(texte, (x - 10, PISTE_BAS + 16))
+    
+    def dessiner_densite(self, x_camera):
+        """Densité de chaque foule visible (Achilles en rouge, tortues en vert), en une image"""
+        densites = []
+        for positions, couloirs in ((self.foule.positions_poursuivants, self.couloir_poursuivants),
+                                    (self.foule.positions_meneurs, self.couloir_meneurs)):
+            visible, x = self.visibles(positions, x_camera)
+            colonne = (x[visible] // CELLULE).astype(np.intp)
+            rangee = ((couloirs[visible] - PISTE_HAUT) // CELLULE).astype(np.intp)
+            comptes = np.bincount(colonne * self.rangees + rangee, minlength=self.colonnes * self.rangees)
+            densites.append(comptes.reshape(self.colonnes, self.rangees))
+        
+        # Échelle logarithmique: quelques coureurs restent visibles à côté des amas
+        intensites = [np.log1p(d) * (200 / np.log1p(max(d.max(), 1))) for d in densites]
+        image = np.empty((self.colonnes, self.rangees, 3), dtype=np.uint8)
+        image[..., 0] = 255 - intensites[1]
+        image[..., 1] = 255 - intensites[0]
+        image[..., 2] = 255 - np.maximum(intensites[0], intensites[1])
+        
+        pygame.surfarray.blit_array(self.surface_densite, image)
+        pygame.transform.scale(self.surface_densite, self.surface_densite_echelle.get_size(),
+                               self.surface_densite_echelle)
+        self.ecran.blit(self.surface_densite_echelle, (0, PISTE_HAUT))
+    
+    def dessiner_echantillon(self, x_camera):
+        """
+        Au plus ECHANTILLON_MAX coureurs visibles par foule, dessinés un par un.
+        L'échantillon est pris à pas fixe dans les indices: il ne scintille pas.
+        """
+        rayon = int(max(2, min(6, 3 * self.echelle)))
+        self.echantillon_dessine = 0
+        foule = self.foule
+        
+        for positions, couloirs, depassements, couleurs in (
+                (foule.positions_poursuivants, self.couloir_poursuivants,
+                 foule.depassement_poursuivant, (ROUGE, ORANGE)),
+                (foule.positions_meneurs, self.couloir_meneurs,
+                 foule.depassement_meneur, (VERT, VERT_FONCE))):
+            visible, x = self.visibles(positions, x_camera)
+            indices = np.flatnonzero(visible)
+            if len(indices) > ECHANTILLON_MAX:
+                indices = indices[::-(-len(indices) // ECHANTILLON_MAX)]
+            
+            # Couleur selon que le premier dépassement a eu lieu
+            apres = depassements[indices] <= self.temps
+            for xi, yi, passe in zip(x[indices].tolist(), couloirs[indices].tolist(), apres.tolist()):
+                pygame.draw.circle(self.ecran, couleurs[passe], (int(xi), int(yi)), rayon)
+            self.echantillon_dessine += len(indices)
+    
+    def dessiner_info(self):
+        """Dessine les informations de la simulation"""
+        titre = self.textes.rendre(self.font_grand, "🏃‍♂️ Une foule d'Achilles", NOIR)
+        self.ecran.blit(titre, (50, 10))
+        
+        foule = self.foule
+        infos = [
+            f"⏱️  Temps: {self.temps:.2f}s    🎯 Vitesse simulation: {self.vitesse_simulation:.1f}x",
+            f"🏃 Achilles: {self.poursuivants}    🐢 Tortues: {self.meneurs}    "
+            f"🔍 Zoom: {self.echelle:.2f}x    Dessinés un par un: {self.echantillon_dessine}",
+            f"Achilles ayant dépassé une tortue: {foule.depassements_passes()}/{self.poursuivants}    "
+            f"Tortues dépassées: {int(np.count_nonzero(foule.depassement_meneur <= self.temps))}/{self.meneurs}",
+        ]
+        for i, info in enumerate(infos):
+            texte = self.textes.rendre(self.font, info, NOIR)
+            self.ecran.blit(texte, (50, 60 + i * 25))
+        
+        controles = ("ESPACE: ▶️ Start/Pause    R: 🔄 Reset    ↑/↓: ⚡ Vitesse    "
+                     "+/-: 🔍 Zoom    D: Densité on/off    F3: 📈 Profilage    Q: ❌ Quitter")
+        texte = self.textes.rendre(self.font_petit, controles, GRIS)
+        self.ecran.blit(texte, (50, HAUTEUR - 40))
+    
+    def mettre_a_jour_simulation(self, pas=PAS_SIMULATION):
+        """Avance la simulation d'un pas de physique (pas en secondes réelles)"""
+        if not self.simulation_active:
+            return
+        
+        # Les positions découlent du temps: elles sont calculées au dessin
+        self.temps += pas * self.vitesse_simulation
+    
+    def gerer_touche(self, touche):
+        """Touches propres à la simulation (les autres: SimulationPygame)"""
+        if touche == pygame.K_PLUS or touche == pygame.K_EQUALS:
+            self.echelle = min(16.0, self.echelle * 2)
+        
+        elif touche == pygame.K_MINUS:
+            self.echelle = max(1 / 16, self.echelle / 2)
+        
+        elif touche == pygame.K_d:
+            self.afficher_densite = not self.afficher_densite
+        
+        else:
+            super().gerer_touche(touche)
+    
+    def dessiner(self):
+        """Dessine une image complète de la simulation"""
+        self.foule.placer(self.temps)
+        x_camera = self.camera()
+        
+        self.dessiner_piste(x_camera)
+        if self.afficher_densite:
+            self.dessiner_densite(x_camera)
+        self.dessiner_echantillon(x_camera)
+        self.dessiner_info()
+
+if __name__ == "__main__":
+    parser = analyseur("Course à N coureurs", enregistrement=False)
+    parser.add_argument("-n", "--achilles", type=int, default=100_000, help="nombre d'Achilles")
+    parser.add_argument("-m", "--tortues", type=int, default=10_000, help="nombre de tortues")
+    parser.add_argument("--graine", type=int, default=None, help="graine (foule reproductible)")
+    args = parser.parse_args()
+    
+    simulation = preparer(SimulationFoule(args.achilles, args.tortues, args.graine), args)
+    simulation.executer()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Graphique incrémental pour les simulations Pygame
+La courbe est tracée dans une surface persistante: chaque nouveau point
+ajoute un segment, et la surface n'est redessinée que si l'échelle change
+"""
+
+import pygame
+
+from noyau import BLANC, NOIR
+
+
+class GraphiqueIncremental:
+    """
+    Courbe y(x) lue dans un HistoriqueCirculaire (colonnes nom_x et nom_y).
+    Les échelles doublent quand une valeur les dépasse, pour que les
+    redessins complets restent rares.
+    """
+
+    def __init__(self, largeur, hauteur, nom_x, nom_y, couleur):
+        self.largeur = largeur
+        self.hauteur = hauteur
+        self.nom_x = nom_x
+        self.nom_y = nom_y
+        self.couleur = couleur
+        self.surface = pygame.Surface((largeur, hauteur))
+        self.redessins = 0
+        self.historique = None  # Historique suivi et sa génération
+        self.generation = None
+        self.vider()
+
+    def vider(self):
+        """Efface la courbe (par exemple après un reset)"""
+        self.origine_x = 0.0
+        self.echelle_x = None
+        self.echelle_y = None
+        self.points_traces = 0
+        self.dernier_point = None
+        self._dessiner_cadre()
+
+    def _dessiner_cadre(self):
+        """Fond, bordure et axes"""
+        w, h = self.largeur, self.hauteur
+        self.surface.fill(BLANC)
+        pygame.draw.rect(self.surface, NOIR, (0, 0, w, h), 2)
+        pygame.draw.line(self.surface, NOIR, (10, h - 10), (w - 10, h - 10), 1)
+        pygame.draw.line(self.surface, NOIR, (10, 10), (10, h - 10), 1)
+
+    def _point(self, x, y):
+        """Coordonnées dans la surface d'un point de données"""
+        return (((x - self.origine_x) / self.echelle_x) * (self.largeur - 20),
+                self.hauteur - 20 - (y / self.echelle_y) * (self.hauteur - 40))
+
+    @staticmethod
+    def _echelle(echelle, valeur):
+        """Échelle doublée jusqu'à contenir valeur"""
+        if echelle is None:
+            echelle = max(abs(valeur), 1e-9)
+        while echelle < valeur:
+            echelle *= 2
+        return echelle
+
+    def mettre_a_jour(self, historique):
+        """Trace les points ajoutés à l'historique depuis le dernier appel"""
+        # Historique remplacé ou vidé (reset, relecture), même pendant que le
+        # graphique était masqué: l'ancienne courbe n'est plus valable
+        if historique is not self.historique or historique.generation != self.generation:
+            self.historique, self.generation = historique, historique.generation
+            if self.points_traces:
+                self.vider()
+
+        if len(historique) < 2:
+            if self.points_traces:
+                self.vider()
+            return
+
+        nouveaux = historique.total - self.points_traces
+        if nouveaux <= 0:
+            return
+
+        min_x = historique.minimum(self.nom_x)
+        echelle_x = self._echelle(self.echelle_x, historique.maximum(self.nom_x) - self.origine_x)
+        echelle_y = self._echelle(self.echelle_y, historique.maximum(self.nom_y))
+
+        # Les données les plus anciennes ont été écrasées: on recale l'origine
+        recalage = self.echelle_x is not None and min_x - self.origine_x > self.echelle_x / 4
+
+        if (recalage or echelle_x != self.echelle_x or echelle_y != self.echelle_y
+                or nouveaux > len(historique)):
+            if recalage:
+                self.origine_x = min_x
+                echelle_x = self._echelle(None, historique.maximum(self.nom_x) - min_x)
+            self.echelle_x, self.echelle_y = echelle_x, echelle_y
+            self._redessiner(historique)
+        else:
+            self._tracer(historique, nouveaux)
+
+        self.points_traces = historique.total
+
+    def _tracer(self, historique, nouveaux):
+        """Ajoute les segments des nouveaux points à la courbe existante"""
+        xs = historique.lignes(self.nom_x, nouveaux)
+        ys = historique.lignes(self.nom_y, nouveaux)
+        points = [self._point(x, y) for x, y in zip(xs.tolist(), ys.tolist())]
+        if self.dernier_point is not None:
+            points.insert(0, self.dernier_point)
+        if len(points) > 1:
+            pygame.draw.lines(self.surface, self.couleur, False, points, 2)
+        self.dernier_point = points[-1]
+
+    def _redessiner(self, historique):
+        """Redessine toute la courbe (changement d'échelle)"""
+        self._dessiner_cadre()
+        self.dernier_point = None
+        self._tracer(historique, len(historique))
+        self.redessins += 1
+
+    def blit(self, ecran, position):
+        ecran.blit(self.surface, position)
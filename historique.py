@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Historique borné des simulations (tampon circulaire NumPy)
+Les valeurs les plus anciennes sont écrasées, la mémoire reste constante
+"""
+
+from collections import deque
+
+import numpy as np
+
+
+class MinMaxGlissant:
+    """Minimum et maximum des capacite dernières valeurs, en temps amorti O(1)"""
+
+    def __init__(self, capacite):
+        self.capacite = capacite
+        self.maxima = deque()  # (index, valeur) décroissantes
+        self.minima = deque()  # (index, valeur) croissantes
+
+    def ajouter(self, index, valeur):
+        while self.maxima and self.maxima[-1][1] <= valeur:
+            self.maxima.pop()
+        self.maxima.append((index, valeur))
+        while self.minima and self.minima[-1][1] >= valeur:
+            self.minima.pop()
+        self.minima.append((index, valeur))
+
+        # Oubli des valeurs sorties de la fenêtre
+        limite = index - self.capacite
+        if self.maxima[0][0] <= limite:
+            self.maxima.popleft()
+        if self.minima[0][0] <= limite:
+            self.minima.popleft()
+
+    @property
+    def maximum(self):
+        return self.maxima[0][1] if self.maxima else None
+
+    @property
+    def minimum(self):
+        return self.minima[0][1] if self.minima else None
+
+    def vider(self):
+        self.maxima.clear()
+        self.minima.clear()
+
+
+class HistoriqueCirculaire:
+    """
+    Historique à colonnes nommées (par exemple temps, position, distance)
+    conservant les capacite dernières lignes. generation augmente à chaque
+    vider() (reset, déplacement en relecture): les lecteurs qui suivent
+    total savent ainsi que les lignes déjà lues ne sont plus valables.
+    """
+
+    def __init__(self, colonnes, capacite=4096):
+        self.colonnes = tuple(colonnes)
+        self.index = {nom: i for i, nom in enumerate(self.colonnes)}
+        self.capacite = capacite
+        self.donnees = np.zeros((capacite, len(self.colonnes)))
+        self.extremes = [MinMaxGlissant(capacite) for _ in self.colonnes]
+        self.total = 0  # Nombre de lignes ajoutées depuis le début
+        self.generation = 0
+
+    def __len__(self):
+        return min(self.total, self.capacite)
+
+    def ajouter(self, *valeurs):
+        """Ajoute une ligne (une valeur par colonne, dans l'ordre des colonnes)"""
+        ligne = self.total % self.capacite
+        self.donnees[ligne] = valeurs
+        for extremes, valeur in zip(self.extremes, valeurs):
+            extremes.ajouter(self.total, valeur)
+        self.total += 1
+
+    def dernier(self, nom):
+        """Dernière valeur de la colonne (None si l'historique est vide)"""
+        if self.total == 0:
+            return None
+        return self.donnees[(self.total - 1) % self.capacite, self.index[nom]]
+
+    def colonne(self, nom):
+        """Valeurs de la colonne, de la plus ancienne à la plus récente"""
+        return self.lignes(nom, len(self))
+
+    def lignes(self, nom, nombre):
+        """Les nombre dernières valeurs de la colonne, dans l'ordre"""
+        nombre = min(nombre, len(self))
+        j = self.index[nom]
+        fin = self.total % self.capacite if self.total >= self.capacite else self.total
+        debut = fin - nombre
+        if debut >= 0:
+            return self.donnees[debut:fin, j]
+        return np.concatenate((self.donnees[debut:, j], self.donnees[:fin, j]))
+
+    def minimum(self, nom):
+        return self.extremes[self.index[nom]].minimum
+
+    def maximum(self, nom):
+        return self.extremes[self.index[nom]].maximum
+
+    def vider(self):
+        self.total = 0
+        self.generation += 1
+        for extremes in self.extremes:
+            extremes.vider()
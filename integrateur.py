@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Intégrateur adaptatif de Runge-Kutta (Dormand-Prince 5(4)) avec détection
+d'événement, pour des coureurs à vitesse variable
+Les pas s'allongent là où le mouvement est régulier; entre deux pas l'état
+est interpolé (Hermite cubique), et l'instant de la rencontre est localisé
+à tol_evenement près
+"""
+
+import math
+
+import numpy as np
+
+# Tableau de Butcher de Dormand-Prince
+C = (0.0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1.0)
+A = (
+    (),
+    (1 / 5,),
+    (3 / 40, 9 / 40),
+    (44 / 45, -56 / 15, 32 / 9),
+    (19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729),
+    (9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656),
+)
+B = (35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84)
+# Différence entre les solutions d'ordre 5 et 4 (7e étage: FSAL)
+E = (71 / 57600, 0.0, -71 / 16695, 71 / 1920, -17253 / 339200, 22 / 525, -1 / 40)
+
+
+def profil_constant(vitesse):
+    """v(t) = vitesse"""
+    return lambda t: vitesse
+
+
+def profil_sprint(vitesse_max, duree=2.0):
+    """Départ arrêté: v(t) = vitesse_max·(1 - exp(-t/duree))"""
+    return lambda t: vitesse_max * -math.expm1(-t / duree)
+
+
+def profil_fatigue(vitesse_initiale, taux=0.1, vitesse_min=0.0):
+    """Fatigue: v(t) décroît exponentiellement de vitesse_initiale vers vitesse_min"""
+    return lambda t: vitesse_min + (vitesse_initiale - vitesse_min) * math.exp(-taux * t)
+
+
+PROFILS = {
+    'constant': profil_constant,
+    'sprint': profil_sprint,
+    'fatigue': profil_fatigue,
+}
+
+
+class RK45:
+    """
+    Intègre y' = f(t, y) depuis (t0, y0) par pas adaptatifs.
+
+    evenement: fonction g(t, y) facultative; l'intégration s'arrête au
+    premier instant où g passe de positif à négatif ou nul (à tol_evenement près).
+
+    pas() lève FloatingPointError si f renvoie nan ou inf, ou si le pas doit
+    descendre sous la résolution des flottants autour de t pour tenir la tolérance.
+    """
+
+    def __init__(self, f, t0, y0, rtol=1e-6, atol=1e-9, pas_max=math.inf,
+                 evenement=None, tol_evenement=1e-10):
+        self.f = f
+        self.rtol = rtol
+        self.atol = atol
+        self.pas_max = pas_max
+        self.evenement = evenement
+        self.tol_evenement = tol_evenement
+
+        self.t = t0
+        self.y = np.asarray(y0, dtype=np.float64)
+        self.dy = np.asarray(f(t0, self.y), dtype=np.float64)
+        self.evaluations = 1
+        self.pas_acceptes = 0
+        self.pas_rejetes = 0
+        self.precedent = None  # (t, y, dy) au début du dernier pas
+        self.t_evenement = None
+        self.y_evenement = None
+
+        # Premier pas: 1 % de l'échelle de y sur sa vitesse de variation
+        echelle = np.linalg.norm(self.y) + atol
+        variation = np.linalg.norm(self.dy)
+        self.h = min(pas_max, 0.01 * echelle / variation if variation > 1e-12 else 1e-3)
+
+    def _norme_erreur(self, erreur, y_nouveau):
+        tolerance = self.atol + self.rtol * np.maximum(np.abs(self.y), np.abs(y_nouveau))
+        return math.sqrt(np.mean((erreur / tolerance) ** 2))
+
+    def _etages(self, t, y, dy, h):
+        """Étages de Dormand-Prince depuis (t, y): retourne (y(t+h), k)"""
+        k = [dy]
+        for i in range(1, 6):
+            yi = y + h * sum(a * kj for a, kj in zip(A[i], k))
+            k.append(np.asarray(self.f(t + C[i] * h, yi), dtype=np.float64))
+        y_nouveau = y + h * sum(b * kj for b, kj in zip(B, k))
+        k.append(np.asarray(self.f(t + h, y_nouveau), dtype=np.float64))
+        self.evaluations += 6
+        return y_nouveau, k
+
+    def pas(self):
+        """Effectue un pas accepté (en réduisant h autant que nécessaire)"""
+        while True:
+            h = self.h
+            y_nouveau, k = self._etages(self.t, self.y, self.dy, h)
+
+            erreur = self._norme_erreur(h * sum(e * kj for e, kj in zip(E, k)), y_nouveau)
+            if not math.isfinite(erreur):
+                raise FloatingPointError(f"dérivée non finie entre t = {self.t} et t = {self.t + h}")
+            facteur = 5.0 if erreur == 0 else min(5.0, max(0.2, 0.9 * erreur ** -0.2))
+            self.h = min(self.pas_max, h * facteur)
+            if erreur <= 1.0:
+                break
+            self.pas_rejetes += 1
+            if self.h <= 16 * np.spacing(abs(self.t)):
+                raise FloatingPointError(f"pas trop petit en t = {self.t} pour la tolérance demandée")
+
+        self.precedent = (self.t, self.y, self.dy)
+        self.t, self.y, self.dy = self.t + h, y_nouveau, k[6]
+        self.pas_acceptes += 1
+
+        if self.evenement is not None:
+            self._chercher_evenement()
+
+    def interpoler(self, t):
+        """État à l'instant t du dernier pas (interpolation d'Hermite cubique)"""
+        if self.precedent is None:
+            return self.y
+        t0, y0, dy0 = self.precedent
+        h = self.t - t0
+        s = (t - t0) / h
+        s2, s3 = s * s, s * s * s
+        return ((2 * s3 - 3 * s2 + 1) * y0 + (s3 - 2 * s2 + s) * h * dy0
+                + (3 * s2 - 2 * s3) * self.y + (s3 - s2) * h * self.dy)
+
+    def _etat_exact(self, t):
+        """État à l'instant t du dernier pas, par un sous-pas de Runge-Kutta (ordre 5)"""
+        t0, y0, dy0 = self.precedent
+        return self._etages(t0, y0, dy0, t - t0)[0]
+
+    def _chercher_evenement(self):
+        """
+        Localise un changement de signe de g dans le dernier pas (regula falsi
+        Illinois). g est évalué sur des sous-pas de Runge-Kutta plutôt que sur
+        l'interpolation, pour garder la précision de l'intégrateur.
+        """
+        t_bas, t_haut = self.precedent[0], self.t
+        g_bas = self.evenement(t_bas, self.precedent[1])
+        g_haut = self.evenement(t_haut, self.y)
+        if g_bas <= 0 or g_haut > 0:
+            return
+
+        cote = 0
+        while t_haut - t_bas > self.tol_evenement:
+            t = t_haut - g_haut * (t_haut - t_bas) / (g_haut - g_bas)
+            t = min(max(t, t_bas + self.tol_evenement / 4), t_haut - self.tol_evenement / 4)
+            g = self.evenement(t, self._etat_exact(t))
+            if g > 0:
+                t_bas, g_bas = t, g
+                if cote == -1:
+                    g_haut /= 2
+                cote = -1
+            else:
+                t_haut, g_haut = t, g
+                if cote == 1:
+                    g_bas /= 2
+                cote = 1
+
+        self.t_evenement = t_haut
+        self.y_evenement = self._etat_exact(t_haut)
+
+    def avancer_jusqu_a(self, t_cible):
+        """
+        État à t_cible, ou à l'événement s'il survient avant.
+        Retourne (t, y, evenement_atteint). Les pas déjà faits au-delà de
+        t_cible servent par interpolation: aucune évaluation supplémentaire.
+        """
+        while self.t < t_cible and self.t_evenement is None:
+            self.pas()
+        if self.t_evenement is not None and self.t_evenement <= t_cible:
+            return self.t_evenement, self.y_evenement, True
+        if self.precedent is None or t_cible >= self.t:
+            return self.t, self.y, False
+        return t_cible, self.interpoler(max(t_cible, self.precedent[0])), False
+
+
+def course(profil_achille, profil_tortue, position_tortue=100.0, position_achille=0.0,
+           duree_max=1000.0, rtol=1e-8, atol=1e-10, tol_evenement=1e-10):
+    """
+    Intègre une course à vitesses v(t) et retourne un dictionnaire:
+        'temps_rattrapage', 'position_rencontre' (None si pas de rattrapage avant duree_max),
+        'evaluations', 'pas' (acceptés), 'rejets', 'temps', 'positions' (états aux pas acceptés)
+    """
+    def vitesses(t, y):
+        return (profil_achille(t), profil_tortue(t))
+
+    solveur = RK45(vitesses, 0.0, (position_achille, position_tortue), rtol=rtol, atol=atol,
+                   evenement=lambda t, y: y[1] - y[0], tol_evenement=tol_evenement)
+    temps, positions = [solveur.t], [solveur.y]
+    while solveur.t < duree_max and solveur.t_evenement is None:
+        solveur.pas()
+        temps.append(solveur.t)
+        positions.append(solveur.y)
+
+    return {
+        'temps_rattrapage': solveur.t_evenement,
+        'position_rencontre': float(solveur.y_evenement[0]) if solveur.t_evenement is not None else None,
+        'evaluations': solveur.evaluations,
+        'pas': solveur.pas_acceptes,
+        'rejets': solveur.pas_rejetes,
+        'temps': np.array(temps),
+        'positions': np.array(positions),
+    }
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Lanceur des paradoxes de Zénon
+Une seule fenêtre et un seul jeu de polices; les scènes sont importées et
+construites à leur première ouverture, puis suspendues (état conservé)
+quand on passe à une autre: changer de scène ne coûte qu'une image
+"""
+
+import argparse
+import importlib
+import time
+
+import pygame
+
+from noyau import FPS, fenetre
+
+# Nom: (module, classe, touche)
+SCENES = {
+    "achille": ("achilletortuepygame", "CourseAchilleTortue", pygame.K_F5),
+    "dichotomie": ("delesodomiepygae", "DichotomieSimulation", pygame.K_F6),
+    "fleche": ("flechefollepygame", "FlecheVolSimulation", pygame.K_F7),
+}
+
+# Fenêtre assez grande pour toutes les scènes
+LARGEUR = 1400
+HAUTEUR = 900
+
+
+class Lanceur:
+    """
+    Passe d'une scène à l'autre avec F5/F6/F7 (ou Tab pour la suivante).
+    Les autres événements sont transmis à la scène active.
+    """
+
+    def __init__(self, premiere="achille"):
+        self.ecran = fenetre(LARGEUR, HAUTEUR, "Paradoxes de Zénon")
+        self.horloge = pygame.time.Clock()
+        self.scenes = {}  # Scènes déjà construites, actives ou suspendues
+        self.nom_actif = None
+        self.active = None
+        self.duree_image = 0.0
+        self.activer(premiere)
+
+    def scene(self, nom):
+        """Scène nom, importée et construite à la première demande"""
+        if nom not in self.scenes:
+            module, classe, _ = SCENES[nom]
+            debut = time.perf_counter()
+            self.scenes[nom] = getattr(importlib.import_module(module), classe)()
+            print(f"Scène {nom} prête en {(time.perf_counter() - debut) * 1000:.0f} ms")
+        return self.scenes[nom]
+
+    def activer(self, nom):
+        """Rend la scène nom active; la précédente reste en mémoire, figée"""
+        if nom == self.nom_actif:
+            return
+        self.active = self.scene(nom)
+        self.nom_actif = nom
+        self.active.reprendre()
+        # Le temps passé ailleurs ne fait pas avancer la scène
+        self.duree_image = 0.0
+
+    def suivante(self):
+        noms = list(SCENES)
+        self.activer(noms[(noms.index(self.nom_actif) + 1) % len(noms)])
+
+    def evenements(self):
+        """Traite les touches du lanceur et retourne les autres événements"""
+        touches = {touche: nom for nom, (_, _, touche) in SCENES.items()}
+        restants = []
+        for evenement in pygame.event.get():
+            if evenement.type == pygame.KEYDOWN and evenement.key in touches:
+                self.activer(touches[evenement.key])
+            elif evenement.type == pygame.KEYDOWN and evenement.key == pygame.K_TAB:
+                self.suivante()
+            else:
+                restants.append(evenement)
+        return restants
+
+    def executer(self):
+        """Boucle principale: une image de la scène active à chaque tour"""
+        en_cours = True
+        while en_cours:
+            evenements = self.evenements()  # Peut changer de scène
+            en_cours = self.active.image(self.duree_image, evenements)
+            self.duree_image = self.horloge.tick(FPS) / 1000
+
+        for scene in self.scenes.values():
+            scene.fermer()
+        pygame.quit()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Paradoxes de Zénon: une fenêtre, plusieurs scènes")
+    parser.add_argument("scene", nargs="?", choices=SCENES, default="achille", help="scène de départ")
+    args = parser.parse_args()
+
+    print("F5: Achille et la Tortue    F6: Dichotomie    F7: Flèche en vol    Tab: scène suivante")
+    Lanceur(args.scene).executer()
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Courses d'Achille et la Tortue à vitesses aléatoires (Monte Carlo)
+Les vitesses deviennent des processus aléatoires (bruit gaussien, fatigue);
+les courses sont simulées par lots vectorisés répartis sur plusieurs
+processus, chacun avec son propre flux aléatoire indépendant
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+import numpy as np
+
+PROCESSUS = ("constant", "bruit", "fatigue")
+TAILLE_LOT = 8192   # Courses par tâche: fixe, pour que le résultat ne dépende pas des travailleurs
+
+
+def vitesses(generateur, processus, nombre, temps, dt, vitesse_achille, vitesse_tortue, ecart_type, fatigue):
+    """
+    Vitesses des nombre coureurs actifs pendant le pas dt qui commence à temps.
+
+    constant: vitesses fixes
+    bruit   : chaque position suit sa vitesse moyenne plus un mouvement brownien
+              d'écart-type relatif ecart_type·√t; la vitesse d'un pas est donc
+              tirée avec un écart-type relatif ecart_type/√dt, et la distribution
+              des rattrapages ne dépend pas du pas de temps
+    fatigue : Achille ralentit en exp(-fatigue·t), fatigue propre à chaque course,
+              avec le même bruit que « bruit »
+    """
+    if processus == "constant":
+        return np.full(nombre, vitesse_achille), np.full(nombre, vitesse_tortue)
+
+    amplitude = ecart_type / np.sqrt(dt)
+    va = vitesse_achille * (1 + amplitude * generateur.standard_normal(nombre))
+    vt = vitesse_tortue * (1 + amplitude * generateur.standard_normal(nombre))
+    if processus == "fatigue":
+        va *= np.exp(-fatigue * temps)
+    return va, vt
+
+
+def courses(graine, nombre, position_tortue=100.0, vitesse_achille=10.0, vitesse_tortue=1.0,
+            dt=0.1, duree_max=100.0, processus="bruit", ecart_type=0.06, fatigue=0.02):
+    """
+    Simule nombre courses indépendantes et retourne leurs instants de
+    rattrapage (inf si Achille n'a pas rejoint la tortue avant duree_max).
+
+    Les vitesses sont constantes pendant un pas dt: la rencontre est
+    placée exactement à l'intérieur du pas où l'écart change de signe.
+    """
+    generateur = np.random.default_rng(graine)
+    resultats = np.full(nombre, np.inf)
+
+    # La fatigue est un trait du coureur, tirée une fois par course
+    if processus == "fatigue":
+        fatigues = fatigue * generateur.lognormal(0.0, 0.3, nombre)
+    else:
+        fatigues = np.zeros(nombre)
+
+    # Courses encore en cours: indices et écarts, compactés à chaque pas
+    actives = np.arange(nombre)
+    avance = np.full(nombre, float(position_tortue))
+    temps = 0.0
+
+    for _ in range(int(np.ceil(duree_max / dt))):
+        if actives.size == 0:
+            break
+        va, vt = vitesses(generateur, processus, actives.size, temps, dt, vitesse_achille,
+                          vitesse_tortue, ecart_type, fatigues[actives])
+        rapprochement = va - vt
+        nouvelle_avance = avance - rapprochement * dt
+
+        rattrapees = nouvelle_avance <= 0
+        if rattrapees.any():
+            resultats[actives[rattrapees]] = temps + avance[rattrapees] / rapprochement[rattrapees]
+            garder = ~rattrapees
+            actives, nouvelle_avance = actives[garder], nouvelle_avance[garder]
+
+        avance = nouvelle_avance
+        temps += dt
+
+    return resultats
+
+
+def monte_carlo(nombre_courses, travailleurs=None, taille_lot=TAILLE_LOT, graine=None, **parametres):
+    """
+    Répartit nombre_courses sur un ProcessPoolExecutor par lots de taille_lot:
+    assez petits pour donner plusieurs tâches à chaque travailleur, même
+    nombreux, et équilibrer la fin du calcul.
+    Chaque lot reçoit un SeedSequence issu de graine.spawn(): les flux sont
+    indépendants et le résultat ne dépend pas du nombre de travailleurs.
+    parametres: ceux de courses() (position_tortue, vitesse_achille, ...).
+    """
+    tailles = [taille_lot] * (nombre_courses // taille_lot)
+    if nombre_courses % taille_lot:
+        tailles.append(nombre_courses % taille_lot)
+    graines = np.random.SeedSequence(graine).spawn(len(tailles))
+
+    if travailleurs == 1 or len(tailles) == 1:
+        lots = [courses(g, n, **parametres) for g, n in zip(graines, tailles)]
+    else:
+        with ProcessPoolExecutor(max_workers=travailleurs) as executeur:
+            lots = list(executeur.map(_courses, graines, tailles, repeat(parametres)))
+
+    return np.concatenate(lots) if lots else np.zeros(0)
+
+
+def _courses(graine, nombre, parametres):
+    """Point d'entrée des processus travailleurs (doit être importable)"""
+    return courses(graine, nombre, **parametres)
+
+
+def statistiques(temps, percentiles=(1, 5, 25, 50, 75, 95, 99), classes=30):
+    """
+    Distribution des instants de rattrapage: proportion de courses gagnées,
+    moyenne, écart-type, percentiles et histogramme (courses rattrapées seulement).
+    """
+    rattrapes = temps[np.isfinite(temps)]
+    stats = {
+        'courses': len(temps),
+        'rattrapees': len(rattrapes),
+        'proportion': len(rattrapes) / len(temps) if len(temps) else 0.0,
+    }
+    if len(rattrapes):
+        stats['moyenne'] = float(rattrapes.mean())
+        stats['ecart_type'] = float(rattrapes.std())
+        stats['percentiles'] = dict(zip(percentiles, np.percentile(rattrapes, percentiles)))
+        stats['histogramme'] = np.histogram(rattrapes, bins=classes)
+    return stats
+
+
+def afficher_statistiques(stats, largeur=50):
+    print(f"\nCourses: {stats['courses']}, rattrapées: {stats['rattrapees']} "
+          f"({stats['proportion']:.2%})")
+    if not stats['rattrapees']:
+        return
+
+    print(f"Instant de rattrapage: moyenne {stats['moyenne']:.3f}s, écart-type {stats['ecart_type']:.3f}s")
+    print("Percentiles: " + ", ".join(f"p{p}={v:.3f}s" for p, v in stats['percentiles'].items()))
+
+    effectifs, bords = stats['histogramme']
+    plus_grand = effectifs.max()
+    print()
+    for effectif, debut, fin in zip(effectifs, bords[:-1], bords[1:]):
+        barre = "█" * int(round(effectif / plus_grand * largeur))
+        print(f"{debut:8.3f}-{fin:8.3f}s |{barre}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Courses d'Achille et la Tortue à vitesses aléatoires")
+    parser.add_argument("-n", "--courses", type=int, default=1_000_000, help="nombre de courses")
+    parser.add_argument("-p", "--processus", choices=PROCESSUS, default="bruit",
+                        help="processus aléatoire des vitesses")
+    parser.add_argument("-j", "--travailleurs", type=int, default=os.cpu_count(),
+                        help="nombre de processus")
+    parser.add_argument("--graine", type=int, default=None, help="graine (résultats reproductibles)")
+    parser.add_argument("--position-tortue", type=float, default=100.0, help="avance de la tortue (m)")
+    parser.add_argument("--vitesse-achille", type=float, default=10.0, help="vitesse moyenne d'Achille (m/s)")
+    parser.add_argument("--vitesse-tortue", type=float, default=1.0, help="vitesse moyenne de la tortue (m/s)")
+    parser.add_argument("--dt", type=float, default=0.1, help="pas de temps (s)")
+    parser.add_argument("--ecart-type", type=float, default=0.06,
+                        help="écart-type relatif des positions par √s (bruit des vitesses)")
+    parser.add_argument("--fatigue", type=float, default=0.02, help="taux de fatigue d'Achille (1/s)")
+    args = parser.parse_args()
+
+    print("=== ACHILLE ET LA TORTUE: MONTE CARLO ===")
+    print(f"Processus: {args.processus}, {args.courses} courses sur {args.travailleurs} processus")
+
+    debut = time.perf_counter()
+    temps = monte_carlo(args.courses, travailleurs=args.travailleurs, graine=args.graine,
+                        position_tortue=args.position_tortue, vitesse_achille=args.vitesse_achille,
+                        vitesse_tortue=args.vitesse_tortue, dt=args.dt, processus=args.processus,
+                        ecart_type=args.ecart_type, fatigue=args.fatigue)
+    duree = time.perf_counter() - debut
+
+    afficher_statistiques(statistiques(temps))
+    temps_theorique = args.position_tortue / (args.vitesse_achille - args.vitesse_tortue)
+    print(f"\nTemps théorique à vitesses constantes: {temps_theorique:.4f}s")
+    print(f"Calcul: {duree:.2f}s ({args.courses / duree:,.0f} courses/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Noyau commun des simulations Pygame
+Constantes partagées, initialisation paresseuse de Pygame (affichage et
+polices seulement: ni son ni manettes) et classe de base avec la boucle
+principale, les touches communes et l'enregistrement
+"""
+
+import argparse
+
+import pygame
+
+from boucle import PAS_SIMULATION, BoucleFixe
+from cachetexte import CacheTexte
+from enregistrement import Enregistreur, Relecture
+from profilage import Profileur
+
+FPS = 60
+
+# Couleurs
+BLANC = (255, 255, 255)
+NOIR = (0, 0, 0)
+ROUGE = (255, 0, 0)
+VERT = (0, 255, 0)
+BLEU = (0, 0, 255)
+GRIS = (128, 128, 128)
+GRIS_CLAIR = (200, 200, 200)
+JAUNE = (255, 255, 0)
+ORANGE = (255, 165, 0)
+VIOLET = (128, 0, 128)
+CYAN = (0, 255, 255)
+ROSE = (255, 192, 203)
+MARRON = (139, 69, 19)
+VERT_FONCE = (0, 100, 0)
+
+
+def initialiser_pygame():
+    """
+    Initialise seulement les sous-systèmes utilisés (affichage, polices).
+    Appelée à la création d'une simulation, pas à l'import: importer un
+    module ne démarre pas SDL. Sans effet si déjà fait.
+    """
+    if not pygame.display.get_init():
+        pygame.display.init()
+    if not pygame.font.get_init():
+        pygame.font.init()
+
+
+def fenetre(largeur, hauteur, titre):
+    """
+    Surface d'affichage d'au moins largeur x hauteur. La fenêtre déjà ouverte
+    est réutilisée si elle est assez grande (plusieurs scènes dans le lanceur).
+    """
+    initialiser_pygame()
+    ecran = pygame.display.get_surface()
+    if ecran is None or ecran.get_width() < largeur or ecran.get_height() < hauteur:
+        ecran = pygame.display.set_mode((largeur, hauteur))
+    pygame.display.set_caption(titre)
+    return ecran
+
+
+_polices = {}
+
+
+def police(taille):
+    """Police par défaut de cette taille, chargée une seule fois pour toutes les scènes"""
+    if taille not in _polices:
+        initialiser_pygame()
+        _polices[taille] = pygame.font.Font(None, taille)
+    return _polices[taille]
+
+
+class SimulationPygame:
+    """
+    Base des simulations Pygame: fenêtre, polices, cache de texte, boucle à
+    pas fixe, profileur, enregistrement/relecture et boucle principale.
+
+    Les sous-classes définissent reset_simulation(), mettre_a_jour_simulation(pas)
+    et dessiner(), et leurs propres touches dans gerer_touche(touche) en
+    déléguant les autres à super(). Touches communes: ESPACE, R, ↑/↓, ←/→
+    (relecture), F3 (profilage), Q.
+    """
+    # État interpolé entre deux pas de physique pour l'affichage
+    ATTRIBUTS_INTERPOLES = ("temps",)
+    # État écrit à chaque pas par l'enregistreur et restauré en relecture
+    ATTRIBUTS_ENREGISTRES = ("temps",)
+    # Réglage de la vitesse de simulation par ↑/↓
+    VITESSE_MAX = 3.0
+    PAS_VITESSE = 0.2
+
+    def __init__(self, titre, largeur, hauteur, taille_police_petite=18):
+        self.titre = titre
+        self.ecran = fenetre(largeur, hauteur, titre)
+        self.horloge = pygame.time.Clock()
+
+        # Polices (partagées entre scènes)
+        self.font_petit = police(taille_police_petite)
+        self.font = police(24)
+        self.font_titre = police(36)
+        self.font_grand = police(48)
+        self.textes = CacheTexte()
+
+        # Physique à pas fixe, mesures, enregistrement
+        self.boucle = BoucleFixe()
+        self.profileur = Profileur(self)
+        self.enregistreur = None
+        self.relecture = None
+
+        # Interface
+        self.simulation_active = False
+        self.vitesse_simulation = 1.0
+
+    def reset_simulation(self):
+        raise NotImplementedError
+
+    def mettre_a_jour_simulation(self, pas=PAS_SIMULATION):
+        raise NotImplementedError
+
+    def dessiner(self):
+        raise NotImplementedError
+
+    def enregistrer(self, chemin):
+        """Enregistre l'état à chaque pas de physique dans chemin (.npy), jusqu'au reset"""
+        self.arreter_enregistrement()
+        self.enregistreur = Enregistreur(chemin, self, self.ATTRIBUTS_ENREGISTRES)
+
+    def arreter_enregistrement(self):
+        """Termine l'enregistrement en cours"""
+        if self.enregistreur is not None:
+            enregistreur, self.enregistreur = self.enregistreur, None
+            enregistreur.fermer()
+
+    def rejouer(self, chemin):
+        """Rejoue un enregistrement sans rien recalculer"""
+        self.relecture = Relecture(chemin)
+        self.reset_simulation()
+
+    def chercher(self, decalage):
+        """Déplace la tête de lecture de decalage secondes"""
+        self.boucle.oublier()
+        self.historique.vider()
+        self.relecture.chercher(self, self.relecture.temps + decalage)
+
+    def gerer_evenements(self, evenements=None):
+        """
+        Gère les événements utilisateur (par défaut ceux de la file Pygame);
+        retourne False pour quitter
+        """
+        for evenement in pygame.event.get() if evenements is None else evenements:
+            if evenement.type == pygame.QUIT:
+                return False
+
+            elif evenement.type == pygame.KEYDOWN:
+                if evenement.key == pygame.K_q:
+                    return False
+                self.gerer_touche(evenement.key)
+
+        return True
+
+    def gerer_touche(self, touche):
+        """Touches communes à toutes les simulations"""
+        if touche == pygame.K_SPACE:
+            self.simulation_active = not self.simulation_active
+
+        elif touche == pygame.K_r:
+            self.reset_simulation()
+            self.simulation_active = False
+
+        elif touche == pygame.K_UP:
+            self.vitesse_simulation = min(self.VITESSE_MAX, self.vitesse_simulation + self.PAS_VITESSE)
+
+        elif touche == pygame.K_DOWN:
+            self.vitesse_simulation = max(0.1, self.vitesse_simulation - self.PAS_VITESSE)
+
+        elif touche == pygame.K_LEFT and self.relecture is not None:
+            self.chercher(-5.0)
+
+        elif touche == pygame.K_RIGHT and self.relecture is not None:
+            self.chercher(5.0)
+
+        elif touche == pygame.K_F3:
+            self.profileur.basculer()
+
+    def fermer(self):
+        """Termine l'enregistrement et écrit la trace éventuelle"""
+        self.arreter_enregistrement()
+        self.profileur.fermer()
+
+    def reprendre(self):
+        """La scène redevient active (lanceur): titre, et rien à interpoler"""
+        pygame.display.set_caption(self.titre)
+        self.boucle.oublier()
+
+    def avancer_physique(self, duree):
+        """Autant de pas fixes de physique que duree secondes en demandent"""
+        for _ in range(self.boucle.avancer(duree)):
+            self.boucle.memoriser(self, self.ATTRIBUTS_INTERPOLES)
+            self.mettre_a_jour_simulation(self.boucle.pas)
+
+    def rendre_image(self):
+        """Dessine dans self.ecran l'état interpolé entre les deux derniers pas"""
+        with self.boucle.interpoler(self, self.ATTRIBUTS_INTERPOLES):
+            self.dessiner()
+
+    def image(self, duree_image, evenements=None):
+        """
+        Une image: événements, pas de physique pour duree_image secondes
+        réelles, rendu et affichage. Retourne False pour quitter.
+        """
+        self.profileur.debut_image()
+        en_cours = self.gerer_evenements(evenements)
+        self.avancer_physique(duree_image)
+        self.rendre_image()
+        self.profileur.dessiner(self.ecran)
+
+        pygame.display.flip()
+        self.profileur.fin_image()
+        return en_cours
+
+    def executer(self):
+        """Boucle principale; ferme Pygame en sortant (sans quitter le programme)"""
+        en_cours = True
+        duree_image = 0.0
+
+        while en_cours:
+            en_cours = self.image(duree_image)
+            duree_image = self.horloge.tick(FPS) / 1000
+
+        self.fermer()
+        pygame.quit()
+
+def analyseur(description, enregistrement=True):
+    """Options communes de la ligne de commande (--trace, et --enregistrer/--rejouer)"""
+    parser = argparse.ArgumentParser(description=description)
+    if enregistrement:
+        parser.add_argument("--enregistrer", metavar="FICHIER", help="enregistre la simulation dans un fichier .npy")
+        parser.add_argument("--rejouer", metavar="FICHIER", help="rejoue un enregistrement .npy")
+    parser.add_argument("--trace", metavar="FICHIER",
+                        help="écrit les durées des phases de chaque image (Chrome trace JSON)")
+    return parser
+
+
+def preparer(simulation, args):
+    """Applique les options communes à la simulation"""
+    if args.trace:
+        simulation.profileur.tracer(args.trace)
+    if getattr(args, "rejouer", None):
+        simulation.rejouer(args.rejouer)
+    elif getattr(args, "enregistrer", None):
+        simulation.enregistrer(args.enregistrer)
+    return simulation
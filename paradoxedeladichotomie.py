@@ -3,19 +3,50 @@
 Simulation du paradoxe de la dichotomie de Zénon d'Élée
 """
 
-import time
 import math
 
-def simulation_dichotomie():
+from sorties import choisir_sortie
+
+def etapes_dichotomie(distance_totale=8.0, seuil_precision=0.001, etapes_max=50):
+    """
+    Générateur des étapes de la dichotomie, sans affichage ni pause.
+    S'arrête quand la distance restante passe sous seuil_precision
+    ou après etapes_max étapes.
+    """
+    position_pierre = 0.0
+    position_arbre = distance_totale
+    etape = 0
+    
+    while True:
+        distance_restante = position_arbre - position_pierre
+        moitie_distance = distance_restante / 2
+        yield {
+            'etape': etape,
+            'position': position_pierre,
+            'distance': distance_restante,
+            'moitie': moitie_distance,
+        }
+        
+        if distance_restante < seuil_precision or etape > etapes_max:
+            return
+        
+        # La pierre avance de la moitié de la distance restante
+        position_pierre += moitie_distance
+        etape += 1
+
+def formater_ligne_dichotomie(etape):
+    """Ligne du tableau console pour une étape de la dichotomie"""
+    return (f"{etape['etape']:5d} | {etape['position']:10.6f} | "
+            f"{etape['distance']:10.6f} | {etape['moitie']:10.6f}")
+
+def simulation_dichotomie(distance_totale=8.0, pause=0.2):
     """
     Simule le lancement de la pierre vers l'arbre.
     La pierre doit parcourir la moitié de la distance restante à chaque étape.
+    pause: délai entre deux lignes (0 pour un affichage immédiat)
     """
     
-    # Paramètres initiaux
-    distance_totale = 8.0  # Distance jusqu'à l'arbre (8 mètres)
-    position_pierre = 0.0  # Position de départ de la pierre
-    position_arbre = distance_totale
+    seuil_precision = 0.001  # Arrêt quand la distance devient très petite
     
     print("=== PARADOXE DE LA DICHOTOMIE ===")
     print(f"Distance jusqu'à l'arbre: {distance_totale}m")
@@ -24,33 +55,17 @@ def simulation_dichotomie():
     print(f"{'Étape':>5} | {'Position':>10} | {'Distance':>10} | {'Moitié':>10}")
     print("-" * 50)
     
-    etape = 0
-    seuil_precision = 0.001  # Arrêt quand la distance devient très petite
+    etapes = list(etapes_dichotomie(distance_totale, seuil_precision))
+    choisir_sortie(formater_ligne_dichotomie, pause).ecrire(etapes)
+    final = etapes[-1]
     
-    while True:
-        distance_restante = position_arbre - position_pierre
-        
-        # Affichage de l'état actuel
-        moitie_distance = distance_restante / 2
-        print(f"{etape:5d} | {position_pierre:10.6f} | {distance_restante:10.6f} | {moitie_distance:10.6f}")
-        
-        # Condition d'arrêt (quand la distance devient négligeable)
-        if distance_restante < seuil_precision:
-            print(f"\nLa pierre est suffisamment proche de l'arbre (< {seuil_precision}m)")
-            break
-        
-        if etape > 50:  # Limite de sécurité
-            print("\nSimulation interrompue après 50 étapes")
-            break
-        
-        # La pierre avance de la moitié de la distance restante
-        position_pierre += moitie_distance
-        etape += 1
-        
-        time.sleep(0.2)  # Pause pour la lisibilité
+    if final['distance'] < seuil_precision:
+        print(f"\nLa pierre est suffisamment proche de l'arbre (< {seuil_precision}m)")
+    else:
+        print("\nSimulation interrompue après 50 étapes")
     
-    print(f"\nPosition finale de la pierre: {position_pierre:.6f}m")
-    print(f"Distance finale à l'arbre: {position_arbre - position_pierre:.6f}m")
+    print(f"\nPosition finale de la pierre: {final['position']:.6f}m")
+    print(f"Distance finale à l'arbre: {final['distance']:.6f}m")
 
 def analyse_serie_geometrique():
     """
@@ -71,6 +86,11 @@ def analyse_serie_geometrique():
         somme_partielle += terme
         print(f"Terme {i+1}: {terme:.6f}, Somme: {somme_partielle:.6f}, Reste: {8 - somme_partielle:.6f}")
         terme = terme / 2
+    
+    # Accélération de convergence: combien de termes pour la même précision
+    from series import afficher_rapport, rapport_cout, termes_geometriques
+    afficher_rapport(rapport_cout(termes_geometriques(4.0, 0.5), tolerance=1e-10, limite=8.0),
+                     "Termes nécessaires pour une précision de 1e-10 m")
 
 def visualisation_convergence():
     """
@@ -93,4 +113,8 @@ def visualisation_convergence():
 if __name__ == "__main__":
     simulation_dichotomie()
     analyse_serie_geometrique()
-    visualisation_convergence()
\ No newline at end of file
+    visualisation_convergence()
+    
+    # Au-delà de la précision des flottants: calcul exact
+    from dichotomieexacte import afficher_divergence
+    afficher_divergence()
\ No newline at end of file
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Système de particules partagé par les simulations Pygame
+Les particules sont stockées en tableaux NumPy (une colonne par attribut)
+"""
+
+import numpy as np
+import pygame
+
+
+class SystemeParticules:
+    """
+    Particules d'effet visuel: position, vitesse, vie, taille et couleur.
+
+    gravite: accélération verticale (pixels/s²)
+    perte_vie: vie perdue par seconde (une particule meurt à vie <= 0)
+    decroissance_taille: facteur appliqué à la taille à chaque mise à jour
+    rayon_vie: si défini, le rayon dessiné vaut int(vie * rayon_vie) et les
+               particules de rayon nul ne sont pas dessinées; sinon le rayon
+               vaut max(1, int(taille))
+    """
+
+    RAYON_MAX = 16
+    COLONNES = ('x', 'y', 'vx', 'vy', 'vie', 'taille', 'couleur')
+
+    def __init__(self, capacite=256, gravite=0.0, perte_vie=2.0,
+                 decroissance_taille=1.0, rayon_vie=None):
+        self.gravite = gravite
+        self.perte_vie = perte_vie
+        self.decroissance_taille = decroissance_taille
+        self.rayon_vie = rayon_vie
+        self.generateur = np.random.default_rng()
+
+        self.nombre = 0
+        self.x = np.zeros(capacite)
+        self.y = np.zeros(capacite)
+        self.vx = np.zeros(capacite)
+        self.vy = np.zeros(capacite)
+        self.vie = np.zeros(capacite)
+        self.taille = np.zeros(capacite)
+        self.couleur = np.zeros(capacite, dtype=np.intp)
+
+        # Palette de couleurs et sprites pré-rendus par (couleur, rayon)
+        self.palette = []
+        self.sprites = np.empty((0, self.RAYON_MAX + 1), dtype=object)
+
+    def __len__(self):
+        return self.nombre
+
+    def _agrandir(self, capacite):
+        """Agrandit les tableaux (capacité doublée au minimum)"""
+        capacite = max(capacite, 2 * len(self.x))
+        for nom in self.COLONNES:
+            ancien = getattr(self, nom)
+            nouveau = np.zeros(capacite, dtype=ancien.dtype)
+            nouveau[:self.nombre] = ancien[:self.nombre]
+            setattr(self, nom, nouveau)
+
+    def index_couleur(self, couleur):
+        """Index de la couleur dans la palette (ajoutée si nécessaire)"""
+        couleur = tuple(couleur)
+        if couleur not in self.palette:
+            self.palette.append(couleur)
+            sprites = np.empty((len(self.palette), self.RAYON_MAX + 1), dtype=object)
+            sprites[:-1] = self.sprites
+            for rayon in range(self.RAYON_MAX + 1):
+                sprites[-1, rayon] = self._creer_sprite(couleur, rayon)
+            self.sprites = sprites
+        return self.palette.index(couleur)
+
+    def _creer_sprite(self, couleur, rayon):
+        """Pré-rend un disque de la couleur et du rayon donnés"""
+        sprite = pygame.Surface((2 * rayon + 1, 2 * rayon + 1), pygame.SRCALPHA)
+        if rayon > 0:
+            pygame.draw.circle(sprite, couleur, (rayon, rayon), rayon)
+        return sprite
+
+    def emettre(self, nombre, x, y, dispersion=(0.0, 0.0), vx=(0.0, 0.0), vy=(0.0, 0.0),
+                taille=(1.0, 1.0), couleurs=((255, 255, 255),)):
+        """
+        Ajoute nombre particules autour de (x, y).
+        dispersion: écart maximal en x et en y autour du point d'émission
+        vx, vy, taille: intervalles (min, max) tirés uniformément
+        couleurs: couleurs possibles, tirées au hasard
+        """
+        if nombre <= 0:
+            return
+
+        if self.nombre + nombre > len(self.x):
+            self._agrandir(self.nombre + nombre)
+
+        g = self.generateur
+        fin = self.nombre + nombre
+        tranche = slice(self.nombre, fin)
+
+        self.x[tranche] = x + g.uniform(-dispersion[0], dispersion[0], nombre)
+        self.y[tranche] = y + g.uniform(-dispersion[1], dispersion[1], nombre)
+        self.vx[tranche] = g.uniform(vx[0], vx[1], nombre)
+        self.vy[tranche] = g.uniform(vy[0], vy[1], nombre)
+        self.vie[tranche] = 1.0
+        self.taille[tranche] = g.uniform(taille[0], taille[1], nombre)
+
+        index = np.array([self.index_couleur(c) for c in couleurs], dtype=np.intp)
+        self.couleur[tranche] = index[g.integers(0, len(index), nombre)]
+
+        self.nombre = fin
+
+    def mettre_a_jour(self, dt):
+        """Intègre toutes les particules et retire les particules mortes"""
+        n = self.nombre
+        if n == 0:
+            return
+
+        self.x[:n] += self.vx[:n] * dt
+        self.y[:n] += self.vy[:n] * dt
+        if self.gravite:
+            self.vy[:n] += self.gravite * dt
+        self.vie[:n] -= dt * self.perte_vie
+        if self.decroissance_taille != 1.0:
+            self.taille[:n] *= self.decroissance_taille
+
+        self._compacter()
+
+    def _compacter(self):
+        """
+        Retire les particules mortes: les trous sont comblés par les
+        particules vivantes de fin de tableau (échange avec la dernière)
+        """
+        n = self.nombre
+        vivantes = self.vie[:n] > 0
+        restantes = int(np.count_nonzero(vivantes))
+        if restantes == n:
+            return
+
+        trous = np.flatnonzero(~vivantes[:restantes])
+        sources = np.flatnonzero(vivantes[restantes:]) + restantes
+        for nom in self.COLONNES:
+            colonne = getattr(self, nom)
+            colonne[trous] = colonne[sources]
+
+        self.nombre = restantes
+
+    def vider(self):
+        """Supprime toutes les particules"""
+        self.nombre = 0
+
+    def dessiner(self, surface):
+        """Dessine toutes les particules en un seul appel blits"""
+        n = self.nombre
+        if n == 0:
+            return
+
+        if self.rayon_vie is not None:
+            rayons = (self.vie[:n] * self.rayon_vie).astype(np.intp)
+            visibles = rayons > 0
+        else:
+            rayons = np.maximum(1, self.taille[:n].astype(np.intp))
+            visibles = np.ones(n, dtype=bool)
+        rayons = np.minimum(rayons, self.RAYON_MAX)
+
+        rayons = rayons[visibles]
+        sprites = self.sprites[self.couleur[:n][visibles], rayons]
+        gauche = self.x[:n][visibles].astype(np.intp) - rayons
+        haut = self.y[:n][visibles].astype(np.intp) - rayons
+
+        surface.blits(zip(sprites.tolist(), zip(gauche.tolist(), haut.tolist())),
+                      doreturn=False)
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Profilage des simulations Pygame
+Les phases d'une image (événements, physique, chaque dessiner_*) sont
+chronométrées; un panneau superposé (F3) affiche les FPS, l'histogramme des
+durées d'image, les particules et l'historique, et les mesures peuvent être
+exportées au format Chrome trace (chrome://tracing, Perfetto)
+"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+
+import numpy as np
+import pygame
+
+from cachetexte import CacheTexte
+from historique import HistoriqueCirculaire
+from particules import SystemeParticules
+
+CLASSES_HISTOGRAMME = 20
+DUREE_CLASSE = 0.002        # 2 ms par barre de l'histogramme
+BUDGET_IMAGE = 1 / 60       # Durée d'une image à 60 FPS
+EVENEMENTS_MAX = 1_000_000  # Au-delà, la trace cesse de grossir
+
+
+def chronometrer(simulation, nom, rappel):
+    """Remplace la méthode nom de l'instance par une version qui appelle rappel(nom, debut, fin)"""
+    methode = getattr(simulation, nom)
+
+    def methode_chronometree(*args, **kwargs):
+        debut = time.perf_counter()
+        try:
+            return methode(*args, **kwargs)
+        finally:
+            rappel(nom, debut, time.perf_counter())
+
+    setattr(simulation, nom, methode_chronometree)
+
+
+def phases(simulation):
+    """Méthodes chronométrées: les événements, la mise à jour et chaque dessiner_*"""
+    noms = ["gerer_evenements", "mettre_a_jour_simulation"]
+    noms += sorted(nom for nom in dir(simulation)
+                   if nom.startswith("dessiner_") and callable(getattr(simulation, nom)))
+    return noms
+
+
+def instrumenter(simulation, rappel):
+    """Chronomètre toutes les phases de la simulation et retourne leurs noms"""
+    noms = phases(simulation)
+    for nom in noms:
+        chronometrer(simulation, nom, rappel)
+    return noms
+
+
+def desinstrumenter(simulation, noms):
+    """Retour aux méthodes de la classe"""
+    for nom in noms:
+        simulation.__dict__.pop(nom, None)
+
+
+class Profileur:
+    """
+    Mesures image par image d'une simulation. L'instrumentation n'est posée
+    qu'à la première demande (affichage du panneau ou trace): sans F3 ni
+    --trace, la simulation tourne sans surcoût.
+
+    Dans la boucle principale: debut_image() en tête, fin_image() après
+    pygame.display.flip(), dessiner(ecran) juste avant le flip.
+    """
+
+    def __init__(self, simulation, images=240):
+        self.simulation = simulation
+        self.phases = None
+        self.visible = False
+        self.chemin_trace = None
+        self.evenements = []
+        self.origine = time.perf_counter()
+        self.pid = os.getpid()
+        self.tid = threading.get_ident()
+
+        self.durees = deque(maxlen=images)     # Travail de chaque image (s)
+        self.intervalles = deque(maxlen=images)  # D'un début d'image au suivant (s)
+        self.debut = None
+
+        self.textes = CacheTexte(capacite=128)
+        self.font = None
+        self.panneau = None
+
+    def activer(self):
+        """Pose l'instrumentation (une seule fois)"""
+        if self.phases is None:
+            self.phases = instrumenter(self.simulation, self.mesurer)
+
+    def basculer(self):
+        """Affiche ou masque le panneau"""
+        self.activer()
+        self.visible = not self.visible
+
+    def tracer(self, chemin):
+        """Enregistre toutes les phases pour les écrire dans chemin à la fermeture"""
+        self.activer()
+        self.chemin_trace = chemin
+
+    def mesurer(self, nom, debut, fin):
+        """Rappel de l'instrumentation: une phase terminée"""
+        if self.chemin_trace is not None and len(self.evenements) < EVENEMENTS_MAX:
+            self.evenements.append((nom, debut, fin))
+
+    def debut_image(self):
+        maintenant = time.perf_counter()
+        if self.debut is not None:
+            self.intervalles.append(maintenant - self.debut)
+        self.debut = maintenant
+
+    def fin_image(self):
+        fin = time.perf_counter()
+        if self.debut is None:
+            return
+        self.durees.append(fin - self.debut)
+        self.mesurer("image", self.debut, fin)
+
+    def compter(self, classe):
+        """Nombre total d'éléments des attributs de la simulation de cette classe"""
+        return sum(len(valeur) for valeur in vars(self.simulation).values()
+                   if isinstance(valeur, classe))
+
+    def dessiner(self, ecran):
+        """Panneau superposé en haut à droite de l'écran"""
+        if not self.visible:
+            return
+        if self.font is None:
+            import noyau  # Import au premier dessin: noyau importe ce module
+            self.font = noyau.police(20)
+            self.panneau = pygame.Surface((280, 170), pygame.SRCALPHA)
+
+        self.panneau.fill((0, 0, 0, 170))
+        fps = len(self.intervalles) / sum(self.intervalles) if self.intervalles else 0.0
+        durees = np.array(self.durees) if self.durees else np.zeros(1)
+        lignes = [
+            f"FPS: {fps:.1f}",
+            f"Image: {durees.mean() * 1000:.2f} ms (p95 {np.percentile(durees, 95) * 1000:.2f} ms)",
+            f"Particules: {self.compter(SystemeParticules)}",
+            f"Historique: {self.compter(HistoriqueCirculaire)} points",
+        ]
+        if self.chemin_trace is not None:
+            lignes.append(f"Trace: {len(self.evenements)} événements")
+        for i, ligne in enumerate(lignes):
+            # Chiffres arrondis: le cache de texte reste efficace
+            self.panneau.blit(self.textes.rendre(self.font, ligne, (255, 255, 255)), (8, 6 + i * 17))
+
+        # Histogramme des durées d'image, la dernière classe regroupe tout le reste
+        classes = np.minimum((durees / DUREE_CLASSE).astype(np.intp), CLASSES_HISTOGRAMME - 1)
+        effectifs = np.bincount(classes, minlength=CLASSES_HISTOGRAMME)
+        bas, hauteur, largeur_barre = 162, 60, 13
+        for i, effectif in enumerate(effectifs.tolist()):
+            h = int(hauteur * effectif / max(effectifs.max(), 1))
+            couleur = (120, 200, 120) if (i + 1) * DUREE_CLASSE <= BUDGET_IMAGE else (230, 120, 80)
+            pygame.draw.rect(self.panneau, couleur, (8 + i * largeur_barre, bas - h, largeur_barre - 2, h))
+        x_budget = 8 + BUDGET_IMAGE / DUREE_CLASSE * largeur_barre
+        pygame.draw.line(self.panneau, (255, 255, 255), (x_budget, bas - hauteur), (x_budget, bas), 1)
+
+        ecran.blit(self.panneau, (ecran.get_width() - self.panneau.get_width() - 10, 10))
+
+    def ecrire_trace(self, chemin=None):
+        """Écrit les phases mesurées au format Chrome trace (événements complets « X », en µs)"""
+        chemin = chemin or self.chemin_trace
+        evenements = [{
+            "name": nom, "cat": "image" if nom == "image" else "phase", "ph": "X",
+            "ts": (debut - self.origine) * 1e6, "dur": (fin - debut) * 1e6,
+            "pid": self.pid, "tid": self.tid,
+        } for nom, debut, fin in self.evenements]
+        with open(chemin, "w", encoding="utf-8") as fichier:
+            json.dump({"traceEvents": evenements, "displayTimeUnit": "ms",
+                       "otherData": {"simulation": type(self.simulation).__name__}}, fichier)
+        return len(evenements)
+
+    def fermer(self):
+        """Écrit la trace demandée par tracer(), s'il y en a une"""
+        if self.chemin_trace is not None:
+            self.ecrire_trace()
+            self.chemin_trace = None
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Pas de simulation exact pour la course d'Achille et la Tortue
+Partagé par la version console et les versions Pygame
+"""
+
+
+def instant_rattrapage(position_achille, position_tortue, vitesse_achille, vitesse_tortue):
+    """
+    Durée avant qu'Achille rejoigne la tortue.
+    Retourne 0.0 s'il l'a déjà rejointe, None s'il ne la rejoindra jamais.
+    """
+    avance = position_tortue - position_achille
+    if avance <= 0:
+        return 0.0
+
+    difference = vitesse_achille - vitesse_tortue
+    if difference <= 0:
+        return None
+
+    return avance / difference
+
+
+def pas_rattrapage(position_achille, position_tortue, vitesse_achille, vitesse_tortue, dt):
+    """
+    Avance la course d'un pas dt, en s'arrêtant exactement à la rencontre
+    si elle a lieu pendant ce pas (au lieu de laisser Achille dépasser).
+
+    Retourne (position_achille, position_tortue, duree, rattrape) où duree
+    est le temps réellement écoulé (dt ou l'instant de la rencontre).
+    """
+    duree_rencontre = instant_rattrapage(position_achille, position_tortue,
+                                         vitesse_achille, vitesse_tortue)
+
+    if duree_rencontre is not None and duree_rencontre <= dt:
+        # Les deux coureurs sont exactement au même endroit
+        rencontre = position_tortue + vitesse_tortue * duree_rencontre
+        return rencontre, rencontre, duree_rencontre, True
+
+    return (position_achille + vitesse_achille * dt,
+            position_tortue + vitesse_tortue * dt,
+            dt, False)
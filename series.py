@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Sommation et accélération de convergence des séries
+Sommes partielles d'un générateur de termes, estimations accélérées
+(Aitken Δ², Shanks, Richardson) et nombre de termes nécessaires à chacune
+"""
+
+from itertools import islice
+
+import numpy as np
+
+
+def termes_geometriques(premier, raison):
+    """Termes premier, premier*raison, premier*raison², ..."""
+    terme = premier
+    while True:
+        yield terme
+        terme *= raison
+
+
+def termes_zenon_achille(avance=100.0, vitesse_achille=10.0, vitesse_tortue=1.0):
+    """Durées des étapes de Zénon: Achille rejoint l'ancienne position de la tortue"""
+    return termes_geometriques(avance / vitesse_achille, vitesse_tortue / vitesse_achille)
+
+
+def termes_puissance(p=2.0):
+    """Termes 1/n^p (n >= 1): série de Riemann, converge lentement pour p proche de 1"""
+    n = 1
+    while True:
+        yield 1.0 / n ** p
+        n += 1
+
+
+def sommes_partielles(termes, tolerance=1e-12, termes_max=10**6, taille_lot=65536):
+    """
+    Trajectoire des sommes partielles S_1, S_2, ... (tableau NumPy).
+    S'arrête quand un terme devient inférieur à tolerance * |S_n|
+    ou après termes_max termes.
+    """
+    termes = iter(termes)
+    morceaux = []
+    total = 0.0
+    nombre = 0
+
+    while nombre < termes_max:
+        lot = np.fromiter(islice(termes, min(taille_lot, termes_max - nombre)), dtype=np.float64)
+        if lot.size == 0:
+            break
+
+        sommes = np.cumsum(lot) + total
+        petits = np.flatnonzero(np.abs(lot) < tolerance * np.maximum(np.abs(sommes), 1e-300))
+        if petits.size:
+            morceaux.append(sommes[:petits[0] + 1])
+            break
+
+        morceaux.append(sommes)
+        total = sommes[-1]
+        nombre += lot.size
+        taille_lot *= 2
+
+    return np.concatenate(morceaux) if morceaux else np.zeros(0)
+
+
+def aitken(sommes):
+    """
+    Transformée Δ² d'Aitken: A_n = S_n - (ΔS_n)² / Δ²S_n.
+    A_n utilise S_n, S_n+1 et S_n+2 (tableau plus court de 2).
+    """
+    sommes = np.asarray(sommes, dtype=np.float64)
+    if sommes.size < 3:
+        return np.zeros(0)
+    d1 = sommes[1:-1] - sommes[:-2]
+    d2 = sommes[2:] - 2 * sommes[1:-1] + sommes[:-2]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        estimation = sommes[:-2] - d1 * d1 / d2
+    # Différences nulles: la suite est déjà stationnaire
+    return np.where(np.isfinite(estimation) & (d2 != 0), estimation, sommes[2:])
+
+
+def shanks(sommes, ordre=2):
+    """
+    Transformée de Shanks e_ordre(S) calculée par l'algorithme epsilon de Wynn.
+    La valeur n utilise S_n ... S_n+2*ordre (tableau plus court de 2*ordre).
+    e_1 est la transformée d'Aitken.
+    """
+    precedent = np.zeros(len(sommes) + 1)
+    actuel = np.asarray(sommes, dtype=np.float64)
+
+    for k in range(2 * ordre):
+        if actuel.size < 2:
+            return np.zeros(0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            difference = actuel[1:] - actuel[:-1]
+            # inf - inf: la colonne précédente a divergé, son inverse est nul
+            difference[np.isnan(difference)] = np.inf
+            suivant = precedent[1:actuel.size] + 1.0 / difference
+        precedent, actuel = actuel, suivant
+
+    # Colonne restée infinie: la suite avait déjà convergé
+    repli = np.asarray(sommes, dtype=np.float64)[2 * ordre:]
+    return np.where(np.isfinite(actuel), actuel, repli)
+
+
+def richardson(sommes, p=1.0):
+    """
+    Extrapolation de Richardson pour un reste en C/n^p:
+    R_n = (2^p S_2n - S_n) / (2^p - 1), qui utilise 2n termes.
+    La valeur d'indice i correspond à n = i + 1.
+    """
+    sommes = np.asarray(sommes, dtype=np.float64)
+    n = np.arange(1, sommes.size // 2 + 1)
+    facteur = 2.0 ** p
+    return (facteur * sommes[2 * n - 1] - sommes[n - 1]) / (facteur - 1)
+
+
+def _premier_sous_tolerance(estimations, tolerance, limite, termes_par_indice):
+    """Nombre de termes nécessaires pour qu'une estimation soit à tolerance près"""
+    if estimations.size == 0:
+        return None, None
+    if limite is not None:
+        ecarts = np.abs(estimations - limite)
+    else:
+        ecarts = np.abs(np.diff(estimations, prepend=np.inf))
+    bons = np.flatnonzero(ecarts < tolerance)
+    if bons.size == 0:
+        return None, estimations[-1]
+    i = bons[0]
+    return int(termes_par_indice(i)), estimations[i]
+
+
+def rapport_cout(termes, tolerance=1e-8, limite=None, termes_max=10**6, p_richardson=1.0):
+    """
+    Nombre de termes dont chaque méthode a besoin pour atteindre tolerance
+    (écart à limite si elle est connue, sinon écart entre deux estimations).
+
+    Retourne un dictionnaire méthode -> (termes nécessaires ou None, estimation).
+    """
+    # Au-delà de eps/4 les termes ne changent plus la somme flottante
+    sommes = sommes_partielles(termes, tolerance=np.finfo(np.float64).eps / 4, termes_max=termes_max)
+    return {
+        'somme directe': _premier_sous_tolerance(sommes, tolerance, limite, lambda i: i + 1),
+        'Aitken Δ²': _premier_sous_tolerance(aitken(sommes), tolerance, limite, lambda i: i + 3),
+        'Shanks e2': _premier_sous_tolerance(shanks(sommes, 2), tolerance, limite, lambda i: i + 5),
+        'Richardson': _premier_sous_tolerance(richardson(sommes, p_richardson), tolerance, limite,
+                                              lambda i: 2 * (i + 1)),
+    }
+
+
+def afficher_rapport(rapport, titre="Coût des méthodes de sommation"):
+    print(f"\n{titre}:")
+    print(f"{'Méthode':>14} | {'Termes':>9} | {'Estimation':>18}")
+    print("-" * 47)
+    for methode, (termes, estimation) in rapport.items():
+        termes = f"{termes:9d}" if termes is not None else f"{'> max':>9}"
+        estimation = f"{estimation:18.12f}" if estimation is not None else f"{'-':>18}"
+        print(f"{methode:>14} | {termes} | {estimation}")
+
+
+if __name__ == "__main__":
+    afficher_rapport(rapport_cout(termes_geometriques(4.0, 0.5), 1e-10, limite=8.0),
+                     "Dichotomie: 4 + 2 + 1 + ... = 8")
+    afficher_rapport(rapport_cout(termes_geometriques(4.0, 0.999), 1e-8, limite=4000.0),
+                     "Raison proche de 1: 4 + 3.996 + ... = 4000")
+    afficher_rapport(rapport_cout(termes_puissance(2), 1e-8, limite=np.pi ** 2 / 6),
+                     "Série de Riemann: 1 + 1/4 + 1/9 + ... = π²/6")
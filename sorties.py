@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Sorties pour les simulations console des paradoxes de Zénon
+Chaque sortie consomme un générateur d'étapes et l'écrit par lots
+"""
+
+import csv
+import json
+import sys
+import time
+from itertools import islice
+
+
+class Sortie:
+    """Classe de base: écrit les enregistrements par lots dans un flux"""
+
+    def __init__(self, flux=None, taille_lot=4096):
+        self.flux = flux if flux is not None else sys.stdout
+        self.taille_lot = taille_lot
+
+    def entete(self, enregistrement):
+        """Texte écrit avant le premier enregistrement (aucun par défaut)"""
+        return ""
+
+    def formater(self, enregistrement):
+        """Convertit un enregistrement en texte (avec retour à la ligne)"""
+        raise NotImplementedError
+
+    def ecrire(self, enregistrements):
+        """Écrit tous les enregistrements et retourne leur nombre"""
+        enregistrements = iter(enregistrements)
+        nombre = 0
+
+        while True:
+            lot = list(islice(enregistrements, self.taille_lot))
+            if not lot:
+                break
+            if nombre == 0:
+                self.flux.write(self.entete(lot[0]))
+            self.flux.write("".join(map(self.formater, lot)))
+            self.flux.flush()  # Chaque lot est visible dès qu'il est écrit
+            nombre += len(lot)
+
+        return nombre
+
+
+class SortieTamponnee(Sortie):
+    """Affichage terminal sans pause, écrit par gros blocs"""
+
+    def __init__(self, format_ligne, flux=None, taille_lot=4096):
+        super().__init__(flux, taille_lot)
+        self.format_ligne = format_ligne
+
+    def formater(self, enregistrement):
+        return self.format_ligne(enregistrement) + "\n"
+
+
+class SortieTerminale(SortieTamponnee):
+    """Affichage terminal rythmé: une ligne puis une pause, pour la lecture en classe"""
+
+    def __init__(self, format_ligne, pause=0.1, flux=None):
+        super().__init__(format_ligne, flux, taille_lot=1)
+        self.pause = pause
+
+    def ecrire(self, enregistrements):
+        nombre = 0
+        for enregistrement in enregistrements:
+            self.flux.write(self.formater(enregistrement))
+            self.flux.flush()
+            nombre += 1
+            if self.pause > 0:
+                time.sleep(self.pause)
+        return nombre
+
+
+class SortieCSV(Sortie):
+    """Écriture CSV, une colonne par clé d'enregistrement"""
+
+    def __init__(self, flux=None, taille_lot=4096, colonnes=None):
+        super().__init__(flux, taille_lot)
+        self.colonnes = colonnes
+
+    def ecrire(self, enregistrements):
+        enregistrements = iter(enregistrements)
+        premier = next(enregistrements, None)
+        if premier is None:
+            return 0
+
+        colonnes = self.colonnes or list(premier)
+        writer = csv.writer(self.flux, lineterminator="\n")
+        writer.writerow(colonnes)
+        writer.writerow([premier[c] for c in colonnes])
+        nombre = 1
+
+        while True:
+            lot = list(islice(enregistrements, self.taille_lot))
+            if not lot:
+                break
+            writer.writerows([e[c] for c in colonnes] for e in lot)
+            self.flux.flush()
+            nombre += len(lot)
+
+        self.flux.flush()
+        return nombre
+
+
+class SortieJSONL(Sortie):
+    """Écriture JSON Lines, un objet par ligne"""
+
+    def __init__(self, flux=None, taille_lot=4096):
+        super().__init__(flux, taille_lot)
+        self.encodeur = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+    def formater(self, enregistrement):
+        return self.encodeur.encode(enregistrement) + "\n"
+
+
+def choisir_sortie(format_ligne, pause=0.0, flux=None):
+    """Sortie terminal rythmée si pause > 0, sinon tamponnée"""
+    if pause > 0:
+        return SortieTerminale(format_ligne, pause, flux)
+    return SortieTamponnee(format_ligne, flux)